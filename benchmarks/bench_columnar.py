@@ -0,0 +1,68 @@
+"""Export of profiles to Parquet against flattening them row by row
+
+`rows` flattens every profile into a dict of dotted columns in Python, as
+a row by row export to a data frame does, keeping nested lists as JSON.
+`parquet` writes the profiles with `proxycurl.columnar.ParquetSink`, which
+has Arrow convert every row group in one pass, nested lists included.
+
+    python benchmarks/bench_columnar.py [--profiles 20000] [--row-group 5000]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from payloads import person_profile  # noqa: E402
+from proxycurl.columnar import ParquetSink  # noqa: E402
+from proxycurl.models import PersonEndpointResponse  # noqa: E402
+
+# distinct profiles written in turn
+DISTINCT_PROFILES = 200
+
+
+def flatten(value, prefix: str = '', row: dict = None) -> dict:
+    row = {} if row is None else row
+    for key, item in value.items():
+        if isinstance(item, dict):
+            flatten(item, f'{prefix}{key}.', row)
+        elif isinstance(item, list):
+            row[f'{prefix}{key}'] = json.dumps(item)
+        else:
+            row[f'{prefix}{key}'] = item
+    return row
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--profiles', type=int, default=20000)
+    parser.add_argument('--row-group', type=int, default=5000)
+    args = parser.parse_args()
+
+    profiles = [person_profile(seed) for seed in range(DISTINCT_PROFILES)]
+    print(f'{args.profiles} profiles')
+    print(f'{"export":<8}  {"us/profile":>10}  {"total s":>8}')
+
+    start = time.perf_counter()
+    rows = [flatten(profiles[i % DISTINCT_PROFILES]) for i in range(args.profiles)]
+    seconds = time.perf_counter() - start
+    del rows
+    print(f'{"rows":<8}  {seconds / args.profiles * 1e6:>10.1f}  {seconds:>8.2f}')
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'profiles.parquet')
+        start = time.perf_counter()
+        with ParquetSink(path, PersonEndpointResponse, row_group_size=args.row_group) as sink:
+            for i in range(args.profiles):
+                sink.write(profiles[i % DISTINCT_PROFILES])
+        seconds = time.perf_counter() - start
+        size = os.path.getsize(path)
+    print(f'{"parquet":<8}  {seconds / args.profiles * 1e6:>10.1f}  {seconds:>8.2f}  ({size / 2 ** 20:.1f} MB file)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Memory held by the failed results of a bulk job
+
+Every operation fails with a 404 raised a few calls deep, as in `request`,
+and its result is kept as `do_bulk` does. `exception` keeps the exception,
+its traceback and the frames it references, as `keep_exceptions=True` does,
+`record` a `proxycurl.results.ResultError`, the default.
+
+    python benchmarks/bench_errors.py [--failures 100000]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from proxycurl.asyncio.base import ProxycurlException, Result  # noqa: E402
+from proxycurl.results import ResultError  # noqa: E402
+
+BODY = b'{"code":404,"description":"Person not found","name":"Not Found"}'
+
+
+def request(url: str, params: dict):
+    response_result = bytearray(BODY)
+    status = 404
+    raise ProxycurlException(response_result.decode('utf-8'), status_code=status, endpoint=url)
+
+
+def operation(url: str, **params):
+    return request(url, params)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--failures', type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f'{args.failures} failed results')
+    print(f'{"error":<9}  {"us/result":>9}  {"bytes/result":>12}  {"MB total":>8}')
+    for name, keep in (('exception', True), ('record', False)):
+        tracemalloc.start()
+        start = time.perf_counter()
+        results = [None] * args.failures
+        for index in range(args.failures):
+            try:
+                operation('/proxycurl/api/v2/linkedin', linkedin_profile_url=f'https://www.linkedin.com/in/{index}')
+            except Exception as e:
+                results[index] = Result(False, None, e if keep else ResultError.from_exception(e))
+        seconds = time.perf_counter() - start
+        held = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del results
+        print(
+            f'{name:<9}  {seconds / args.failures * 1e6:>9.2f}  {held / args.failures:>12.0f}  '
+            f'{held / 2 ** 20:>8.1f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
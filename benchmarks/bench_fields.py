@@ -0,0 +1,62 @@
+"""Decode time and memory of responses projected to a few fields
+
+`full` decodes every field, as a client does without `fields`. `fields`
+decodes the five fields of `FIELDS` through `proxycurl.projection`, which
+skips the rest of the body without building it when msgspec is installed.
+
+    python benchmarks/bench_fields.py [--profiles 100000] [--retain 2000]
+"""
+import argparse
+import itertools
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from payloads import person_profiles  # noqa: E402
+from proxycurl.codec import get_codec  # noqa: E402
+from proxycurl.projection import get_projection  # noqa: E402
+
+FIELDS = ['full_name', 'headline', 'city', 'experiences.*.company', 'experiences.*.title']
+
+# distinct payloads decoded in turn
+DISTINCT_PROFILES = 200
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--profiles', type=int, default=100000)
+    parser.add_argument('--retain', type=int, default=2000, help='profiles kept in memory to measure their size')
+    args = parser.parse_args()
+
+    payloads = person_profiles(DISTINCT_PROFILES)
+    codec = get_codec()
+    projection = get_projection(FIELDS)
+    print(f'{args.profiles} profiles, codec: {codec.name}, fields: {", ".join(FIELDS)}')
+    print(f'{"decode":<8}  {"us/profile":>10}  {"total s":>8}  {"KB/profile":>10}')
+    for name, decode in (
+        ('full', codec.loads),
+        ('fields', projection.decode),
+    ):
+        start = time.perf_counter()
+        for payload in itertools.islice(itertools.cycle(payloads), args.profiles):
+            decode(payload)
+        seconds = time.perf_counter() - start
+
+        tracemalloc.start()
+        retained = [decode(payload) for payload in itertools.islice(itertools.cycle(payloads), args.retain)]
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del retained
+
+        print(
+            f'{name:<8}  {seconds / args.profiles * 1e6:>10.1f}  {seconds:>8.1f}  '
+            f'{memory / args.retain / 1024:>10.1f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
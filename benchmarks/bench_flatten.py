@@ -0,0 +1,97 @@
+"""Export of profiles to CSV with a recursive flattener against the compiled one
+
+`recursive` flattens every profile into a dict of dotted columns by walking
+its values, keeping lists as JSON or exploding `experiences` into a row per
+experience, and writes the rows with `csv.DictWriter`, as ad hoc exports do.
+`compiled` flattens the profiles with `proxycurl.flatten.Flattener`, whose
+rows are built by a function compiled from the model, and writes them with
+`proxycurl.flatten.CsvSink`. Flattening is timed apart from writing the CSV.
+
+    python benchmarks/bench_flatten.py [--profiles 5000]
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from payloads import person_profile  # noqa: E402
+from proxycurl.flatten import CsvSink, Flattener  # noqa: E402
+from proxycurl.models import PersonEndpointResponse  # noqa: E402
+
+# distinct profiles written in turn
+DISTINCT_PROFILES = 200
+
+
+def flatten(value, prefix: str = '', row: dict = None, explode: str = None) -> list:
+    row = {} if row is None else row
+    exploded = []
+    for key, item in value.items():
+        if isinstance(item, dict):
+            flatten(item, f'{prefix}{key}.', row)
+        elif isinstance(item, list):
+            if key == explode:
+                exploded = item
+            elif item and all(isinstance(element, str) for element in item):
+                row[f'{prefix}{key}'] = '; '.join(item)
+            else:
+                row[f'{prefix}{key}'] = json.dumps(item)
+        else:
+            row[f'{prefix}{key}'] = item
+    if explode is None:
+        return [row]
+    return [flatten(item, f'{explode}.', dict(row))[0] for item in exploded] or [row]
+
+
+def recursive_rows(profiles: list, explode: str = None) -> list:
+    return [row for profile in profiles for row in flatten(profile, explode=explode)]
+
+
+def recursive_csv(profiles: list, explode: str = None) -> None:
+    rows = recursive_rows(profiles, explode)
+    # the columns are only known once every row is flattened
+    columns = list(dict.fromkeys(column for row in rows for column in row))
+    writer = csv.DictWriter(io.StringIO(), columns)
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def compiled_rows(profiles: list, explode: str = None) -> list:
+    return list(Flattener(PersonEndpointResponse, explode).flatten(profiles))
+
+
+def compiled_csv(profiles: list, explode: str = None) -> None:
+    with CsvSink(io.StringIO(), PersonEndpointResponse, explode=explode) as sink:
+        for profile in profiles:
+            sink.write(profile)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--profiles', type=int, default=5000)
+    args = parser.parse_args()
+
+    distinct = [person_profile(seed) for seed in range(DISTINCT_PROFILES)]
+    profiles = [distinct[i % DISTINCT_PROFILES] for i in range(args.profiles)]
+    print(f'{args.profiles} profiles')
+    print(f'{"flattener":<10}  {"rows":<11}  {"us/profile":>10}  {"with CSV":>8}')
+    for explode, rows in ((None, 'per person'), ('experiences', 'per job')):
+        for name, flatten_rows, export in (
+            ('recursive', recursive_rows, recursive_csv),
+            ('compiled', compiled_rows, compiled_csv),
+        ):
+            timings = []
+            for run in (flatten_rows, export):
+                start = time.perf_counter()
+                run(profiles, explode)
+                timings.append((time.perf_counter() - start) / args.profiles * 1e6)
+            print(f'{name:<10}  {rows:<11}  {timings[0]:>10.1f}  {timings[1]:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
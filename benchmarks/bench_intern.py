@@ -0,0 +1,62 @@
+"""Memory held by decoded profiles with and without interning
+
+Every profile is decoded from its own payload and kept, as the results of a
+bulk job are. `interned` interns the low-cardinality fields of each profile
+after decoding it, as clients created with `intern=True` do, so that equal
+countries, companies, schools, etc. share one string.
+
+    python benchmarks/bench_intern.py [--profiles 5000]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from payloads import person_profiles  # noqa: E402
+from proxycurl.codec import get_codec  # noqa: E402
+from proxycurl.interning import InternTable, intern_response  # noqa: E402
+from proxycurl.models import PersonEndpointResponse  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--profiles', type=int, default=5000)
+    args = parser.parse_args()
+
+    payloads = person_profiles(args.profiles)
+    codec = get_codec()
+    print(f'{args.profiles} profiles')
+    print(f'{"results":<9}  {"us/profile":>10}  {"KB/profile":>10}  {"MB total":>8}')
+    for name, interned in (('plain', False), ('interned', True)):
+        def decode_all() -> list:
+            table = InternTable()
+            results = []
+            for payload in payloads:
+                result = codec.loads(payload)
+                if interned:
+                    intern_response(PersonEndpointResponse, result, table)
+                results.append(result)
+            # the shared values are counted, they are held by the table
+            return [results, table]
+
+        start = time.perf_counter()
+        decode_all()
+        seconds = time.perf_counter() - start
+
+        tracemalloc.start()
+        results = decode_all()
+        held = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del results
+        print(
+            f'{name:<9}  {seconds / args.profiles * 1e6:>10.1f}  '
+            f'{held / args.profiles / 1024:>10.1f}  {held / 2 ** 20:>8.1f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""Decode speed of the JSON codecs on person profiles
+
+    python benchmarks/bench_json.py [--profiles 200] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from payloads import person_profiles  # noqa: E402
+from proxycurl.codec import CODECS, get_codec  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--profiles', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    payloads = person_profiles(args.profiles)
+    size = sum(len(payload) for payload in payloads)
+    print(f'{args.profiles} profiles, {size / args.profiles / 1024:.1f} KB each, default codec: {get_codec().name}')
+    print(f'{"codec":<8}  {"us/profile":>10}  {"MB/s":>8}')
+    for name in CODECS:
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            print(f'{name:<8}  {"not installed":>20}')
+            continue
+        loads = codec.loads
+        seconds = min(timeit.repeat(
+            lambda: [loads(payload) for payload in payloads],
+            number=1,
+            repeat=args.repeat
+        ))
+        print(f'{name:<8}  {seconds / args.profiles * 1e6:>10.1f}  {size / seconds / 1e6:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
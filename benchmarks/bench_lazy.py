@@ -0,0 +1,78 @@
+"""Memory and CPU of lazy responses against fully decoded ones
+
+Every profile is decoded and a few fields are read from it, as a consumer
+only interested in those fields would.
+
+    python benchmarks/bench_lazy.py [--profiles 2000]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from payloads import person_profiles  # noqa: E402
+from proxycurl.codec import get_codec  # noqa: E402
+from proxycurl.lazy import LazyResponse, msgspec  # noqa: E402
+
+
+def read_headline(profile) -> None:
+    profile['full_name']
+    profile['headline']
+
+
+def read_experience(profile) -> None:
+    profile['full_name']
+    profile['headline']
+    profile['experiences'][0]
+
+
+def measure(payloads, decode, read_fields):
+    seconds = float('inf')
+    for _ in range(5):
+        start = time.perf_counter()
+        for payload in payloads:
+            read_fields(decode(payload))
+        seconds = min(seconds, time.perf_counter() - start)
+
+    tracemalloc.start()
+    profiles = []
+    for payload in payloads:
+        # a fresh copy of the body, as read from the network, which a lazy response keeps
+        profile = decode(b' ' + payload)
+        read_fields(profile)
+        profiles.append(profile)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return seconds, memory
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--profiles', type=int, default=2000)
+    args = parser.parse_args()
+
+    payloads = person_profiles(args.profiles)
+    codec = get_codec()
+    print(f'{args.profiles} profiles, codec: {codec.name}, msgspec: {"yes" if msgspec else "no"}')
+    print(f'{"fields read":<32}  {"mode":<6}  {"us/profile":>10}  {"KB/profile":>10}')
+    for fields, read_fields in (
+        ('full_name, headline', read_headline),
+        ('full_name, headline, experiences', read_experience),
+    ):
+        for name, decode in (
+            ('eager', codec.loads),
+            ('lazy', lambda payload: LazyResponse(payload, codec)),
+        ):
+            seconds, memory = measure(payloads, decode, read_fields)
+            print(
+                f'{fields:<32}  {name:<6}  {seconds / args.profiles * 1e6:>10.1f}  '
+                f'{memory / args.profiles / 1024:>10.1f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
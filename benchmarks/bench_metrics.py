@@ -0,0 +1,83 @@
+"""Overhead of timing requests with a `proxycurl.metrics.HistogramCollector` or tracing them
+
+`event` times the instrumentation of one attempt alone: its `AttemptEvent`
+and the histograms it is recorded into. The other rows run a `do_bulk` job
+of requests to a local server without a hook, with a collector, and with a
+`proxycurl.tracing.TracingHook` exporting to memory.
+
+    python benchmarks/bench_metrics.py [--events 200000] [--requests 2000] [--workers 20]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from proxycurl.asyncio import Proxycurl, do_bulk  # noqa: E402
+from proxycurl.metrics import AttemptEvent, HistogramCollector  # noqa: E402
+from proxycurl.tracing import InMemoryExporter, Tracer, TracingHook  # noqa: E402
+
+from payloads import person_profiles  # noqa: E402
+
+
+def bench_events(events: int) -> float:
+    collector = HistogramCollector()
+    start = time.perf_counter()
+    for attempt in range(events):
+        event = AttemptEvent('GET', '/proxycurl/api/v2/linkedin', 1)
+        event.key_acquired()
+        event.connection_started()
+        event.connection_made()
+        event.headers_received(200)
+        event.body_received(10000)
+        collector.on_attempt(event.finish())
+    return (time.perf_counter() - start) / events
+
+
+async def bench_requests(requests: int, workers: int, metrics) -> float:
+    body, = person_profiles(1)
+
+    async def handler(request):
+        return web.Response(body=body, content_type='application/json')
+
+    app = web.Application()
+    app.router.add_get('/proxycurl/api/v2/linkedin', handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    proxycurl = Proxycurl(
+        api_key='key', base_url=f'http://127.0.0.1:{runner.addresses[0][1]}', rate_limit=0, metrics=metrics
+    )
+    ops = [
+        (proxycurl.linkedin.person.get, {'linkedin_profile_url': f'https://www.linkedin.com/in/{index}'})
+        for index in range(requests)
+    ]
+    try:
+        start = time.perf_counter()
+        await do_bulk(ops, max_workers=workers)
+        return (time.perf_counter() - start) / requests
+    finally:
+        await runner.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--events', type=int, default=200000)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--workers', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f'event      {bench_events(args.events) * 1e6:>8.2f} us/attempt')
+    hooks = (('none', None), ('collector', HistogramCollector()), ('tracing', TracingHook(Tracer(InMemoryExporter()))))
+    for name, metrics in hooks:
+        seconds = asyncio.run(bench_requests(args.requests, args.workers, metrics))
+        print(f'{name:<10} {seconds * 1e6:>8.1f} us/request')
+
+
+if __name__ == '__main__':
+    main()
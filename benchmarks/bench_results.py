@@ -0,0 +1,65 @@
+"""Cost of building results from decoded responses
+
+`copy` is how results used to be built, `PersonEndpointResponse(**response)`:
+a TypedDict is a plain dict at runtime, so this only makes a second shallow
+copy of every response. `zero-copy` returns the decoded dict as is, and
+`validated` checks it against its model first, as clients created with
+`validate=True` do. Responses are decoded beforehand so only building the
+result is measured.
+
+    python benchmarks/bench_results.py [--profiles 100000] [--retain 2000]
+"""
+import argparse
+import itertools
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from payloads import person_profiles  # noqa: E402
+from proxycurl.codec import get_codec  # noqa: E402
+from proxycurl.models import PersonEndpointResponse  # noqa: E402
+from proxycurl.validation import validate_response  # noqa: E402
+
+# distinct payloads decoded in turn
+DISTINCT_PROFILES = 200
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--profiles', type=int, default=100000)
+    parser.add_argument('--retain', type=int, default=2000, help='results kept in memory to measure their allocations')
+    args = parser.parse_args()
+
+    codec = get_codec()
+    responses = [codec.loads(payload) for payload in person_profiles(DISTINCT_PROFILES)]
+    print(f'{args.profiles} profiles')
+    print(f'{"result":<10}  {"us/profile":>10}  {"total s":>8}  {"bytes/profile":>13}  {"MB total":>8}')
+    for name, build in (
+        ('copy', lambda response: PersonEndpointResponse(**response)),
+        ('zero-copy', lambda response: response),
+        ('validated', lambda response: validate_response(PersonEndpointResponse, response)),
+    ):
+        start = time.perf_counter()
+        for response in itertools.islice(itertools.cycle(responses), args.profiles):
+            build(response)
+        seconds = time.perf_counter() - start
+
+        # keep the results alive so that the memory they allocated is still traced
+        tracemalloc.start()
+        retained = [build(response) for response in itertools.islice(itertools.cycle(responses), args.retain)]
+        allocated = max(0, tracemalloc.get_traced_memory()[0] - sys.getsizeof(retained)) / args.retain
+        tracemalloc.stop()
+        del retained
+
+        print(
+            f'{name:<10}  {seconds / args.profiles * 1e6:>10.2f}  {seconds:>8.2f}  '
+            f'{allocated:>13.0f}  {allocated * args.profiles / 2 ** 20:>8.1f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Memory held by the results of a bulk job, in a list against a spilling store
+
+Every profile is decoded from its own payload and stored as the result of
+its operation, as `do_bulk` does, then every result is read back once.
+`list` is the default of `do_bulk`, `spilling` a
+`proxycurl.results.SpillingResultStore` keeping up to `--max-memory` MB of
+results in memory and the rest in a temporary SQLite database. Times are
+taken while tracing allocations, so they are only comparable to each other.
+
+    python benchmarks/bench_store.py [--profiles 5000] [--max-memory 32]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from payloads import person_profiles  # noqa: E402
+from proxycurl.asyncio.base import Result  # noqa: E402
+from proxycurl.codec import get_codec  # noqa: E402
+from proxycurl.results import ResultStore, SpillingResultStore  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--profiles', type=int, default=5000)
+    parser.add_argument('--max-memory', type=int, default=32, help='MB of results kept in memory by the store')
+    args = parser.parse_args()
+
+    payloads = person_profiles(args.profiles)
+    codec = get_codec()
+    print(f'{args.profiles} profiles')
+    print(f'{"results":<9}  {"store us":>8}  {"read us":>7}  {"peak MB":>7}')
+    for name, store in (
+        ('list', ResultStore()),
+        ('spilling', SpillingResultStore(max_memory=args.max_memory * 2 ** 20)),
+    ):
+        with store:
+            tracemalloc.start()
+            store.allocate(args.profiles, Result)
+            start = time.perf_counter()
+            for i, payload in enumerate(payloads):
+                store[i] = Result(True, codec.loads(payload), None)
+            stored = time.perf_counter() - start
+            start = time.perf_counter()
+            for result in store:
+                result.value.get('full_name')
+            read = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        print(
+            f'{name:<9}  {stored / args.profiles * 1e6:>8.1f}  {read / args.profiles * 1e6:>7.1f}  '
+            f'{peak / 2 ** 20:>7.1f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Peak memory of a large page parsed incrementally against decoded in full
+
+`full` buffers the body and decodes it, as a page is read without `stream`.
+`stream` feeds the body to `proxycurl.streaming.PageStream` in chunks and
+drops every employee once parsed, as a consumer of a streamed `_iter` does.
+
+    python benchmarks/bench_stream.py [--employees 100]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from payloads import employee_page  # noqa: E402
+from proxycurl.codec import get_codec  # noqa: E402
+from proxycurl.streaming import CHUNK_SIZE, PageStream  # noqa: E402
+
+
+def full(body: bytes, codec) -> int:
+    # the body is buffered in full before it is decoded
+    buffered = b''.join(body[i:i + CHUNK_SIZE] for i in range(0, len(body), CHUNK_SIZE))
+    return len(codec.loads(buffered)['employees'])
+
+
+def stream(body: bytes, codec) -> int:
+    page = PageStream('employees', codec)
+    for i in range(0, len(body), CHUNK_SIZE):
+        for employee in page.feed(body[i:i + CHUNK_SIZE]):
+            pass
+    page.close()
+    return page.items
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--employees', type=int, default=100)
+    args = parser.parse_args()
+
+    body = employee_page(args.employees)
+    codec = get_codec()
+    print(f'page of {args.employees} employees, {len(body) / 2 ** 20:.1f} MB, codec: {codec.name}')
+    print(f'{"parse":<8}  {"ms":>8}  {"peak MB":>8}')
+    for name, parse in (('full', full), ('stream', stream)):
+        start = time.perf_counter()
+        parse(body, codec)
+        seconds = time.perf_counter() - start
+
+        tracemalloc.start()
+        parse(body, codec)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        print(f'{name:<8}  {seconds * 1e3:>8.1f}  {peak / 2 ** 20:>8.2f}')
+
+
+if __name__ == '__main__':
+    main()
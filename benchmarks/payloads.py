@@ -0,0 +1,145 @@
+"""Synthetic API responses shaped like real ones, for the benchmarks"""
+import json
+import random
+from typing import Dict, List
+
+WORDS = (
+    'data platform engineering team lead product growth strategy cloud scale '
+    'customers revenue design research machine learning infrastructure global '
+    'operations marketing sales analytics mobile security open source startup'
+).split()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize() + '.'
+
+
+def _date(rng: random.Random) -> Dict:
+    return {'day': rng.randint(1, 28), 'month': rng.randint(1, 12), 'year': rng.randint(1990, 2023)}
+
+
+def _company(rng: random.Random) -> str:
+    return f'{rng.choice(WORDS).title()} {rng.choice(WORDS).title()} Inc'
+
+
+def person_profile(seed: int = 0) -> Dict:
+    """A `PersonEndpointResponse` of a senior profile, about 40 KB of JSON"""
+    rng = random.Random(seed)
+    identifier = f'member-{seed}'
+    return {
+        'public_identifier': identifier,
+        'profile_pic_url': f'https://media.example.com/{identifier}/profile.jpg',
+        'background_cover_image_url': f'https://media.example.com/{identifier}/cover.jpg',
+        'first_name': 'Member',
+        'last_name': str(seed),
+        'full_name': f'Member {seed}',
+        'follower_count': rng.randint(100, 100000),
+        'occupation': f'Director at {_company(rng)}',
+        'headline': _text(rng, 12),
+        'summary': _text(rng, 250),
+        'country': 'US',
+        'country_full_name': 'United States of America',
+        'city': 'San Francisco',
+        'state': 'California',
+        'experiences': [
+            {
+                'starts_at': _date(rng),
+                'ends_at': _date(rng) if i else None,
+                'company': _company(rng),
+                'company_linkedin_profile_url': f'https://www.linkedin.com/company/company-{rng.randint(1, 10 ** 6)}',
+                'title': _text(rng, 3),
+                'description': _text(rng, 120),
+                'location': 'San Francisco Bay Area',
+                'logo_url': f'https://media.example.com/logo/{rng.randint(1, 10 ** 6)}.png',
+            }
+            for i in range(12)
+        ],
+        'education': [
+            {
+                'starts_at': _date(rng),
+                'ends_at': _date(rng),
+                'field_of_study': _text(rng, 2),
+                'degree_name': 'Bachelor of Science',
+                'school': f'University of {rng.choice(WORDS).title()}',
+                'school_linkedin_profile_url': None,
+                'description': _text(rng, 30),
+                'logo_url': None,
+                'grade': None,
+                'activities_and_societies': _text(rng, 10),
+            }
+            for _ in range(3)
+        ],
+        'languages': ['English', 'Spanish', 'Mandarin'],
+        'accomplishment_organisations': [],
+        'accomplishment_publications': [
+            {'name': _text(rng, 8), 'publisher': _company(rng), 'published_on': _date(rng),
+             'description': _text(rng, 60), 'url': None}
+            for _ in range(4)
+        ],
+        'accomplishment_honors_awards': [],
+        'accomplishment_patents': [],
+        'accomplishment_courses': [],
+        'accomplishment_projects': [
+            {'starts_at': _date(rng), 'ends_at': None, 'title': _text(rng, 4),
+             'description': _text(rng, 60), 'url': None}
+            for _ in range(4)
+        ],
+        'accomplishment_test_scores': [],
+        'volunteer_work': [],
+        'certifications': [
+            {'starts_at': None, 'ends_at': None, 'name': _text(rng, 4), 'license_number': None,
+             'display_source': None, 'authority': _company(rng), 'url': None}
+            for _ in range(5)
+        ],
+        'connections': 500,
+        'people_also_viewed': [
+            {'link': f'https://www.linkedin.com/in/member-{rng.randint(1, 10 ** 6)}',
+             'name': f'Member {rng.randint(1, 10 ** 6)}', 'summary': _text(rng, 10), 'location': 'United States'}
+            for _ in range(10)
+        ],
+        'recommendations': [_text(rng, 80) for _ in range(5)],
+        'activities': [
+            {'title': _text(rng, 20), 'link': f'https://www.linkedin.com/posts/{rng.randint(1, 10 ** 9)}',
+             'activity_status': 'Liked by Member'}
+            for _ in range(20)
+        ],
+        'similarly_named_profiles': [
+            {'name': f'Member {rng.randint(1, 10 ** 6)}', 'link': f'https://www.linkedin.com/in/{rng.randint(1, 10 ** 6)}',
+             'summary': _text(rng, 8), 'location': 'United States'}
+            for _ in range(5)
+        ],
+        'articles': [],
+        'groups': [
+            {'profile_pic_url': None, 'name': _text(rng, 4), 'url': f'https://www.linkedin.com/groups/{rng.randint(1, 10 ** 6)}'}
+            for _ in range(8)
+        ],
+        'skills': [rng.choice(WORDS) for _ in range(40)],
+        'inferred_salary': None,
+        'gender': None,
+        'birth_date': None,
+        'industry': 'Computer Software',
+        'extra': None,
+        'interests': [rng.choice(WORDS) for _ in range(10)],
+        'personal_emails': [],
+        'personal_numbers': [],
+    }
+
+
+def person_profiles(count: int) -> List[bytes]:
+    """Encoded profiles, as read from the network"""
+    return [json.dumps(person_profile(seed)).encode() for seed in range(count)]
+
+
+def employee_page(count: int) -> bytes:
+    """An `EmployeeList` page of `count` employees with enriched profiles"""
+    return json.dumps({
+        'employees': [
+            {
+                'profile_url': f'https://www.linkedin.com/in/member-{seed}',
+                'profile': person_profile(seed),
+                'last_updated': '2023-05-01T00:00:00Z',
+            }
+            for seed in range(count)
+        ],
+        'next_page': 'https://nubela.co/proxycurl/api/linkedin/company/employees/?url=x&after=abc',
+    }).encode()
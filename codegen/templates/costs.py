@@ -0,0 +1,47 @@
+from typing import Dict, NamedTuple, Optional
+
+
+class ParamCost(NamedTuple):
+    credits: int
+    credits_per_result: int
+
+
+class EndpointCost(NamedTuple):
+    credits: int
+    credits_per_result: int
+    results_key: Optional[str]
+    page_size: Optional[int]
+    enrich_page_size: Optional[int]
+    paginated: bool
+    params: Dict[str, ParamCost]
+
+
+ENDPOINT_COSTS: Dict[str, EndpointCost] = {
+{%- for endpoint in endpoints %}
+    '{{endpoint}}': EndpointCost(
+        credits={{endpoints[endpoint]['credits']}},
+        credits_per_result={{endpoints[endpoint]['credits_per_result']}},
+        results_key={% if endpoints[endpoint]['results_key'] %}'{{endpoints[endpoint]['results_key']}}'{% else %}None{% endif %},
+        page_size={{endpoints[endpoint]['page_size']}},
+        enrich_page_size={{endpoints[endpoint]['enrich_page_size']}},
+        paginated={{endpoints[endpoint]['paginated']}},
+        params={
+            {%- for param in endpoints[endpoint]['params'] %}
+            '{{param}}': ParamCost({{endpoints[endpoint]['params'][param][0]}}, {{endpoints[endpoint]['params'][param][1]}}),
+            {%- endfor %}
+        }
+    ),
+{%- endfor %}
+}
+
+OPERATIONS: Dict[str, str] = {
+{%- for operation in operations %}
+    '{{operation}}': '{{operations[operation]}}',
+{%- endfor %}
+}
+
+NAMED_OPERATIONS: Dict[str, str] = {
+{%- for operation in named_operations %}
+    '{{operation}}': '{{named_operations[operation]}}',
+{%- endfor %}
+}
@@ -1,7 +1,13 @@
+from typing import Iterator, List, Union
 from proxycurl.config import (
-    BASE_URL, PROXYCURL_API_KEY, TIMEOUT, MAX_RETRIES, MAX_BACKOFF_SECONDS
+    BASE_URL, PROXYCURL_API_KEY, TIMEOUT, MAX_RETRIES, MAX_BACKOFF_SECONDS,
+    RATE_LIMIT, JSON_CODEC
 )
 from proxycurl.gevent.base import ProxycurlBase
+from proxycurl.codec import JsonCodec
+from proxycurl.interning import InternTable
+from proxycurl.metrics import MetricsHook
+from proxycurl.pagination import CursorStore
 from proxycurl.models import (
     {%- for namespace in ns_data %}
     {%- for result_class in ns_data[namespace]['result_classes'] %}
@@ -20,6 +26,7 @@ from proxycurl.models import (
         {%- for body in options['body'] %}
         {{body}}: {{options['body'][body]['type']}}{% if options['body'][body]['default'] %} = '{{options['body'][body]['default']}}'{% endif %},
         {%- endfor %}
+        fields: List[str] = None,
     ) -> {{options['result_class']}}:
         """{{options['title']}}
         {% if '\n' in options['docstring'] %}
@@ -36,6 +43,9 @@ from proxycurl.models import (
         :param {{param}}: {{options['body'][param]['description']}}{% if options['body'][param]['default'] %}, defaults to '{{options['body'][param]['default']}}'{% endif %}
         :type {{param}}: {{options['body'][param]['type']}}
         {%- endfor %}
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.{{options['result_class']}}` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.{{options['result_class']}}`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -60,7 +70,100 @@ from proxycurl.models import (
                 '{{body}}': {{body}},
                 {%- endfor %}
             },
-            result_class={{options['result_class']}}
+            result_class={{options['result_class']}},
+            fields=fields
+        )
+{%- endmacro %}
+
+{%- macro generate_iter_method(action, options) %}
+    def {{action}}_iter(
+        self,
+        max_results: int = None,
+        max_credits: int = None,
+        prefetch: bool = True,
+        cursor: CursorStore = None,
+        stream: bool = False,
+        **kwargs
+    ) -> Iterator[{{options['pagination']['item_class']}}]:
+        """{{options['title']}}, streaming results across pages
+
+        Takes the parameters of :meth:`{{action}}` and follows `next_page` until the last page.
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Stop before fetching a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :param prefetch: Fetch the next page while the current page is consumed, defaults to **True**
+        :type prefetch: bool
+        :param cursor: Resume from the page saved in this store and save the next page to it
+            once the current page is consumed, defaults to **None**
+        :type cursor: :class:`proxycurl.pagination.CursorStore`
+        :param stream: Parse every page as it is received, one page at a time, so that its first results
+            are returned before it finishes and about one result is held in memory, defaults to **False**
+        :type stream: bool
+        :return: An iterator of :class:`proxycurl.models.{{options['pagination']['item_class']}}`
+        :rtype: Iterator[:class:`proxycurl.models.{{options['pagination']['item_class']}}`]
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate(
+            first_page=self.{{action}},
+            params=kwargs,
+            url='{{options['endpoint']}}',
+            result_class={{options['result_class']}},
+            items_key='{{options['pagination']['items_key']}}',
+            max_results=max_results,
+            max_credits=max_credits,
+            prefetch=prefetch,
+            cursor=cursor,
+            stream=stream
+        )
+{%- endmacro %}
+{%- macro generate_page_iter_method(action, options) %}
+    def {{action}}_iter(
+        self,
+        concurrency: int = 4,
+        max_results: int = None,
+        max_credits: int = None,
+        **kwargs
+    ) -> Iterator[{{options['pagination']['item_class']}}]:
+        """{{options['title']}}, streaming results across pages
+
+        Takes the parameters of :meth:`{{action}}`, requests up to `concurrency` following pages
+        at once and returns the results in page order.
+{%- if options['pagination']['dedupe_key'] %}
+        Results with the `{{options['pagination']['dedupe_key']}}` of a previous result are skipped.
+{%- endif %}
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param concurrency: Pages requested at once, defaults to 4
+        :type concurrency: int
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Do not request a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :return: An iterator of :class:`proxycurl.models.{{options['pagination']['item_class']}}`
+        :rtype: Iterator[:class:`proxycurl.models.{{options['pagination']['item_class']}}`]
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate_pages(
+            first_page=self.{{action}},
+            params=kwargs,
+            url='{{options['endpoint']}}',
+            result_class={{options['result_class']}},
+            items_key='{{options['pagination']['items_key']}}',
+{%- if options['pagination']['dedupe_key'] %}
+            dedupe_key='{{options['pagination']['dedupe_key']}}',
+{%- endif %}
+            concurrency=concurrency,
+            max_results=max_results,
+            max_credits=max_credits
         )
 {%- endmacro %}
 {%- for namespace in ns_data %}
@@ -73,6 +176,13 @@ class _{{namespace.title()}}{{package.title()}}:
         self.{{namespace}} = {{namespace}}
     {%- for action in ns_data[namespace]['packages'][package] %}
 {{generate_method(action, ns_data[namespace]['packages'][package][action])}}
+{%- if ns_data[namespace]['packages'][package][action]['pagination'] %}
+{%- if ns_data[namespace]['packages'][package][action]['pagination']['page_no'] %}
+{{generate_page_iter_method(action, ns_data[namespace]['packages'][package][action])}}
+{%- else %}
+{{generate_iter_method(action, ns_data[namespace]['packages'][package][action])}}
+{%- endif %}
+{%- endif %}
     {%- endfor %}
 {%- endfor %}
 {%- endif %}
@@ -104,17 +214,35 @@ class Proxycurl(ProxycurlBase):
 
     def __init__(
         self,
-        api_key: str = PROXYCURL_API_KEY,
+        api_key: Union[str, List[str]] = PROXYCURL_API_KEY,
         base_url: str = BASE_URL,
         timeout: int = TIMEOUT,
         max_retries: int = MAX_RETRIES,
-        max_backoff_seconds: int = MAX_BACKOFF_SECONDS
+        max_backoff_seconds: int = MAX_BACKOFF_SECONDS,
+        rate_limit: int = RATE_LIMIT,
+        json_codec: Union[str, JsonCodec] = JSON_CODEC,
+        raw: bool = False,
+        lazy: bool = False,
+        structs: bool = False,
+        validate: bool = False,
+        intern: Union[bool, InternTable] = False,
+        metrics: MetricsHook = None
     ) -> None:
-        self.api_key = api_key
-        self.base_url = base_url
-        self.timeout = timeout
-        self.max_retries = max_retries
-        self.max_backoff_seconds = max_backoff_seconds
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            max_backoff_seconds=max_backoff_seconds,
+            rate_limit=rate_limit,
+            json_codec=json_codec,
+            raw=raw,
+            lazy=lazy,
+            structs=structs,
+            validate=validate,
+            intern=intern,
+            metrics=metrics
+        )
         {%- for namespace in ns_data %}
         {%- if namespace != 'common' %}
         self.{{namespace}} = _{{namespace.title()}}(self)
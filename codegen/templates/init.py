@@ -1,2 +1,2 @@
 from .library import Proxycurl
-from .base import do_bulk
\ No newline at end of file
+from .base import ProxycurlException, do_bulk, do_enrich, do_pipeline
\ No newline at end of file
@@ -0,0 +1,45 @@
+from typing import Dict, List, Optional, Tuple, Type, Union
+import msgspec
+
+# Compact counterparts of the TypedDict models of `proxycurl.models`,
+# decoded straight from the response body by clients created with `structs=True`.
+# Every field is optional, and an object field also accepts a list of objects.
+
+
+
+{%- macro parse_datatype(datatype) %}
+{%- if datatype['type'] == 'basic' %}Optional[{{datatype['value']}}]{%- endif %}
+{%- if datatype['type'] == 'object' and datatype['value'] in enums %}Optional[str]{%- endif %}
+{%- if datatype['type'] == 'object' and datatype['value'] not in enums %}Union[{{datatype['value']}}, List[{{datatype['value']}}], None]{%- endif %}
+{%- if datatype['type'] == 'list' %}Optional[List[{{datatype['value']}}]]{%- endif %}
+{%- if datatype['type'] == 'tuple' %}Optional[Tuple[{% for value in datatype['value'] %}Optional[{{value}}]{% if not loop.last %}, {% endif %}{% endfor %}]]{%- endif %}
+{%- endmacro %}
+{%- for result_class in result_classes %}
+
+
+class {{result_class}}(msgspec.Struct, kw_only=True, gc=False):
+{%- for param in result_classes[result_class] %}
+    {{param}}: {{parse_datatype(result_classes[result_class][param])}} = None
+{%- endfor %}
+{%- endfor %}
+
+
+STRUCTS: Dict[str, Type[msgspec.Struct]] = {
+{%- for result_class in result_classes %}
+    '{{result_class}}': {{result_class}},
+{%- endfor %}
+}
+
+_decoders: Dict[str, msgspec.json.Decoder] = {}
+
+
+def decoder(result_class: str) -> msgspec.json.Decoder:
+    """Returns the decoder of the struct named like a result class of `proxycurl.models`"""
+    if result_class not in _decoders:
+        _decoders[result_class] = msgspec.json.Decoder(STRUCTS[result_class], strict=False)
+    return _decoders[result_class]
+
+
+def to_builtins(struct: msgspec.Struct) -> Dict:
+    """Convert a struct to the dictionary of its TypedDict model"""
+    return msgspec.to_builtins(struct)
@@ -1,14 +1,23 @@
 from typing import (
+    AsyncIterator,
     Awaitable,
-    Optional
+    List,
+    Optional,
+    Union
 )
 from proxycurl.config import (
-    BASE_URL, PROXYCURL_API_KEY, TIMEOUT, MAX_RETRIES, MAX_BACKOFF_SECONDS
+    BASE_URL, PROXYCURL_API_KEY, TIMEOUT, MAX_RETRIES, MAX_BACKOFF_SECONDS,
+    RATE_LIMIT, JSON_CODEC
 )
 from proxycurl.asyncio.base import ProxycurlBase
+from proxycurl.codec import JsonCodec
+from proxycurl.interning import InternTable
+from proxycurl.metrics import MetricsHook
+from proxycurl.pagination import CursorStore
 from proxycurl.models import (
     PersonEndpointResponse,
     PersonSearchResult,
+    SearchResult,
     PersonLookupUrlEnrichResult,
     ReverseEmailUrlEnrichResult,
     ReverseContactNumberResult,
@@ -18,16 +27,21 @@ from proxycurl.models import (
     ProfilePicture,
     LinkedinCompany,
     CompanySearchResult,
+    CSearchResult,
     CompanyUrlEnrichResult,
     JobListPage,
+    JobListEntry,
     JobListCount,
     EmployeeCount,
     EmployeeList,
+    Employee,
     RoleSearchEnrichedResult,
     LinkedinSchool,
     StudentList,
+    Student,
     JobProfile,
     CustomerList,
+    CompanyCustomer,
     CreditBalance,
 )
 
@@ -51,6 +65,7 @@ class _LinkedinPerson:
         twitter_profile_url: str = None,
         facebook_profile_url: str = None,
         linkedin_profile_url: str = None,
+        fields: List[str] = None,
     ) -> Awaitable[PersonEndpointResponse]:
         """Person Profile Endpoint
         
@@ -145,6 +160,9 @@ class _LinkedinPerson:
 
             yes (Include only one of: `linkedin_profile_url`, `twitter_profile_url`, or `facebook_profile_url`)
         :type linkedin_profile_url: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.PersonEndpointResponse]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.PersonEndpointResponse]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -185,7 +203,8 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=PersonEndpointResponse
+            result_class=PersonEndpointResponse,
+            fields=fields
         )
         return resp
 
@@ -238,6 +257,7 @@ class _LinkedinPerson:
         page_size: str = None,
         enrich_profiles: str = None,
         after: str = None,
+        fields: List[str] = None,
     ) -> Awaitable[PersonSearchResult]:
         """Person Search Endpoint
         
@@ -453,6 +473,12 @@ class _LinkedinPerson:
 
             Calling this API endpoint with this parameter would add `1` credit per result returned.
         :type enrich_profiles: str
+        :param after: The cursor of the page to fetch, as found in the `next_page` URL of the previous page.
+            Omit this parameter to fetch the first page.
+        :type after: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.PersonSearchResult]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.PersonSearchResult]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -561,10 +587,57 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=PersonSearchResult
+            result_class=PersonSearchResult,
+            fields=fields
         )
         return resp
 
+    def search_iter(
+        self,
+        max_results: int = None,
+        max_credits: int = None,
+        prefetch: bool = True,
+        cursor: CursorStore = None,
+        stream: bool = False,
+        **kwargs
+    ) -> AsyncIterator[SearchResult]:
+        """Person Search Endpoint, streaming results across pages
+
+        Takes the parameters of :meth:`search` and follows `next_page` until the last page.
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Stop before fetching a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :param prefetch: Fetch the next page while the current page is consumed, defaults to **True**
+        :type prefetch: bool
+        :param cursor: Resume from the page saved in this store and save the next page to it
+            once the current page is consumed, defaults to **None**
+        :type cursor: :class:`proxycurl.pagination.CursorStore`
+        :param stream: Parse every page as it is received, one page at a time, so that its first results
+            are returned before it finishes and about one result is held in memory, defaults to **False**
+        :type stream: bool
+        :return: An asynchronous iterator of :class:`proxycurl.models.SearchResult`
+        :rtype: AsyncIterator[:class:`proxycurl.models.SearchResult`]
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate(
+            first_page=self.search,
+            params=kwargs,
+            url='/proxycurl/api/v2/search/person',
+            result_class=PersonSearchResult,
+            items_key='results',
+            max_results=max_results,
+            max_credits=max_credits,
+            prefetch=prefetch,
+            cursor=cursor,
+            stream=stream
+        )
+
     async def resolve(
         self,
         first_name: str,
@@ -574,6 +647,7 @@ class _LinkedinPerson:
         location: str = None,
         title: str = None,
         last_name: str = None,
+        fields: List[str] = None,
     ) -> Awaitable[PersonLookupUrlEnrichResult]:
         """Person Lookup Endpoint
         
@@ -628,6 +702,9 @@ class _LinkedinPerson:
         :type title: str
         :param last_name: Last name of the user
         :type last_name: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.PersonLookupUrlEnrichResult]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.PersonLookupUrlEnrichResult]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -654,7 +731,8 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=PersonLookupUrlEnrichResult
+            result_class=PersonLookupUrlEnrichResult,
+            fields=fields
         )
         return resp
 
@@ -663,6 +741,7 @@ class _LinkedinPerson:
         email: str,
         lookup_depth: str,
         enrich_profile: str = None,
+        fields: List[str] = None,
     ) -> Awaitable[ReverseEmailUrlEnrichResult]:
         """Reverse Email Lookup Endpoint
         
@@ -694,6 +773,9 @@ class _LinkedinPerson:
 
             If you require [fresh profile data](https://nubela.co/blog/how-fresh-are-profiles-returned-by-proxycurl-api/),  please chain this API call with the `linkedin_profile_url` result with the [Person Profile Endpoint](https://nubela.co/proxycurl/docs#people-api-person-profile-endpoint) with the `use_cache=if-recent` parameter.
         :type enrich_profile: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.ReverseEmailUrlEnrichResult]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.ReverseEmailUrlEnrichResult]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -712,13 +794,15 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=ReverseEmailUrlEnrichResult
+            result_class=ReverseEmailUrlEnrichResult,
+            fields=fields
         )
         return resp
 
     async def resolve_by_phone(
         self,
         phone_number: str,
+        fields: List[str] = None,
     ) -> Awaitable[ReverseContactNumberResult]:
         """Reverse Contact Number Lookup Endpoint
         
@@ -727,6 +811,9 @@ class _LinkedinPerson:
         
         :param phone_number: [E.164 formatted](https://www.twilio.com/docs/glossary/what-e164) phone number of the person you want to identify social media profiles of.
         :type phone_number: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.ReverseContactNumberResult]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.ReverseContactNumberResult]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -742,7 +829,8 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=ReverseContactNumberResult
+            result_class=ReverseContactNumberResult,
+            fields=fields
         )
         return resp
 
@@ -750,6 +838,7 @@ class _LinkedinPerson:
         self,
         linkedin_profile_url: str,
         callback_url: str = None,
+        fields: List[str] = None,
     ) -> Awaitable[ExtractionEmailResult]:
         """Work Email Lookup Endpoint
         
@@ -772,6 +861,9 @@ class _LinkedinPerson:
         :param callback_url: Webhook to notify your application when
             the request has finished processing.
         :type callback_url: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.ExtractionEmailResult]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.ExtractionEmailResult]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -789,7 +881,8 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=ExtractionEmailResult
+            result_class=ExtractionEmailResult,
+            fields=fields
         )
         return resp
 
@@ -799,6 +892,7 @@ class _LinkedinPerson:
         twitter_profile_url: str = None,
         facebook_profile_url: str = None,
         linkedin_profile_url: str = None,
+        fields: List[str] = None,
     ) -> Awaitable[PersonalContactNumbers]:
         """Personal Contact Number Lookup Endpoint
         
@@ -831,6 +925,9 @@ class _LinkedinPerson:
             Yes (Include only one of: `linkedin_profile_url`,
             `twitter_profile_url`, or `facebook_profile_url`)
         :type linkedin_profile_url: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.PersonalContactNumbers]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.PersonalContactNumbers]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -853,7 +950,8 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=PersonalContactNumbers
+            result_class=PersonalContactNumbers,
+            fields=fields
         )
         return resp
 
@@ -864,6 +962,7 @@ class _LinkedinPerson:
         twitter_profile_url: str = None,
         facebook_profile_url: str = None,
         linkedin_profile_url: str = None,
+        fields: List[str] = None,
     ) -> Awaitable[PDLEmailResult]:
         """Personal Email Lookup Endpoint
         
@@ -892,6 +991,9 @@ class _LinkedinPerson:
         :param linkedin_profile_url: The LinkedIn Profile URL from which you wish to extract personal email addresses.
             yes (Include only one of: `linkedin_profile_url`, `twitter_profile_url`, or `facebook_profile_url`)
         :type linkedin_profile_url: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.PDLEmailResult]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.PDLEmailResult]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -916,13 +1018,15 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=PDLEmailResult
+            result_class=PDLEmailResult,
+            fields=fields
         )
         return resp
 
     async def profile_picture(
         self,
         linkedin_person_profile_url: str,
+        fields: List[str] = None,
     ) -> Awaitable[ProfilePicture]:
         """Person Profile Picture Endpoint
         
@@ -934,6 +1038,9 @@ class _LinkedinPerson:
         
         :param linkedin_person_profile_url: LinkedIn Profile URL of the person that you are trying to get the profile picture of.
         :type linkedin_person_profile_url: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.ProfilePicture]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.ProfilePicture]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -949,7 +1056,8 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=ProfilePicture
+            result_class=ProfilePicture,
+            fields=fields
         )
         return resp
 
@@ -968,6 +1076,7 @@ class _LinkedinCompany:
         exit_data: str = None,
         acquisitions: str = None,
         use_cache: str = None,
+        fields: List[str] = None,
     ) -> Awaitable[LinkedinCompany]:
         """Company Profile Endpoint
         
@@ -1017,6 +1126,9 @@ class _LinkedinCompany:
 
             `if-recent` API will make a best effort to return a fresh profile no older than 29 days.Costs an extra `1` credit on top of the cost of the base endpoint.
         :type use_cache: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.LinkedinCompany]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.LinkedinCompany]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -1046,7 +1158,8 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=LinkedinCompany
+            result_class=LinkedinCompany,
+            fields=fields
         )
         return resp
 
@@ -1074,6 +1187,7 @@ class _LinkedinCompany:
         region: str = None,
         country: str = None,
         after: str = None,
+        fields: List[str] = None,
     ) -> Awaitable[CompanySearchResult]:
         """Company Search Endpoint
         
@@ -1172,6 +1286,12 @@ class _LinkedinCompany:
 
             This parameter accepts a case-insensitive [Alpha-2 ISO3166 country code](https://en.wikipedia.org/wiki/ISO_3166-1_alpha-2).
         :type country: str
+        :param after: The cursor of the page to fetch, as found in the `next_page` URL of the previous page.
+            Omit this parameter to fetch the first page.
+        :type after: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.CompanySearchResult]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.CompanySearchResult]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -1230,16 +1350,64 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=CompanySearchResult
+            result_class=CompanySearchResult,
+            fields=fields
         )
         return resp
 
+    def search_iter(
+        self,
+        max_results: int = None,
+        max_credits: int = None,
+        prefetch: bool = True,
+        cursor: CursorStore = None,
+        stream: bool = False,
+        **kwargs
+    ) -> AsyncIterator[CSearchResult]:
+        """Company Search Endpoint, streaming results across pages
+
+        Takes the parameters of :meth:`search` and follows `next_page` until the last page.
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Stop before fetching a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :param prefetch: Fetch the next page while the current page is consumed, defaults to **True**
+        :type prefetch: bool
+        :param cursor: Resume from the page saved in this store and save the next page to it
+            once the current page is consumed, defaults to **None**
+        :type cursor: :class:`proxycurl.pagination.CursorStore`
+        :param stream: Parse every page as it is received, one page at a time, so that its first results
+            are returned before it finishes and about one result is held in memory, defaults to **False**
+        :type stream: bool
+        :return: An asynchronous iterator of :class:`proxycurl.models.CSearchResult`
+        :rtype: AsyncIterator[:class:`proxycurl.models.CSearchResult`]
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate(
+            first_page=self.search,
+            params=kwargs,
+            url='/proxycurl/api/v2/search/company',
+            result_class=CompanySearchResult,
+            items_key='results',
+            max_results=max_results,
+            max_credits=max_credits,
+            prefetch=prefetch,
+            cursor=cursor,
+            stream=stream
+        )
+
     async def resolve(
         self,
         company_location: str = None,
         company_domain: str = None,
         company_name: str = None,
         enrich_profile: str = None,
+        fields: List[str] = None,
     ) -> Awaitable[CompanyUrlEnrichResult]:
         """Company Lookup Endpoint
         
@@ -1268,6 +1436,9 @@ class _LinkedinCompany:
             If you require [fresh profile data](https://nubela.co/blog/how-fresh-are-profiles-returned-by-proxycurl-api/),
             please chain this API call with the [Company Profile Endpoint](https://nubela.co/proxycurl/docs#company-api-company-profile-endpoint) with the `use_cache=if-recent` parameter.
         :type enrich_profile: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.CompanyUrlEnrichResult]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.CompanyUrlEnrichResult]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -1290,7 +1461,8 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=CompanyUrlEnrichResult
+            result_class=CompanyUrlEnrichResult,
+            fields=fields
         )
         return resp
 
@@ -1303,6 +1475,7 @@ class _LinkedinCompany:
         geo_id: str = None,
         keyword: str = None,
         search_id: str = None,
+        fields: List[str] = None,
     ) -> Awaitable[JobListPage]:
         """Job Search Endpoint
         
@@ -1353,6 +1526,9 @@ class _LinkedinCompany:
             You can get the `search_id` of a LinkedIn company via
             [Company Profile API](#company-api-company-profile-endpoint).
         :type search_id: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.JobListPage]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.JobListPage]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -1381,10 +1557,50 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=JobListPage
+            result_class=JobListPage,
+            fields=fields
         )
         return resp
 
+    def find_job_iter(
+        self,
+        concurrency: int = 4,
+        max_results: int = None,
+        max_credits: int = None,
+        **kwargs
+    ) -> AsyncIterator[JobListEntry]:
+        """Job Search Endpoint, streaming results across pages
+
+        Takes the parameters of :meth:`find_job`, requests up to `concurrency` following pages
+        at once and returns the results in page order.
+        Results with the `job_url` of a previous result are skipped.
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param concurrency: Pages requested at once, defaults to 4
+        :type concurrency: int
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Do not request a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :return: An asynchronous iterator of :class:`proxycurl.models.JobListEntry`
+        :rtype: AsyncIterator[:class:`proxycurl.models.JobListEntry`]
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate_pages(
+            first_page=self.find_job,
+            params=kwargs,
+            url='/proxycurl/api/v2/linkedin/company/job',
+            result_class=JobListPage,
+            items_key='job',
+            dedupe_key='job_url',
+            concurrency=concurrency,
+            max_results=max_results,
+            max_credits=max_credits
+        )
+
     async def job_count(
         self,
         job_type: str = None,
@@ -1394,6 +1610,7 @@ class _LinkedinCompany:
         geo_id: str = None,
         keyword: str = None,
         search_id: str = None,
+        fields: List[str] = None,
     ) -> Awaitable[JobListCount]:
         """Jobs Listing Count Endpoint
         
@@ -1444,6 +1661,9 @@ class _LinkedinCompany:
             You can get the `search_id` of a LinkedIn company via
             [Company Profile API](#company-api-company-profile-endpoint).
         :type search_id: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.JobListCount]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.JobListCount]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -1472,7 +1692,8 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=JobListCount
+            result_class=JobListCount,
+            fields=fields
         )
         return resp
 
@@ -1482,6 +1703,7 @@ class _LinkedinCompany:
         use_cache: str = None,
         linkedin_employee_count: str = None,
         employment_status: str = None,
+        fields: List[str] = None,
     ) -> Awaitable[EmployeeCount]:
         """Employee Count Endpoint
         
@@ -1515,6 +1737,9 @@ class _LinkedinCompany:
             * `past` : count past employees
             * `all` : count current & past employees
         :type employment_status: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.EmployeeCount]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.EmployeeCount]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -1536,7 +1761,8 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=EmployeeCount
+            result_class=EmployeeCount,
+            fields=fields
         )
         return resp
 
@@ -1551,6 +1777,7 @@ class _LinkedinCompany:
         sort_by: str = None,
         resolve_numeric_id: str = None,
         after: str = None,
+        fields: List[str] = None,
     ) -> Awaitable[EmployeeList]:
         """Employee Listing Endpoint
         
@@ -1624,6 +1851,12 @@ class _LinkedinCompany:
             - `true` - Enable support for Company Profile URLs with numerical IDs. 
             Costs an extra `2` credit on top of the base cost of the endpoint.
         :type resolve_numeric_id: str
+        :param after: The cursor of the page to fetch, as found in the `next_page` URL of the previous page.
+            Omit this parameter to fetch the first page.
+        :type after: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.EmployeeList]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.EmployeeList]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -1655,10 +1888,57 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=EmployeeList
+            result_class=EmployeeList,
+            fields=fields
         )
         return resp
 
+    def employee_list_iter(
+        self,
+        max_results: int = None,
+        max_credits: int = None,
+        prefetch: bool = True,
+        cursor: CursorStore = None,
+        stream: bool = False,
+        **kwargs
+    ) -> AsyncIterator[Employee]:
+        """Employee Listing Endpoint, streaming results across pages
+
+        Takes the parameters of :meth:`employee_list` and follows `next_page` until the last page.
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Stop before fetching a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :param prefetch: Fetch the next page while the current page is consumed, defaults to **True**
+        :type prefetch: bool
+        :param cursor: Resume from the page saved in this store and save the next page to it
+            once the current page is consumed, defaults to **None**
+        :type cursor: :class:`proxycurl.pagination.CursorStore`
+        :param stream: Parse every page as it is received, one page at a time, so that its first results
+            are returned before it finishes and about one result is held in memory, defaults to **False**
+        :type stream: bool
+        :return: An asynchronous iterator of :class:`proxycurl.models.Employee`
+        :rtype: AsyncIterator[:class:`proxycurl.models.Employee`]
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate(
+            first_page=self.employee_list,
+            params=kwargs,
+            url='/proxycurl/api/linkedin/company/employees',
+            result_class=EmployeeList,
+            items_key='employees',
+            max_results=max_results,
+            max_credits=max_credits,
+            prefetch=prefetch,
+            cursor=cursor,
+            stream=stream
+        )
+
     async def employee_search(
         self,
         keyword_regex: str,
@@ -1668,6 +1948,7 @@ class _LinkedinCompany:
         enrich_profiles: str = None,
         resolve_numeric_id: str = None,
         after: str = None,
+        fields: List[str] = None,
     ) -> Awaitable[EmployeeList]:
         """Employee Search Endpoint
         
@@ -1715,6 +1996,12 @@ class _LinkedinCompany:
             - `true` - Enable support for Company Profile URLs with numerical IDs. 
             Costs an extra `2` credit on top of the base cost of the endpoint.
         :type resolve_numeric_id: str
+        :param after: The cursor of the page to fetch, as found in the `next_page` URL of the previous page.
+            Omit this parameter to fetch the first page.
+        :type after: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.EmployeeList]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.EmployeeList]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -1741,15 +2028,63 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=EmployeeList
+            result_class=EmployeeList,
+            fields=fields
         )
         return resp
 
+    def employee_search_iter(
+        self,
+        max_results: int = None,
+        max_credits: int = None,
+        prefetch: bool = True,
+        cursor: CursorStore = None,
+        stream: bool = False,
+        **kwargs
+    ) -> AsyncIterator[Employee]:
+        """Employee Search Endpoint, streaming results across pages
+
+        Takes the parameters of :meth:`employee_search` and follows `next_page` until the last page.
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Stop before fetching a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :param prefetch: Fetch the next page while the current page is consumed, defaults to **True**
+        :type prefetch: bool
+        :param cursor: Resume from the page saved in this store and save the next page to it
+            once the current page is consumed, defaults to **None**
+        :type cursor: :class:`proxycurl.pagination.CursorStore`
+        :param stream: Parse every page as it is received, one page at a time, so that its first results
+            are returned before it finishes and about one result is held in memory, defaults to **False**
+        :type stream: bool
+        :return: An asynchronous iterator of :class:`proxycurl.models.Employee`
+        :rtype: AsyncIterator[:class:`proxycurl.models.Employee`]
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate(
+            first_page=self.employee_search,
+            params=kwargs,
+            url='/proxycurl/api/linkedin/company/employee/search',
+            result_class=EmployeeList,
+            items_key='employees',
+            max_results=max_results,
+            max_credits=max_credits,
+            prefetch=prefetch,
+            cursor=cursor,
+            stream=stream
+        )
+
     async def role_lookup(
         self,
         company_name: str,
         role: str,
         enrich_profile: str = None,
+        fields: List[str] = None,
     ) -> Awaitable[RoleSearchEnrichedResult]:
         """Role Lookup Endpoint
         
@@ -1779,6 +2114,9 @@ class _LinkedinCompany:
             If you require [fresh profile data](https://nubela.co/blog/how-fresh-are-profiles-returned-by-proxycurl-api/),
             please chain this API call with the [Person Profile Endpoint](#people-api-person-profile-endpoint) with the `use_cache=if-recent` parameter.
         :type enrich_profile: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.RoleSearchEnrichedResult]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.RoleSearchEnrichedResult]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -1797,13 +2135,15 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=RoleSearchEnrichedResult
+            result_class=RoleSearchEnrichedResult,
+            fields=fields
         )
         return resp
 
     async def profile_picture(
         self,
         linkedin_company_profile_url: str,
+        fields: List[str] = None,
     ) -> Awaitable[ProfilePicture]:
         """Company Profile Picture Endpoint
         
@@ -1815,6 +2155,9 @@ class _LinkedinCompany:
         
         :param linkedin_company_profile_url: LinkedIn Profile URL of the company that you are trying to get the profile picture of.
         :type linkedin_company_profile_url: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.ProfilePicture]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.ProfilePicture]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -1830,7 +2173,8 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=ProfilePicture
+            result_class=ProfilePicture,
+            fields=fields
         )
         return resp
 
@@ -1843,6 +2187,7 @@ class _LinkedinSchool:
         self,
         url: str,
         use_cache: str = None,
+        fields: List[str] = None,
     ) -> Awaitable[LinkedinSchool]:
         """School Profile Endpoint
         
@@ -1857,6 +2202,9 @@ class _LinkedinSchool:
 
             `if-recent` API will make a best effort to return a fresh profile no older than 29 days.Costs an extra `1` credit on top of the cost of the base endpoint.
         :type use_cache: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.LinkedinSchool]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.LinkedinSchool]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -1874,7 +2222,8 @@ class _LinkedinSchool:
             params=params,
             data={
             },
-            result_class=LinkedinSchool
+            result_class=LinkedinSchool,
+            fields=fields
         )
         return resp
 
@@ -1888,6 +2237,7 @@ class _LinkedinSchool:
         student_status: str = None,
         sort_by: str = None,
         resolve_numeric_id: str = None,
+        fields: List[str] = None,
     ) -> Awaitable[StudentList]:
         """Student Listing Endpoint
         
@@ -1958,6 +2308,9 @@ class _LinkedinSchool:
             - `true` - Enable support for School Profile URLs with numerical IDs. 
             Costs an extra `2` credit on top of the base cost of the endpoint.
         :type resolve_numeric_id: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.StudentList]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.StudentList]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -1987,10 +2340,57 @@ class _LinkedinSchool:
             params=params,
             data={
             },
-            result_class=StudentList
+            result_class=StudentList,
+            fields=fields
         )
         return resp
 
+    def student_list_iter(
+        self,
+        max_results: int = None,
+        max_credits: int = None,
+        prefetch: bool = True,
+        cursor: CursorStore = None,
+        stream: bool = False,
+        **kwargs
+    ) -> AsyncIterator[Student]:
+        """Student Listing Endpoint, streaming results across pages
+
+        Takes the parameters of :meth:`student_list` and follows `next_page` until the last page.
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Stop before fetching a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :param prefetch: Fetch the next page while the current page is consumed, defaults to **True**
+        :type prefetch: bool
+        :param cursor: Resume from the page saved in this store and save the next page to it
+            once the current page is consumed, defaults to **None**
+        :type cursor: :class:`proxycurl.pagination.CursorStore`
+        :param stream: Parse every page as it is received, one page at a time, so that its first results
+            are returned before it finishes and about one result is held in memory, defaults to **False**
+        :type stream: bool
+        :return: An asynchronous iterator of :class:`proxycurl.models.Student`
+        :rtype: AsyncIterator[:class:`proxycurl.models.Student`]
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate(
+            first_page=self.student_list,
+            params=kwargs,
+            url='/proxycurl/api/linkedin/school/students',
+            result_class=StudentList,
+            items_key='students',
+            max_results=max_results,
+            max_credits=max_credits,
+            prefetch=prefetch,
+            cursor=cursor,
+            stream=stream
+        )
+
 
 class _LinkedinJob:
     def __init__(self, linkedin):
@@ -1999,6 +2399,7 @@ class _LinkedinJob:
     async def get(
         self,
         url: str,
+        fields: List[str] = None,
     ) -> Awaitable[JobProfile]:
         """Job Profile Endpoint
         
@@ -2012,6 +2413,9 @@ class _LinkedinJob:
             [Jobs Listing Endpoint](#jobs-api-jobs-listing-endpoint)
             can be used to retrieve a job URL.
         :type url: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.JobProfile]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.JobProfile]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -2027,7 +2431,8 @@ class _LinkedinJob:
             params=params,
             data={
             },
-            result_class=JobProfile
+            result_class=JobProfile,
+            fields=fields
         )
         return resp
 
@@ -2042,6 +2447,7 @@ class _LinkedinCustomers:
         twitter_profile_url: str = None,
         page_size: str = None,
         after: str = None,
+        fields: List[str] = None,
     ) -> Awaitable[CustomerList]:
         """Customer Listing Endpoint
         
@@ -2068,6 +2474,12 @@ class _LinkedinCustomers:
 
             Accepted values for this parameter is an integer ranging from 0 to 1000.
         :type page_size: str
+        :param after: The cursor of the page to fetch, as found in the `next_page` URL of the previous page.
+            Omit this parameter to fetch the first page.
+        :type after: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.CustomerList]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.CustomerList]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -2090,10 +2502,57 @@ class _LinkedinCustomers:
             params=params,
             data={
             },
-            result_class=CustomerList
+            result_class=CustomerList,
+            fields=fields
         )
         return resp
 
+    def listing_iter(
+        self,
+        max_results: int = None,
+        max_credits: int = None,
+        prefetch: bool = True,
+        cursor: CursorStore = None,
+        stream: bool = False,
+        **kwargs
+    ) -> AsyncIterator[CompanyCustomer]:
+        """Customer Listing Endpoint, streaming results across pages
+
+        Takes the parameters of :meth:`listing` and follows `next_page` until the last page.
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Stop before fetching a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :param prefetch: Fetch the next page while the current page is consumed, defaults to **True**
+        :type prefetch: bool
+        :param cursor: Resume from the page saved in this store and save the next page to it
+            once the current page is consumed, defaults to **None**
+        :type cursor: :class:`proxycurl.pagination.CursorStore`
+        :param stream: Parse every page as it is received, one page at a time, so that its first results
+            are returned before it finishes and about one result is held in memory, defaults to **False**
+        :type stream: bool
+        :return: An asynchronous iterator of :class:`proxycurl.models.CompanyCustomer`
+        :rtype: AsyncIterator[:class:`proxycurl.models.CompanyCustomer`]
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate(
+            first_page=self.listing,
+            params=kwargs,
+            url='/proxycurl/api/customers',
+            result_class=CustomerList,
+            items_key='companies',
+            max_results=max_results,
+            max_credits=max_credits,
+            prefetch=prefetch,
+            cursor=cursor,
+            stream=stream
+        )
+
 
 class _Linkedin:
     person: _LinkedinPerson
@@ -2116,27 +2575,49 @@ class Proxycurl(ProxycurlBase):
 
     def __init__(
         self,
-        api_key: str = PROXYCURL_API_KEY,
+        api_key: Union[str, List[str]] = PROXYCURL_API_KEY,
         base_url: str = BASE_URL,
         timeout: int = TIMEOUT,
         max_retries: int = MAX_RETRIES,
-        max_backoff_seconds: int = MAX_BACKOFF_SECONDS
+        max_backoff_seconds: int = MAX_BACKOFF_SECONDS,
+        rate_limit: int = RATE_LIMIT,
+        json_codec: Union[str, JsonCodec] = JSON_CODEC,
+        raw: bool = False,
+        lazy: bool = False,
+        structs: bool = False,
+        validate: bool = False,
+        intern: Union[bool, InternTable] = False,
+        metrics: MetricsHook = None
     ) -> None:
-        self.api_key = api_key
-        self.base_url = base_url
-        self.timeout = timeout
-        self.max_retries = max_retries
-        self.max_backoff_seconds = max_backoff_seconds
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            max_backoff_seconds=max_backoff_seconds,
+            rate_limit=rate_limit,
+            json_codec=json_codec,
+            raw=raw,
+            lazy=lazy,
+            structs=structs,
+            validate=validate,
+            intern=intern,
+            metrics=metrics
+        )
         self.linkedin = _Linkedin(self)
 
     async def get_balance(
         self,
+        fields: List[str] = None,
     ) -> Awaitable[CreditBalance]:
         """View Credit Balance Endpoint
         
                 Cost: 0 credit / successful request.
         Get your current credit(s) balance
         
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Awaitable[:class:`proxycurl.models.CreditBalance]` or **None** if there is an error.
         :rtype: Awaitable[:class:`proxycurl.models.CreditBalance]`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.asyncio.ProxycurlException`
@@ -2151,6 +2632,7 @@ class Proxycurl(ProxycurlBase):
             params=params,
             data={
             },
-            result_class=CreditBalance
+            result_class=CreditBalance,
+            fields=fields
         )
         return resp
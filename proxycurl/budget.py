@@ -0,0 +1,179 @@
+from collections.abc import Mapping
+from typing import Callable, Dict, Optional, Tuple
+from proxycurl.costs import ENDPOINT_COSTS, OPERATIONS
+
+Op = Tuple[Callable, Dict]
+
+# parameter values which never trigger the extra charge of a parameter
+FREE_VALUES = frozenset([
+    'exclude', 'skip', 'none', 'false', 'if-present', 'fast', 'superficial',
+])
+
+# results estimated for a page without a `page_size`, as the default page size of
+# some endpoints, e.g. 200000 for `employee/search`, is far above what a page returns
+MAX_DEFAULT_PAGE_SIZE = 100
+
+
+class CreditBudgetExceeded(Exception):
+    """Raised for operations which were not dispatched because the credit budget was reached"""
+    pass
+
+
+def operation_endpoint(func: Callable) -> Optional[str]:
+    """Returns the API endpoint called by a generated library method, or **None** if unknown"""
+    return OPERATIONS.get(getattr(func, '__qualname__', None))
+
+
+def operation_client(func: Callable):
+    """Returns the :class:`Proxycurl` client a generated library method is bound to"""
+    owner = func.__self__
+    if hasattr(owner, 'get_balance'):
+        return owner
+    return owner.linkedin.proxycurl
+
+
+def effective_page_size(endpoint: str, params: Dict) -> Optional[int]:
+    """Returns the page size of a call, its default page size if no `page_size` is given
+
+    The default page size of some endpoints is lower when `enrich_profiles=enrich`.
+    """
+    if params.get('page_size'):
+        return int(params['page_size'])
+    cost = ENDPOINT_COSTS.get(endpoint)
+    if cost is None:
+        return None
+    enrich = params.get('enrich_profiles')
+    if cost.enrich_page_size is not None and enrich is not None and str(enrich).lower() not in FREE_VALUES:
+        return cost.enrich_page_size
+    return cost.page_size
+
+
+def estimate_cost(
+    endpoint: str,
+    params: Dict,
+    results: Optional[int] = None
+) -> int:
+    """Estimate the credits charged for a single call of an endpoint
+
+    :param endpoint: API endpoint, e.g. `/proxycurl/api/v2/linkedin`
+    :type endpoint: str
+    :param params: Parameters of the call
+    :type params: Dict
+    :param results: Number of results returned, defaults to the requested (or default) page size,
+        capped at `MAX_DEFAULT_PAGE_SIZE` when no `page_size` is given
+    :type results: int
+    :return: Estimated credits, an upper bound for most endpoints
+    :rtype: int
+    """
+    cost = ENDPOINT_COSTS.get(endpoint)
+    if cost is None:
+        return 0
+    if results is None:
+        results = effective_page_size(endpoint, params) or 1
+        if not params.get('page_size'):
+            results = min(results, MAX_DEFAULT_PAGE_SIZE)
+    credits = cost.credits
+    credits_per_result = cost.credits_per_result
+    for param, param_cost in cost.params.items():
+        value = params.get(param)
+        if value is None or str(value).lower() in FREE_VALUES:
+            continue
+        credits += param_cost.credits
+        credits_per_result += param_cost.credits_per_result
+    return credits + credits_per_result * results
+
+
+def response_cost(endpoint: str, params: Dict, response) -> int:
+    """Credits charged for a call, counting the results found in its response"""
+    cost = ENDPOINT_COSTS.get(endpoint)
+    if cost is None:
+        return 0
+    results = 1
+    if cost.results_key is not None and isinstance(response, Mapping):
+        results = len(response.get(cost.results_key) or [])
+    elif cost.results_key is not None and hasattr(response, '__struct_fields__'):
+        # a struct returned by a client created with `structs=True`
+        results = len(getattr(response, cost.results_key) or [])
+    return estimate_cost(endpoint, params, results)
+
+
+def estimate_op_cost(op: Op) -> int:
+    endpoint = operation_endpoint(op[0])
+    if endpoint is None:
+        return 0
+    return estimate_cost(endpoint, op[1])
+
+
+def op_cost(op: Op, response) -> int:
+    endpoint = operation_endpoint(op[0])
+    if endpoint is None:
+        return 0
+    return response_cost(endpoint, op[1], response)
+
+
+class CreditBudget:
+    """Track credits spent by a bulk operation against a maximum
+
+    Credits of an operation are reserved with their estimated cost before it
+    is dispatched and settled with the cost of its response once finished.
+    The estimate is periodically replaced by the credits actually spent,
+    which is reconciled from the account credit balance.
+    """
+    max_credits: int
+    balance_check_interval: int
+    spent: int
+    reserved: int
+    completed: int
+    initial_balance: Optional[int]
+    exhausted: bool
+
+    def __init__(
+        self,
+        max_credits: int,
+        balance_check_interval: int = 100
+    ) -> None:
+        self.max_credits = max_credits
+        self.balance_check_interval = balance_check_interval
+        self.spent = 0
+        self.reserved = 0
+        self.completed = 0
+        self.initial_balance = None
+        self.exhausted = False
+
+    @property
+    def limit(self) -> int:
+        if self.initial_balance is None:
+            return self.max_credits
+        return min(self.max_credits, self.initial_balance)
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.limit - self.spent - self.reserved)
+
+    @property
+    def reconcile_due(self) -> bool:
+        return (
+            self.balance_check_interval > 0
+            and self.completed % self.balance_check_interval == 0
+        )
+
+    def reserve(self, credits: int) -> bool:
+        """Reserve credits for an operation, returns **False** once the budget is reached"""
+        if self.exhausted or credits > self.remaining:
+            self.exhausted = True
+            return False
+        self.reserved += credits
+        return True
+
+    def settle(self, reserved: int, credits: int) -> None:
+        """Replace the reservation of a finished operation with the credits it cost"""
+        self.reserved -= reserved
+        self.spent += credits
+        self.completed += 1
+
+    def reconcile(self, balance: int) -> None:
+        """Update credits spent from the current account credit balance"""
+        if self.initial_balance is None:
+            self.initial_balance = balance
+        else:
+            self.spent = self.initial_balance - balance
@@ -0,0 +1,68 @@
+import json
+from typing import Any, Callable, Dict, Union
+
+
+class JsonCodec:
+    """JSON decoder of API responses
+
+    Profiles returned by the API run to tens of KB, so decoding them is a
+    large part of the CPU time of a bulk job. `orjson` or `ujson` are used
+    when installed, e.g. with the `fast-json` extra, falling back to the
+    standard library.
+    """
+    name: str
+    loads: Callable[[Union[bytes, str]], Any]
+
+    def __init__(self, name: str, loads: Callable[[Union[bytes, str]], Any]) -> None:
+        self.name = name
+        self.loads = loads
+
+    def __repr__(self) -> str:
+        return f'JsonCodec({self.name})'
+
+
+def _orjson() -> JsonCodec:
+    import orjson
+    return JsonCodec('orjson', orjson.loads)
+
+
+def _ujson() -> JsonCodec:
+    import ujson
+    return JsonCodec('ujson', ujson.loads)
+
+
+def _stdlib() -> JsonCodec:
+    return JsonCodec('json', json.loads)
+
+
+# fastest first
+CODECS: Dict[str, Callable[[], JsonCodec]] = {
+    'orjson': _orjson,
+    'ujson': _ujson,
+    'json': _stdlib,
+}
+
+
+def get_codec(codec: Union[str, JsonCodec] = None) -> JsonCodec:
+    """Returns a JSON codec
+
+    :param codec: Name of a codec in :data:`CODECS` or a :class:`JsonCodec`,
+        defaults to the fastest codec installed
+    :type codec: Union[str, JsonCodec]
+    :return: The JSON codec
+    :rtype: :class:`proxycurl.codec.JsonCodec`
+    :raise ValueError: If `codec` is not a known codec name
+    :raise ImportError: If the package of the `codec` is not installed
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec:
+        if codec not in CODECS:
+            raise ValueError(f'unknown JSON codec {codec}, expected one of {", ".join(CODECS)}')
+        return CODECS[codec]()
+    for factory in CODECS.values():
+        try:
+            return factory()
+        except ImportError:
+            continue
+    return _stdlib()
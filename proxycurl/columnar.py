@@ -0,0 +1,213 @@
+from collections.abc import Mapping
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Union, get_type_hints
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from proxycurl.schema import as_dict, get_args, get_origin, is_model, is_object_list, unwrap_optional
+
+# Columnar export of results to Arrow record batches and Parquet files, which requires pyarrow
+# (the `arrow` extra).
+# The Arrow schema of a result is derived from its TypedDict in `proxycurl.models`: nested
+# objects become struct columns and lists of objects, such as the `experiences` of a
+# profile, list-of-struct columns.
+
+_SCALARS = {
+    str: pa.string(),
+    int: pa.int64(),
+    float: pa.float64(),
+    bool: pa.bool_(),
+}
+
+
+def _field_type(owner: str, name: str, hint) -> pa.DataType:
+    hint, optional = unwrap_optional(hint)
+    if is_model(hint):
+        struct = _struct_type(hint)
+        return pa.list_(struct) if is_object_list(owner, name, optional) else struct
+    return _value_type(hint)
+
+
+def _value_type(hint) -> pa.DataType:
+    origin = get_origin(hint)
+    if origin is Union:
+        return _value_type(unwrap_optional(hint)[0])
+    if origin in (list, tuple):
+        args = [arg for arg in get_args(hint) if arg is not Ellipsis]
+        return pa.list_(_value_type(args[0] if args else Any))
+    if is_model(hint):
+        return _struct_type(hint)
+    if isinstance(hint, type) and issubclass(hint, Enum):
+        return pa.string()
+    # fields of unknown type are kept as their string
+    return _SCALARS.get(hint, pa.string())
+
+
+@lru_cache(maxsize=None)
+def _struct_type(model) -> pa.DataType:
+    return pa.struct(list(arrow_schema(model)))
+
+
+@lru_cache(maxsize=None)
+def arrow_schema(result_class) -> pa.Schema:
+    """Returns the Arrow schema of a result class
+
+    :param result_class: Model of the results, e.g. :class:`proxycurl.models.PersonEndpointResponse`
+    :return: The Arrow schema, with a nullable column for every field of the model
+    :rtype: :class:`pyarrow.Schema`
+    """
+    return pa.schema([
+        pa.field(name, _field_type(result_class.__name__, name, hint))
+        for name, hint in get_type_hints(result_class).items()
+    ])
+
+
+def _coercer(data_type: pa.DataType) -> Callable[[Any], Any]:
+    if pa.types.is_struct(data_type):
+        fields = [(field.name, _coercer(field.type)) for field in data_type]
+
+        def coerce_struct(value):
+            if isinstance(value, list):
+                # a list of objects where a single object is expected
+                value = value[0] if value else None
+            if not isinstance(value, Mapping):
+                return None
+            return {name: coerce(value.get(name)) for name, coerce in fields}
+        return coerce_struct
+    if pa.types.is_list(data_type):
+        coerce_item = _coercer(data_type.value_type)
+
+        def coerce_list(value):
+            if value is None:
+                return None
+            if not isinstance(value, (list, tuple)):
+                # a single object where a list is expected
+                value = [value]
+            return [coerce_item(item) for item in value]
+        return coerce_list
+    if pa.types.is_string(data_type):
+        return lambda value: value if value is None or isinstance(value, str) else str(value)
+    if pa.types.is_boolean(data_type):
+        return lambda value: value if value is None or isinstance(value, bool) else None
+    scalar = int if pa.types.is_integer(data_type) else float
+
+    def coerce_number(value):
+        if value is None or isinstance(value, bool):
+            return None
+        if isinstance(value, (int, float)):
+            return value
+        try:
+            return scalar(value)
+        except (TypeError, ValueError):
+            return None
+    return coerce_number
+
+
+@lru_cache(maxsize=None)
+def _row_coercer(schema: pa.Schema) -> Callable[[Any], Dict[str, Any]]:
+    return _coercer(pa.struct(list(schema)))
+
+
+def record_batch(results: List[Any], schema: pa.Schema) -> pa.RecordBatch:
+    """Build a record batch from decoded results
+
+    Results are converted by Arrow in a single pass. Results holding a field
+    of another shape than their model, e.g. a single object in place of a
+    list, are coerced to the schema first.
+    """
+    rows = [as_dict(result) for result in results]
+    try:
+        return pa.RecordBatch.from_pylist(rows, schema=schema)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        coerce = _row_coercer(schema)
+        return pa.RecordBatch.from_pylist([coerce(row) for row in rows], schema=schema)
+
+
+def record_batches(
+    results: Iterable[Any],
+    result_class,
+    batch_size: int = 10000
+) -> Iterator[pa.RecordBatch]:
+    """Turn a stream of results into record batches of up to `batch_size` rows
+
+    :param results: Decoded results, e.g. the values of successful :func:`do_bulk` results
+    :type results: Iterable
+    :param result_class: Model of the results, e.g. :class:`proxycurl.models.PersonEndpointResponse`
+    :param batch_size: Rows of a record batch, defaults to 10000
+    :type batch_size: int
+    :return: Iterator of record batches
+    :rtype: Iterator[:class:`pyarrow.RecordBatch`]
+    """
+    schema = arrow_schema(result_class)
+    rows = []
+    for result in results:
+        rows.append(result)
+        if len(rows) >= batch_size:
+            yield record_batch(rows, schema)
+            rows = []
+    if rows:
+        yield record_batch(rows, schema)
+
+
+class ParquetSink:
+    """Write results to a Parquet file incrementally
+
+    Results are buffered and written as a row group every `row_group_size`
+    results, so that memory stays bounded whatever the number of results::
+
+        with ParquetSink('profiles.parquet', PersonEndpointResponse) as sink:
+            for result in do_bulk(ops):
+                if result.success:
+                    sink.write(result.value)
+    """
+    path: str
+    schema: pa.Schema
+    row_group_size: int
+    rows: int
+
+    def __init__(
+        self,
+        path: str,
+        result_class,
+        row_group_size: int = 10000,
+        compression: str = 'zstd'
+    ) -> None:
+        self.path = path
+        self.schema = arrow_schema(result_class)
+        self.row_group_size = row_group_size
+        self.rows = 0
+        self._buffer = []
+        self._writer = pq.ParquetWriter(path, self.schema, compression=compression)
+
+    def write(self, result) -> None:
+        """Add a decoded result"""
+        self._buffer.append(result)
+        if len(self._buffer) >= self.row_group_size:
+            self.flush()
+
+    def write_results(self, results: Iterable) -> int:
+        """Add the values of successful :class:`Result` of :func:`do_bulk`, returns how many were added"""
+        added = 0
+        for result in results:
+            if result.success and result.value is not None:
+                self.write(result.value)
+                added += 1
+        return added
+
+    def flush(self) -> None:
+        """Write the buffered results as a row group"""
+        if self._buffer:
+            self._writer.write_batch(record_batch(self._buffer, self.schema))
+            self.rows += len(self._buffer)
+            self._buffer = []
+
+    def close(self) -> None:
+        self.flush()
+        self._writer.close()
+
+    def __enter__(self) -> 'ParquetSink':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -10,3 +10,5 @@ TIMEOUT = _("TIMEOUT", 90)
 MAX_RETRIES = _("MAX_RETRIES", 2)
 MAX_BACKOFF_SECONDS = _("MAX_BACKOFF_SECONDS", 60)
 MAX_WORKERS = _("MAX_WORKERS", 10)
+RATE_LIMIT = _("RATE_LIMIT", 300)
+JSON_CODEC = _("JSON_CODEC", "")
@@ -0,0 +1,363 @@
+from typing import Dict, NamedTuple, Optional
+
+
+class ParamCost(NamedTuple):
+    credits: int
+    credits_per_result: int
+
+
+class EndpointCost(NamedTuple):
+    credits: int
+    credits_per_result: int
+    results_key: Optional[str]
+    page_size: Optional[int]
+    enrich_page_size: Optional[int]
+    paginated: bool
+    params: Dict[str, ParamCost]
+
+
+ENDPOINT_COSTS: Dict[str, EndpointCost] = {
+    '/proxycurl/api/linkedin/school': EndpointCost(
+        credits=1,
+        credits_per_result=0,
+        results_key=None,
+        page_size=None,
+        enrich_page_size=None,
+        paginated=False,
+        params={
+            'use_cache': ParamCost(1, 0),
+        }
+    ),
+    '/proxycurl/api/linkedin/company': EndpointCost(
+        credits=1,
+        credits_per_result=0,
+        results_key=None,
+        page_size=None,
+        enrich_page_size=None,
+        paginated=False,
+        params={
+            'resolve_numeric_id': ParamCost(2, 0),
+            'categories': ParamCost(1, 0),
+            'funding_data': ParamCost(1, 0),
+            'extra': ParamCost(1, 0),
+            'exit_data': ParamCost(1, 0),
+            'acquisitions': ParamCost(1, 0),
+            'use_cache': ParamCost(1, 0),
+        }
+    ),
+    '/proxycurl/api/v2/linkedin': EndpointCost(
+        credits=1,
+        credits_per_result=0,
+        results_key=None,
+        page_size=None,
+        enrich_page_size=None,
+        paginated=False,
+        params={
+            'extra': ParamCost(1, 0),
+            'github_profile_id': ParamCost(1, 0),
+            'facebook_profile_id': ParamCost(1, 0),
+            'twitter_profile_id': ParamCost(1, 0),
+            'personal_contact_number': ParamCost(0, 1),
+            'personal_email': ParamCost(0, 1),
+            'inferred_salary': ParamCost(1, 0),
+            'skills': ParamCost(1, 0),
+            'use_cache': ParamCost(1, 0),
+        }
+    ),
+    '/proxycurl/api/customers': EndpointCost(
+        credits=0,
+        credits_per_result=10,
+        results_key='companies',
+        page_size=10,
+        enrich_page_size=None,
+        paginated=True,
+        params={
+        }
+    ),
+    '/proxycurl/api/v2/search/company': EndpointCost(
+        credits=35,
+        credits_per_result=0,
+        results_key='results',
+        page_size=100,
+        enrich_page_size=None,
+        paginated=True,
+        params={
+            'enrich_profiles': ParamCost(0, 1),
+        }
+    ),
+    '/proxycurl/api/linkedin/company/employees': EndpointCost(
+        credits=0,
+        credits_per_result=3,
+        results_key='employees',
+        page_size=10,
+        enrich_page_size=10,
+        paginated=True,
+        params={
+            'country': ParamCost(0, 3),
+            'enrich_profiles': ParamCost(0, 1),
+            'role_search': ParamCost(10, 6),
+            'sort_by': ParamCost(50, 10),
+            'resolve_numeric_id': ParamCost(2, 0),
+        }
+    ),
+    '/proxycurl/api/linkedin/company/employees/count': EndpointCost(
+        credits=1,
+        credits_per_result=0,
+        results_key=None,
+        page_size=None,
+        enrich_page_size=None,
+        paginated=False,
+        params={
+            'use_cache': ParamCost(1, 0),
+            'linkedin_employee_count': ParamCost(1, 0),
+        }
+    ),
+    '/proxycurl/api/linkedin/person/profile-picture': EndpointCost(
+        credits=0,
+        credits_per_result=0,
+        results_key=None,
+        page_size=None,
+        enrich_page_size=None,
+        paginated=False,
+        params={
+        }
+    ),
+    '/proxycurl/api/linkedin/company/profile-picture': EndpointCost(
+        credits=0,
+        credits_per_result=0,
+        results_key=None,
+        page_size=None,
+        enrich_page_size=None,
+        paginated=False,
+        params={
+        }
+    ),
+    '/proxycurl/api/linkedin/profile/resolve': EndpointCost(
+        credits=2,
+        credits_per_result=0,
+        results_key=None,
+        page_size=None,
+        enrich_page_size=None,
+        paginated=False,
+        params={
+            'enrich_profile': ParamCost(1, 0),
+        }
+    ),
+    '/proxycurl/api/v2/linkedin/company/job': EndpointCost(
+        credits=2,
+        credits_per_result=0,
+        results_key='job',
+        page_size=None,
+        enrich_page_size=None,
+        paginated=True,
+        params={
+        }
+    ),
+    '/proxycurl/api/v2/linkedin/company/job/count': EndpointCost(
+        credits=2,
+        credits_per_result=0,
+        results_key=None,
+        page_size=None,
+        enrich_page_size=None,
+        paginated=False,
+        params={
+        }
+    ),
+    '/proxycurl/api/find/company/role': EndpointCost(
+        credits=3,
+        credits_per_result=0,
+        results_key=None,
+        page_size=None,
+        enrich_page_size=None,
+        paginated=False,
+        params={
+            'enrich_profile': ParamCost(1, 0),
+        }
+    ),
+    '/proxycurl/api/linkedin/company/resolve': EndpointCost(
+        credits=2,
+        credits_per_result=0,
+        results_key=None,
+        page_size=None,
+        enrich_page_size=None,
+        paginated=False,
+        params={
+            'enrich_profile': ParamCost(1, 0),
+        }
+    ),
+    '/proxycurl/api/linkedin/company/employee/search': EndpointCost(
+        credits=10,
+        credits_per_result=0,
+        results_key='employees',
+        page_size=200000,
+        enrich_page_size=100,
+        paginated=True,
+        params={
+            'country': ParamCost(0, 3),
+            'enrich_profiles': ParamCost(0, 1),
+            'resolve_numeric_id': ParamCost(2, 0),
+        }
+    ),
+    '/proxycurl/api/linkedin/school/students': EndpointCost(
+        credits=0,
+        credits_per_result=3,
+        results_key='students',
+        page_size=10,
+        enrich_page_size=10,
+        paginated=True,
+        params={
+            'country': ParamCost(0, 3),
+            'enrich_profiles': ParamCost(0, 1),
+            'search_keyword': ParamCost(10, 6),
+            'sort_by': ParamCost(50, 10),
+            'resolve_numeric_id': ParamCost(2, 0),
+        }
+    ),
+    '/proxycurl/api/linkedin/profile/resolve/email': EndpointCost(
+        credits=3,
+        credits_per_result=0,
+        results_key=None,
+        page_size=None,
+        enrich_page_size=None,
+        paginated=False,
+        params={
+            'enrich_profile': ParamCost(1, 0),
+        }
+    ),
+    '/proxycurl/api/resolve/phone': EndpointCost(
+        credits=3,
+        credits_per_result=0,
+        results_key=None,
+        page_size=None,
+        enrich_page_size=None,
+        paginated=False,
+        params={
+        }
+    ),
+    '/proxycurl/api/linkedin/profile/email': EndpointCost(
+        credits=3,
+        credits_per_result=0,
+        results_key=None,
+        page_size=None,
+        enrich_page_size=None,
+        paginated=False,
+        params={
+        }
+    ),
+    '/proxycurl/api/v2/search/person': EndpointCost(
+        credits=35,
+        credits_per_result=0,
+        results_key='results',
+        page_size=100,
+        enrich_page_size=None,
+        paginated=True,
+        params={
+            'enrich_profiles': ParamCost(0, 1),
+        }
+    ),
+    '/proxycurl/api/linkedin/job': EndpointCost(
+        credits=2,
+        credits_per_result=0,
+        results_key=None,
+        page_size=None,
+        enrich_page_size=None,
+        paginated=False,
+        params={
+        }
+    ),
+    '/proxycurl/api/credit-balance': EndpointCost(
+        credits=0,
+        credits_per_result=0,
+        results_key=None,
+        page_size=None,
+        enrich_page_size=None,
+        paginated=False,
+        params={
+        }
+    ),
+    '/proxycurl/api/disposable-email': EndpointCost(
+        credits=0,
+        credits_per_result=0,
+        results_key=None,
+        page_size=None,
+        enrich_page_size=None,
+        paginated=False,
+        params={
+        }
+    ),
+    '/proxycurl/api/contact-api/personal-contact': EndpointCost(
+        credits=0,
+        credits_per_result=1,
+        results_key='numbers',
+        page_size=0,
+        enrich_page_size=None,
+        paginated=False,
+        params={
+        }
+    ),
+    '/proxycurl/api/contact-api/personal-email': EndpointCost(
+        credits=0,
+        credits_per_result=1,
+        results_key='emails',
+        page_size=0,
+        enrich_page_size=None,
+        paginated=False,
+        params={
+            'email_validation': ParamCost(0, 1),
+        }
+    ),
+}
+
+OPERATIONS: Dict[str, str] = {
+    '_LinkedinPerson.get': '/proxycurl/api/v2/linkedin',
+    '_LinkedinPerson.search': '/proxycurl/api/v2/search/person',
+    '_LinkedinPerson.resolve': '/proxycurl/api/linkedin/profile/resolve',
+    '_LinkedinPerson.resolve_by_email': '/proxycurl/api/linkedin/profile/resolve/email',
+    '_LinkedinPerson.resolve_by_phone': '/proxycurl/api/resolve/phone',
+    '_LinkedinPerson.lookup_email': '/proxycurl/api/linkedin/profile/email',
+    '_LinkedinPerson.personal_contact': '/proxycurl/api/contact-api/personal-contact',
+    '_LinkedinPerson.personal_email': '/proxycurl/api/contact-api/personal-email',
+    '_LinkedinPerson.profile_picture': '/proxycurl/api/linkedin/person/profile-picture',
+    '_LinkedinCompany.get': '/proxycurl/api/linkedin/company',
+    '_LinkedinCompany.search': '/proxycurl/api/v2/search/company',
+    '_LinkedinCompany.resolve': '/proxycurl/api/linkedin/company/resolve',
+    '_LinkedinCompany.find_job': '/proxycurl/api/v2/linkedin/company/job',
+    '_LinkedinCompany.job_count': '/proxycurl/api/v2/linkedin/company/job/count',
+    '_LinkedinCompany.employee_count': '/proxycurl/api/linkedin/company/employees/count',
+    '_LinkedinCompany.employee_list': '/proxycurl/api/linkedin/company/employees',
+    '_LinkedinCompany.employee_search': '/proxycurl/api/linkedin/company/employee/search',
+    '_LinkedinCompany.role_lookup': '/proxycurl/api/find/company/role',
+    '_LinkedinCompany.profile_picture': '/proxycurl/api/linkedin/company/profile-picture',
+    '_LinkedinSchool.get': '/proxycurl/api/linkedin/school',
+    '_LinkedinSchool.student_list': '/proxycurl/api/linkedin/school/students',
+    '_LinkedinJob.get': '/proxycurl/api/linkedin/job',
+    '_LinkedinCustomers.listing': '/proxycurl/api/customers',
+    'Proxycurl.get_balance': '/proxycurl/api/credit-balance',
+}
+
+NAMED_OPERATIONS: Dict[str, str] = {
+    'linkedin.person.get': '/proxycurl/api/v2/linkedin',
+    'linkedin.person.search': '/proxycurl/api/v2/search/person',
+    'linkedin.person.resolve': '/proxycurl/api/linkedin/profile/resolve',
+    'linkedin.person.resolve_by_email': '/proxycurl/api/linkedin/profile/resolve/email',
+    'linkedin.person.resolve_by_phone': '/proxycurl/api/resolve/phone',
+    'linkedin.person.lookup_email': '/proxycurl/api/linkedin/profile/email',
+    'linkedin.person.personal_contact': '/proxycurl/api/contact-api/personal-contact',
+    'linkedin.person.personal_email': '/proxycurl/api/contact-api/personal-email',
+    'linkedin.person.profile_picture': '/proxycurl/api/linkedin/person/profile-picture',
+    'linkedin.company.get': '/proxycurl/api/linkedin/company',
+    'linkedin.company.search': '/proxycurl/api/v2/search/company',
+    'linkedin.company.resolve': '/proxycurl/api/linkedin/company/resolve',
+    'linkedin.company.find_job': '/proxycurl/api/v2/linkedin/company/job',
+    'linkedin.company.job_count': '/proxycurl/api/v2/linkedin/company/job/count',
+    'linkedin.company.employee_count': '/proxycurl/api/linkedin/company/employees/count',
+    'linkedin.company.employee_list': '/proxycurl/api/linkedin/company/employees',
+    'linkedin.company.employee_search': '/proxycurl/api/linkedin/company/employee/search',
+    'linkedin.company.role_lookup': '/proxycurl/api/find/company/role',
+    'linkedin.company.profile_picture': '/proxycurl/api/linkedin/company/profile-picture',
+    'linkedin.school.get': '/proxycurl/api/linkedin/school',
+    'linkedin.school.student_list': '/proxycurl/api/linkedin/school/students',
+    'linkedin.job.get': '/proxycurl/api/linkedin/job',
+    'linkedin.customers.listing': '/proxycurl/api/customers',
+    'get_balance': '/proxycurl/api/credit-balance',
+}
\ No newline at end of file
@@ -0,0 +1,118 @@
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+# outputs of a record: the input record under `record` and the response of every finished stage
+Context = Dict[str, Any]
+
+
+@dataclass
+class Stage:
+    """One step of an enrichment flow
+
+    :param name: Name of the stage, its response is found under this key of the context
+    :type name: str
+    :param operation: Library method called by the stage, e.g. `linkedin.person.get`
+    :type operation: str
+    :param params: Returns the parameters of `operation` from the context of a record,
+        or **None** to skip the stage
+    :type params: Callable[[Dict[str, Any]], Optional[Dict]]
+    :param requires: Names of the stages whose responses `params` needs,
+        the stage is skipped when one of them returned nothing
+    :type requires: Tuple[str, ...]
+    """
+    name: str
+    operation: str
+    params: Callable[[Context], Optional[Dict]]
+    requires: Tuple[str, ...] = ()
+
+
+def _profile_params(context: Context) -> Optional[Dict]:
+    url = context['resolve'].get('url')
+    return {'linkedin_profile_url': url} if url else None
+
+
+# resolve a lead from its name and company domain, then fetch its profile and personal contacts
+LEAD_STAGES = [
+    Stage(
+        'resolve',
+        'linkedin.person.resolve',
+        lambda context: {
+            'first_name': context['record']['first_name'],
+            'last_name': context['record'].get('last_name'),
+            'company_domain': context['record']['company_domain'],
+        },
+    ),
+    Stage('profile', 'linkedin.person.get', _profile_params, requires=('resolve',)),
+    Stage('personal_email', 'linkedin.person.personal_email', _profile_params, requires=('resolve', 'profile')),
+    Stage('personal_contact', 'linkedin.person.personal_contact', _profile_params, requires=('resolve', 'profile')),
+]
+
+
+def check_stages(stages: List[Stage]) -> None:
+    """Raise :class:`ValueError` unless every stage only requires stages listed before it"""
+    names = set()
+    for stage in stages:
+        if stage.name in names or stage.name == 'record':
+            raise ValueError(f'duplicate stage name {stage.name}')
+        for name in stage.requires:
+            if name not in names:
+                raise ValueError(f'stage {stage.name} requires {name}, which is not listed before it')
+        names.add(stage.name)
+
+
+def resolve_operation(client, operation: str) -> Callable:
+    """Returns the method of `client` for an operation name such as `linkedin.person.get`"""
+    method = client
+    for attribute in operation.split('.'):
+        method = getattr(method, attribute)
+    return method
+
+
+def is_empty(response) -> bool:
+    """Whether a stage yielded nothing, e.g. a `resolve` response without `url`"""
+    if isinstance(response, Mapping):
+        return all(is_empty(value) for value in response.values())
+    return response is None or response == [] or response == ''
+
+
+def stage_params(stage: Stage, context: Context) -> Optional[Dict]:
+    """Parameters of a stage, or **None** when the stage is short-circuited"""
+    if any(is_empty(context.get(name)) for name in stage.requires):
+        return None
+    params = stage.params(context)
+    if params is None:
+        return None
+    return {key: value for key, value in params.items() if value is not None}
+
+
+class ResponseCache:
+    """Responses shared by the records of an enrichment flow
+
+    Identical calls, e.g. the same profile resolved for two records, are
+    only sent once. The least recently used response is dropped once
+    `max_size` responses are cached.
+    """
+    max_size: int
+    responses: 'OrderedDict[Hashable, Any]'
+
+    def __init__(self, max_size: int = 10000) -> None:
+        self.max_size = max_size
+        self.responses = OrderedDict()
+
+    @staticmethod
+    def key(operation: str, params: Dict) -> Hashable:
+        return operation, tuple(sorted((name, str(value)) for name, value in params.items()))
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        if key not in self.responses:
+            return False, None
+        self.responses.move_to_end(key)
+        return True, self.responses[key]
+
+    def set(self, key: Hashable, response) -> None:
+        self.responses[key] = response
+        self.responses.move_to_end(key)
+        while len(self.responses) > self.max_size:
+            self.responses.popitem(last=False)
@@ -0,0 +1,136 @@
+from typing import Dict, Iterable, Mapping, Optional, Tuple, Type, Union
+
+# Exceptions raised by the clients of every backend. The class of an exception tells the status of
+# the response apart, and its attributes record the request, so that retry logic, circuit breakers
+# and metrics branch on them rather than on the message, which is the body of the response.
+
+
+class ProxycurlException(Exception):
+    """Raised when InternalServerError or network error or request error
+
+    :param message: Body of the response, or a description of the error
+    :type message: str
+    :param status_code: HTTP status of the response
+    :type status_code: int
+    :param endpoint: API endpoint of the request, without its query
+    :type endpoint: str
+    :param attempts: Requests sent before giving up, retries included
+    :type attempts: int
+    :param elapsed: Seconds from the first attempt to the error, backoffs included
+    :type elapsed: float
+    :param rate_limit: Rate limit headers of the response, e.g. `retry-after`, by lowercase name
+    :type rate_limit: Dict[str, str]
+    """
+    status_code: Optional[int]
+    endpoint: Optional[str]
+    attempts: int
+    elapsed: float
+    rate_limit: Dict[str, str]
+
+    def __init__(
+        self,
+        message: str,
+        status_code: int = None,
+        endpoint: str = None,
+        attempts: int = 1,
+        elapsed: float = 0.0,
+        rate_limit: Dict[str, str] = None
+    ) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.endpoint = endpoint
+        self.attempts = attempts
+        self.elapsed = elapsed
+        self.rate_limit = rate_limit or {}
+
+    @property
+    def retry_after(self) -> Optional[float]:
+        """Seconds to wait before retrying according to the `retry-after` header, if any"""
+        try:
+            return float(self.rate_limit['retry-after'])
+        except (KeyError, ValueError):
+            return None
+
+
+class BadRequest(ProxycurlException):
+    """The parameters of the request are invalid (400)"""
+
+
+class Unauthorized(ProxycurlException):
+    """The API key is invalid (401)"""
+
+
+class OutOfCredits(ProxycurlException):
+    """The API key has run out of credits (403)"""
+
+
+class NotFound(ProxycurlException):
+    """The requested entity does not exist (404)"""
+
+
+class RateLimited(ProxycurlException):
+    """The API key exceeded its rate limit (429)"""
+
+
+class ServerError(ProxycurlException):
+    """The API failed to serve the request (5xx)"""
+
+
+class PageInterrupted(ProxycurlException):
+    """The body of a streamed page stopped after some of its items were returned"""
+
+
+STATUS_EXCEPTIONS: Dict[int, Type[ProxycurlException]] = {
+    400: BadRequest,
+    401: Unauthorized,
+    403: OutOfCredits,
+    404: NotFound,
+    429: RateLimited,
+}
+
+
+def rate_limit_headers(headers: Union[Mapping[str, str], Iterable[Tuple[str, str]]]) -> Dict[str, str]:
+    """Returns the `retry-after` and `x-ratelimit-*` headers, by lowercase name"""
+    items = headers.items() if isinstance(headers, Mapping) else headers
+    rate_limit = {}
+    for name, value in items:
+        name = name.lower()
+        if name == 'retry-after' or name.startswith('x-ratelimit'):
+            rate_limit[name] = value
+    return rate_limit
+
+
+def response_error(
+    message: str,
+    status_code: int,
+    url: str,
+    attempts: int = 1,
+    elapsed: float = 0.0,
+    headers: Union[Mapping[str, str], Iterable[Tuple[str, str]]] = ()
+) -> ProxycurlException:
+    """Returns the exception of a failed response, of the class of its status
+
+    :param message: Body of the response
+    :type message: str
+    :param status_code: HTTP status of the response
+    :type status_code: int
+    :param url: API endpoint or URL of the request, its query is dropped
+    :type url: str
+    :param attempts: Requests sent, retries included
+    :type attempts: int
+    :param elapsed: Seconds since the first attempt
+    :type elapsed: float
+    :param headers: Headers of the response
+    :rtype: :class:`ProxycurlException`
+    """
+    exception_class = STATUS_EXCEPTIONS.get(status_code)
+    if exception_class is None:
+        exception_class = ServerError if status_code >= 500 else ProxycurlException
+    return exception_class(
+        message,
+        status_code=status_code,
+        endpoint=url.split('?', 1)[0],
+        attempts=attempts,
+        elapsed=elapsed,
+        rate_limit=rate_limit_headers(headers),
+    )
@@ -0,0 +1,231 @@
+import csv
+import json
+from collections.abc import Mapping
+from enum import Enum
+from functools import lru_cache
+from typing import IO, Any, Callable, Iterable, Iterator, List, Tuple, Union, get_type_hints
+
+from proxycurl.schema import as_dict, get_args, get_origin, is_model, is_object_list, unwrap_optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Flattening of results into tabular rows, e.g. for CSV files. The columns of a result class are
+# derived once from its TypedDict in `proxycurl.models`, and compiled into a function building the
+# rows of a result with a fixed sequence of lookups: nested objects become dotted columns such as
+# `birth_date.year`, lists of scalars are joined, and the other lists of objects are kept as JSON
+# unless they are exploded into one row per object.
+
+_SCALARS = (str, int, float, bool)
+
+# nesting of single objects flattened into columns, deeper objects are kept as JSON
+_MAX_DEPTH = 4
+
+_EMPTY = {}
+
+
+def _one(value) -> Mapping:
+    if isinstance(value, Mapping):
+        return value
+    if isinstance(value, list):
+        # a list of objects where a single object is expected
+        return value[0] if value and isinstance(value[0], Mapping) else _EMPTY
+    return _EMPTY
+
+
+def _many(value) -> list:
+    if isinstance(value, list):
+        return [item for item in value if isinstance(item, Mapping)]
+    # a single object where a list is expected
+    return [value] if isinstance(value, Mapping) else []
+
+
+def _join(value, separator: str):
+    if isinstance(value, (list, tuple)):
+        return separator.join(str(item) for item in value if item is not None)
+    return value
+
+
+def _json(value):
+    if value is None or value == [] or value == {}:
+        return None
+    if isinstance(value, (list, dict)):
+        if orjson is not None:
+            return orjson.dumps(value).decode()
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+    return value
+
+
+class _Compiler:
+    def __init__(self, explode: str = None) -> None:
+        self.explode = explode
+        self.columns = []
+        self.lines = []
+        self.cells = []
+        # the source and model of the exploded list, once found
+        self.exploded = None
+
+    def variable(self, expression: str) -> str:
+        name = f'v{len(self.lines)}'
+        self.lines.append(f'{name} = {expression}')
+        return name
+
+    def model(self, model, source: str, prefix: str, depth: int) -> None:
+        for name, hint in get_type_hints(model).items():
+            column = prefix + name
+            value = f'{source}.get({name!r})'
+            hint, optional = unwrap_optional(hint)
+            if is_model(hint):
+                if column == self.explode:
+                    self.exploded = (value, hint)
+                elif is_object_list(model.__name__, name, optional) or depth >= _MAX_DEPTH:
+                    self.cell(column, f'_json({value})')
+                else:
+                    # also where a nested exploded list, e.g. `profile.experiences`, is found
+                    self.model(hint, self.variable(f'_one({value})'), column + '.', depth + 1)
+            elif get_origin(hint) in (list, tuple):
+                args = [arg for arg in get_args(hint) if arg is not Ellipsis]
+                if args and is_model(unwrap_optional(args[0])[0]):
+                    self.cell(column, f'_json({value})')
+                else:
+                    self.cell(column, f'_join({value}, separator)')
+            elif hint in _SCALARS or isinstance(hint, type) and issubclass(hint, Enum):
+                self.cell(column, value)
+            else:
+                # fields of unknown type may hold objects
+                self.cell(column, f'_json({value})')
+
+    def cell(self, column: str, expression: str) -> None:
+        self.columns.append(column)
+        self.cells.append(expression)
+
+
+def _tuple(cells: List[str]) -> str:
+    return f'({", ".join(cells)},)' if cells else '()'
+
+
+@lru_cache(maxsize=None)
+def _compile(result_class, explode: str, separator: str) -> Tuple[Tuple[str, ...], Callable[[Any], List[tuple]]]:
+    parent = _Compiler(explode)
+    parent.model(result_class, 'result', '', 0)
+    source = ['def rows(result):']
+    source += [f'    {line}' for line in parent.lines]
+    columns = parent.columns
+    if explode is None:
+        source.append(f'    return [{_tuple(parent.cells)}]')
+    else:
+        if parent.exploded is None:
+            raise ValueError(f'{explode} is not a list of objects of {result_class.__name__}')
+        value, model = parent.exploded
+        item = _Compiler()
+        item.model(model, 'item', explode + '.', 1)
+        columns = columns + item.columns
+        source += [
+            f'    parent = {_tuple(parent.cells)}',
+            f'    items = _many({value})',
+            '    if not items:',
+            f'        return [parent + {_tuple(["None"] * len(item.columns))}]',
+            '    rows = []',
+            '    for item in items:',
+        ]
+        source += [f'        {line}' for line in item.lines]
+        source.append(f'        rows.append(parent + {_tuple(item.cells)})')
+        source.append('    return rows')
+    namespace = {'_one': _one, '_many': _many, '_join': _join, '_json': _json, 'separator': separator}
+    exec(compile('\n'.join(source), f'<flatten {result_class.__name__}>', 'exec'), namespace)
+    return tuple(columns), namespace['rows']
+
+
+class Flattener:
+    """Flatten results into rows of their columns
+
+    Columns are derived from the model of the results and compiled into a
+    single function, so a result is flattened in one pass without inspecting
+    its fields. Nested objects become dotted columns (`birth_date.year`),
+    lists of scalars are joined with `separator`, and lists of objects are
+    kept as JSON, except for `explode` which gives one row per object::
+
+        flattener = Flattener(PersonEndpointResponse, explode='experiences')
+        rows = flattener.flatten(profiles)
+
+    :param result_class: Model of the results, e.g. :class:`proxycurl.models.PersonEndpointResponse`
+    :param explode: Dotted path of a list of objects flattened into one row per object, e.g. `experiences`
+    :type explode: str
+    :param separator: Separator of the items of lists of scalars, defaults to `'; '`
+    :type separator: str
+    :raise ValueError: If `explode` is not a list of objects of the model
+    """
+    result_class: Any
+    explode: str
+    columns: Tuple[str, ...]
+
+    def __init__(self, result_class, explode: str = None, separator: str = '; ') -> None:
+        self.result_class = result_class
+        self.explode = explode
+        self.columns, self._rows = _compile(result_class, explode, separator)
+
+    def rows(self, result) -> List[tuple]:
+        """Returns the rows of a result, one unless `explode` is set"""
+        return self._rows(as_dict(result))
+
+    def flatten(self, results: Iterable) -> Iterator[tuple]:
+        """Returns the rows of every result"""
+        rows = self._rows
+        for result in results:
+            yield from rows(as_dict(result))
+
+
+class CsvSink:
+    """Write results to a CSV file as they are received
+
+    The header holds the columns of :class:`Flattener`, and every result is
+    written as soon as it is added::
+
+        with CsvSink('experiences.csv', PersonEndpointResponse, explode='experiences') as sink:
+            sink.write_results(await do_bulk(ops))
+
+    :param file: Path of the file, or a text file opened with `newline=''`
+    :type file: Union[str, IO[str]]
+    :param result_class: Model of the results, e.g. :class:`proxycurl.models.PersonEndpointResponse`
+    :param explode: Dotted path of a list of objects written as one row per object, e.g. `experiences`
+    :type explode: str
+    """
+    flattener: Flattener
+    rows: int
+
+    def __init__(self, file: Union[str, IO[str]], result_class, explode: str = None, **kwargs) -> None:
+        self.flattener = Flattener(result_class, explode, **kwargs)
+        self.rows = 0
+        self._close = isinstance(file, str)
+        self._file = open(file, 'w', newline='', encoding='utf-8') if self._close else file
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.flattener.columns)
+
+    def write(self, result) -> None:
+        """Add a decoded result"""
+        rows = self.flattener.rows(result)
+        self._writer.writerows(rows)
+        self.rows += len(rows)
+
+    def write_results(self, results: Iterable) -> int:
+        """Add the values of successful :class:`Result` of :func:`do_bulk`, returns how many were added"""
+        added = 0
+        for result in results:
+            if result.success and result.value is not None:
+                self.write(result.value)
+                added += 1
+        return added
+
+    def close(self) -> None:
+        if self._close:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self) -> 'CsvSink':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -2,18 +2,55 @@ import gevent
 from gevent import monkey
 monkey.patch_all()
 from gevent.queue import Empty, Queue
+from collections import deque
 from proxycurl.config import MAX_WORKERS
+from proxycurl.codec import JsonCodec, get_codec
+from proxycurl.costs import NAMED_OPERATIONS
+from proxycurl.errors import PageInterrupted, ProxycurlException, response_error
+from proxycurl.enrichment import (
+    LEAD_STAGES,
+    ResponseCache,
+    Stage,
+    check_stages,
+    resolve_operation,
+    stage_params
+)
+from proxycurl.keys import ApiKey, KeyPool
+from proxycurl.lazy import LazyResponse
+from proxycurl.metrics import NO_SPAN, AttemptEvent, MetricsHook, endpoint_path, operation_metrics
+from proxycurl.models import CreditBalance
+from proxycurl.pagination import CursorStore, page_fields, page_url
+from proxycurl.projection import Projection, get_projection
+from proxycurl.raw import RawResponse
+from proxycurl.results import ResultError, ResultStore
+from proxycurl.streaming import CHUNK_SIZE, PageStream
+from proxycurl.interning import InternTable, intern_response
+from proxycurl.validation import validate_response
+from proxycurl.budget import (
+    CreditBudget,
+    CreditBudgetExceeded,
+    estimate_cost,
+    estimate_op_cost,
+    op_cost,
+    operation_client,
+    operation_endpoint,
+    response_cost
+)
 import requests
 from dataclasses import dataclass
 from typing import (
+    Any,
     Generic,
+    Iterator,
     TypeVar,
     List,
     Tuple,
     Callable,
-    Dict
+    Dict,
+    Union
 )
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -23,36 +60,62 @@ Op = Tuple[Callable, Dict]
 
 @dataclass
 class Result(Generic[T]):
+    __slots__ = ('success', 'value', 'error')
     success: bool
     value: T
-    error: BaseException
-
-
-class ProxycurlException(Exception):
-    """Raised when InternalServerError or network error or request error"""
-    pass
+    # a :class:`proxycurl.results.ResultError` unless the exception itself is kept
+    error: Union[BaseException, ResultError]
 
 
 class ProxycurlBase:
-    api_key: str
+    api_key: Union[str, List[str]]
     base_url: str
     timeout: int
     max_retries: int
     max_backoff_seconds: int
+    rate_limit: int
+    key_pool: KeyPool
 
     def __init__(
         self,
-        api_key: str,
+        api_key: Union[str, List[str]],
         base_url: str,
         timeout: int,
         max_retries: int,
-        max_backoff_seconds: int
+        max_backoff_seconds: int,
+        rate_limit: int = None,
+        json_codec: Union[str, JsonCodec] = None,
+        raw: bool = False,
+        lazy: bool = False,
+        structs: bool = False,
+        validate: bool = False,
+        intern: Union[bool, InternTable] = False,
+        metrics: MetricsHook = None
     ) -> None:
         self.api_key = api_key
         self.base_url = base_url
         self.timeout = timeout
         self.max_retries = max_retries
         self.max_backoff_seconds = max_backoff_seconds
+        self.rate_limit = rate_limit
+        self.key_pool = KeyPool(api_key, rate_limit)
+        self.json_codec = get_codec(json_codec)
+        self.raw = raw
+        self.lazy = lazy
+        self.validate = validate
+        self.intern_table = None
+        if isinstance(intern, InternTable):
+            # a table is empty, so falsy, until values are interned
+            self.intern_table = intern
+        elif intern:
+            # the values are shared by the results of this client, and released with it
+            self.intern_table = InternTable()
+        self.metrics = metrics
+        self.struct_models = None
+        if structs:
+            # msgspec, installed by the `structs` extra, is only required for struct models
+            from proxycurl import structs as struct_models
+            self.struct_models = struct_models
 
     def request(
         self,
@@ -61,11 +124,25 @@ class ProxycurlBase:
         result_class: Generic[T],
         params: dict = dict(),
         data: dict = dict(),
+        api_key: ApiKey = None,
+        fields: Union[List[str], Projection] = None
     ) -> Generic[T]:
-        api_endpoint = f'{self.base_url}{url}'
-        header_dic = {'Authorization': 'Bearer ' + self.api_key}
+        if url.startswith('http'):
+            # e.g. the `next_page` URL of a paginated result
+            api_endpoint = url
+        else:
+            api_endpoint = f'{self.base_url}{url}'
         backoff_in_seconds = 1
+        started = time.monotonic()
+        metrics = self.metrics
         for i in range(0, self.max_retries):
+            event = AttemptEvent(method, endpoint_path(url, self.base_url), i + 1) if metrics is not None else None
+            key = self._acquire_key(api_key)
+            if event is not None:
+                event.key_acquired()
+                metrics.on_attempt_start(event)
+            error = None
+            header_dic = {'Authorization': 'Bearer ' + key.key}
             try:
                 if method.lower() == 'get':
                     r = requests.get(
@@ -80,37 +157,433 @@ class ProxycurlBase:
                             headers=header_dic,
                             timeout=self.timeout)
 
+                if event is not None:
+                    # the body is read by `requests` before it returns
+                    event.headers_received(r.status_code, ttfb=r.elapsed.total_seconds())
+                    event.body_received(len(r.content))
                 if r.status_code in [200, 202]:
-                    response_json = r.json()
-                    try:
-                        return result_class(**response_json)
-                    except Exception:
+                    if self.raw:
+                        return RawResponse(r.content, r.status_code, r.url, dict(r.headers))
+                    if fields is not None:
+                        # only the requested fields are decoded
+                        response_json = get_projection(fields, url).decode(r.content, self.json_codec)
+                        if self.intern_table is not None:
+                            intern_response(result_class, response_json, self.intern_table)
+                        if self.validate:
+                            validate_response(result_class, response_json)
                         return response_json
+                    if self.lazy:
+                        return LazyResponse(r.content, self.json_codec)
+                    if self.struct_models is not None:
+                        try:
+                            return self.struct_models.decoder(result_class.__name__).decode(r.content)
+                        except Exception as e:
+                            # a response which does not match its struct, e.g. a field of
+                            # an unexpected type, is returned as a dictionary instead
+                            logger.warning(
+                                'Could not decode %s into its struct, returning a dictionary: %s',
+                                result_class.__name__, e
+                            )
+                    response_json = self.json_codec.loads(r.content)
+                    if self.intern_table is not None:
+                        intern_response(result_class, response_json, self.intern_table)
+                    if self.validate:
+                        validate_response(result_class, response_json)
+                    # the models are TypedDicts, so the decoded dict is returned as is
+                    return response_json
                 else:
-                    raise ProxycurlException(r.text)
+                    raise response_error(
+                        r.text,
+                        r.status_code,
+                        url,
+                        attempts=i + 1,
+                        elapsed=time.monotonic() - started,
+                        headers=r.headers
+                    )
 
             except ProxycurlException as e:
+                error = e
+                if r.status_code == 403 and api_key is None and len(self.key_pool) > 1:
+                    # the key is out of credits, retry with another key
+                    self.key_pool.set_balance(key, 0)
+                    if self.key_pool.has_credits and i + 1 < self.max_retries:
+                        continue
+
                 if r.status_code in [400, 401, 403, 404]:
                     logger.exception(str(e))
                     raise e
 
                 if r.status_code == 500:
-                    if i < 1:
+                    if i < 1 and i + 1 < self.max_retries:
                         continue
                     else:
                         raise e
 
                 if r.status_code == 429:
                     sleep = (backoff_in_seconds * 2 ** i)
-                    gevent.sleep(min(self.max_backoff_seconds, sleep))
+                    self.key_pool.backoff(key, min(self.max_backoff_seconds, sleep))
 
-                if i < self.max_retries:
+                if i + 1 < self.max_retries:
                     continue
+                raise e
+            finally:
+                self.key_pool.release(key)
+                if event is not None:
+                    metrics.on_attempt(event.finish(error))
+
+    def _acquire_key(self, pinned: ApiKey = None) -> ApiKey:
+        while True:
+            key, wait = self.key_pool.acquire(pinned)
+            if not wait:
+                return key
+            gevent.sleep(wait)
+
+    def decoded(self, response):
+        """Decode a :class:`proxycurl.raw.RawResponse` or struct returned by a client created with
+        `raw=True` or `structs=True` into the dictionary of its result class"""
+        if isinstance(response, RawResponse):
+            return response.json(self.json_codec)
+        if self.struct_models is not None and hasattr(response, '__struct_fields__'):
+            return self.struct_models.to_builtins(response)
+        return response
+
+    def refresh_balances(self) -> int:
+        """Fetch the credit balance of every API key
+
+        :return: Total credit balance of all API keys
+        :rtype: int
+        """
+        for key in self.key_pool.keys:
+            balance = self.request(
+                method='GET',
+                url=NAMED_OPERATIONS['get_balance'],
+                result_class=CreditBalance,
+                api_key=key
+            )
+            self.key_pool.set_balance(key, self.decoded(balance)['credit_balance'])
+        return self.key_pool.balance
+
+    def paginate(
+        self,
+        first_page: Callable,
+        params: dict,
+        url: str,
+        result_class: Generic[T],
+        items_key: str,
+        max_results: int = None,
+        max_credits: int = None,
+        prefetch: bool = True,
+        cursor: CursorStore = None,
+        stream: bool = False
+    ) -> Iterator:
+        """Stream the items of a paginated endpoint across pages
+
+        The `next_page` URL of every page is followed until the last page, and
+        with `prefetch` the next page is requested in a greenlet while the
+        items of the current page are being consumed. With `stream` the items
+        of a page are returned as its body is received instead, see :meth:`stream_page`.
+
+        :param first_page: Library method fetching the first page
+        :type first_page: Callable
+        :param params: Parameters of the first page
+        :type params: dict
+        :param url: API endpoint, used to estimate the credits of a page
+        :type url: str
+        :param result_class: Result class of a page
+        :param items_key: Key of the items in a page
+        :type items_key: str
+        :param max_results: Stop after this many items, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Do not fetch a page which would be estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :param prefetch: Fetch the next page while the current page is consumed, defaults to **True**
+        :type prefetch: bool
+        :param cursor: Resume from the page saved in this store and save the next page to it
+            once the current page is consumed, defaults to **None**
+        :type cursor: :class:`proxycurl.pagination.CursorStore`
+        :param stream: Parse pages incrementally, one page at a time, defaults to **False**
+        :type stream: bool
+        :return: Iterator of the items of every page
+        :rtype: Iterator
+        """
+        if stream:
+            yield from self._paginate_stream(params, url, result_class, items_key, max_results, max_credits, cursor)
+            return
+        params = dict(params)
+        fields = page_fields(params.pop('fields', None), items_key, ['next_page'])
+        results = 0
+        credits = 0
+        resume_url = cursor.load() if cursor is not None else None
+        if resume_url:
+            next_page = gevent.spawn(self.request, 'GET', resume_url, result_class, fields=fields)
+        else:
+            next_page = gevent.spawn(first_page, **params, fields=fields)
+        try:
+            while next_page is not None:
+                page = self.decoded(next_page.get())
+                next_page = None
+                items = page.get(items_key) or []
+                credits += response_cost(url, params, page)
+                next_url = None
+                if (
+                    page.get('next_page')
+                    and items
+                    and (max_results is None or results + len(items) < max_results)
+                    and (max_credits is None or credits + estimate_cost(url, params) <= max_credits)
+                ):
+                    next_url = page['next_page']
+                if next_url and prefetch:
+                    next_page = gevent.spawn(self.request, 'GET', next_url, result_class, fields=fields)
+
+                for item in items:
+                    if max_results is not None and results >= max_results:
+                        return
+                    results += 1
+                    yield item
+
+                if cursor is not None:
+                    if page.get('next_page'):
+                        cursor.save(page['next_page'])
+                    else:
+                        cursor.clear()
+
+                if next_url and not prefetch:
+                    next_page = gevent.spawn(self.request, 'GET', next_url, result_class, fields=fields)
+        finally:
+            if next_page is not None:
+                next_page.kill()
+
+    def stream_page(
+        self,
+        url: str,
+        result_class: Generic[T],
+        stream: PageStream,
+        params: dict = dict()
+    ) -> Iterator:
+        """Stream the items of a page as its body is received
+
+        The body is fed to `stream`, which decodes every item as soon as it is
+        complete, so that about one item of the page is held in memory and the
+        first item is returned before the body finishes. The rest of the page
+        is found in `stream.page` once every item was returned.
+        A page which fails before its first item is requested again with
+        :meth:`request`, which retries it or raises its error.
+
+        :param url: API endpoint or `next_page` URL
+        :type url: str
+        :param result_class: Result class of the page
+        :param stream: Parser of the page
+        :type stream: :class:`proxycurl.streaming.PageStream`
+        :param params: Parameters of the page
+        :type params: dict
+        :return: Iterator of the items of the page
+        :rtype: Iterator
+        :raise proxycurl.errors.PageInterrupted: If the connection is lost once items were returned
+        """
+        api_endpoint = url if url.startswith('http') else f'{self.base_url}{url}'
+        metrics = self.metrics
+        event = AttemptEvent('GET', endpoint_path(url, self.base_url), 1) if metrics is not None else None
+        key = self._acquire_key()
+        if event is not None:
+            event.key_acquired()
+            metrics.on_attempt_start(event)
+        error = None
+        try:
+            with requests.get(
+                api_endpoint,
+                params=params,
+                headers={'Authorization': 'Bearer ' + key.key},
+                timeout=self.timeout,
+                stream=True
+            ) as r:
+                if event is not None:
+                    event.headers_received(r.status_code, ttfb=r.elapsed.total_seconds())
+                if r.status_code == 200:
+                    size = 0
+                    for chunk in r.iter_content(CHUNK_SIZE):
+                        size += len(chunk)
+                        yield from stream.feed(chunk)
+                    if event is not None:
+                        event.body_received(size)
+                    stream.close()
+                    return
+                if event is not None:
+                    event.body_received(len(r.content))
+                error = response_error(r.text, r.status_code, url, headers=r.headers)
+                if r.status_code == 429:
+                    # as the first attempt of `request`
+                    self.key_pool.backoff(key, min(self.max_backoff_seconds, 1))
+        except (requests.RequestException, ValueError) as e:
+            error = e
+            if stream.items:
+                raise PageInterrupted(
+                    f'page interrupted after {stream.items} items: {e!r}', status_code=200, endpoint=url.split('?', 1)[0]
+                )
+        finally:
+            self.key_pool.release(key)
+            if event is not None:
+                metrics.on_attempt(event.finish(error))
+        page = self.request('GET', url, result_class, params=params)
+        yield from stream.set_page(self.decoded(page))
+
+    def _paginate_stream(
+        self,
+        params: dict,
+        url: str,
+        result_class: Generic[T],
+        items_key: str,
+        max_results: int = None,
+        max_credits: int = None,
+        cursor: CursorStore = None
+    ) -> Iterator:
+        params = {name: value for name, value in params.items() if value is not None}
+        fields = params.pop('fields', None)
+        decode_item = get_projection(fields).decode if fields is not None else None
+        results = 0
+        credits = 0
+        resume_url = cursor.load() if cursor is not None else None
+        next_url = resume_url or url
+        # the `next_page` URL holds the parameters
+        page_params = {} if resume_url else params
+        while next_url:
+            stream = PageStream(items_key, self.json_codec, decode_item)
+            items = self.stream_page(next_url, result_class, stream, page_params)
+            try:
+                for item in items:
+                    if max_results is not None and results >= max_results:
+                        return
+                    results += 1
+                    yield item
+            finally:
+                # close the connection of a page which is not consumed in full
+                items.close()
+            credits += estimate_cost(url, params, stream.items)
+            if cursor is not None:
+                if stream.page.get('next_page'):
+                    cursor.save(stream.page['next_page'])
                 else:
-                    raise e
+                    cursor.clear()
+            next_url = stream.page.get('next_page')
+            if (
+                not stream.items
+                or (max_results is not None and results >= max_results)
+                or (max_credits is not None and credits + estimate_cost(url, params) > max_credits)
+            ):
+                return
+            page_params = {}
 
+    def paginate_pages(
+        self,
+        first_page: Callable,
+        params: dict,
+        url: str,
+        result_class: Generic[T],
+        items_key: str,
+        dedupe_key: str = None,
+        concurrency: int = 4,
+        max_results: int = None,
+        max_credits: int = None
+    ) -> Iterator:
+        """Stream the items of an endpoint paginated by page number
+
+        As page numbers are known ahead of time, up to `concurrency` pages
+        following the current page are requested at once through the rate
+        limiter of the client. Items are still returned in page order.
+
+        :param first_page: Library method fetching the first page
+        :type first_page: Callable
+        :param params: Parameters of the first page
+        :type params: dict
+        :param url: API endpoint, used to estimate the credits of a page
+        :type url: str
+        :param result_class: Result class of a page
+        :param items_key: Key of the items in a page
+        :type items_key: str
+        :param dedupe_key: Skip items with the same value for this key as a previous item,
+            defaults to **None**
+        :type dedupe_key: str
+        :param concurrency: Pages requested ahead of the current page, defaults to 4
+        :type concurrency: int
+        :param max_results: Stop after this many items, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Do not request a page which would be estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :return: Iterator of the items of every page
+        :rtype: Iterator
+        """
+        params = dict(params)
+        fields = page_fields(
+            params.pop('fields', None),
+            items_key,
+            ['next_page_no', 'next_page_api_url'],
+            [dedupe_key] if dedupe_key is not None else []
+        )
+        results = 0
+        seen = set()
+        pending = deque()
+        next_page_no = None
+        next_page_url = None
+        page = self.decoded(first_page(**params, fields=fields))
+        credits = response_cost(url, params, page)
+        try:
+            while page is not None:
+                items = page.get(items_key) or []
+                if page.get('next_page_no') and page.get('next_page_api_url') and items:
+                    if next_page_no is None:
+                        next_page_no = page['next_page_no']
+                        next_page_url = page['next_page_api_url']
+                    # pages are charged once requested, so credits are counted up front, and only
+                    # the pages needed for `max_results`, as estimated by the size of this page, are requested
+                    while len(pending) < concurrency and (
+                        max_credits is None or credits + estimate_cost(url, params) <= max_credits
+                    ) and (
+                        max_results is None or results + len(items) * (len(pending) + 1) < max_results
+                    ):
+                        credits += estimate_cost(url, params)
+                        pending.append(gevent.spawn(
+                            self.request, 'GET', page_url(next_page_url, next_page_no), result_class,
+                            fields=fields
+                        ))
+                        next_page_no += 1
+                else:
+                    # the last page, pages requested after it are not needed
+                    _discard(pending)
 
-def do_bulk(ops: List[Op], max_workers: int = MAX_WORKERS) -> List[Result]:
+                for item in items:
+                    if dedupe_key is not None and item.get(dedupe_key) is not None:
+                        if item[dedupe_key] in seen:
+                            continue
+                        seen.add(item[dedupe_key])
+                    if max_results is not None and results >= max_results:
+                        return
+                    results += 1
+                    yield item
+                if max_results is not None and results >= max_results:
+                    return
+
+                page = self.decoded(pending.popleft().get()) if pending else None
+        finally:
+            _discard(pending)
+
+
+def _discard(pending: deque) -> None:
+    for greenlet in pending:
+        greenlet.kill(block=False)
+    pending.clear()
+
+
+def do_bulk(
+    ops: List[Op],
+    max_workers: int = MAX_WORKERS,
+    max_credits: int = None,
+    balance_check_interval: int = 100,
+    fields: List[str] = None,
+    store: ResultStore = None,
+    keep_exceptions: bool = False,
+    metrics: MetricsHook = None
+) -> Union[List[Result], ResultStore]:
     """Bulk operation
 
     This function can be used to run bulk operations using a limited number of concurrent requests.
@@ -119,34 +592,294 @@ def do_bulk(ops: List[Op], max_workers: int = MAX_WORKERS) -> List[Result]:
     :type ops: List[Tuple[Callable, Dict]]
     :param max_workers: Total concurrent request, defaults to 10
     :type max_workers: int
-    :return: Once all operation is finished this function will return List[:class:`proxycurl.gevent.base.Result`]
-    :rtype: List[:class:`proxycurl.gevent.base.Result`]
+    :param max_credits: Stop dispatching operations once they are estimated to spend this many credits,
+        operations which are not dispatched fail with :class:`proxycurl.budget.CreditBudgetExceeded`.
+        Defaults to **None** (no budget)
+    :type max_credits: int
+    :param balance_check_interval: Reconcile the credits spent with `get_balance()` every this many
+        finished operations when `max_credits` is set, defaults to 100
+    :type balance_check_interval: int
+    :param fields: Only keep these fields of the responses, e.g. `['full_name', 'experiences.*.company']`,
+        unless the parameters of an operation set its own `fields`. Defaults to **None** (every field)
+    :type fields: List[str]
+    :param store: Store receiving the results in place of a list, e.g. a
+        :class:`proxycurl.results.SpillingResultStore` to bound the memory they take. Defaults to **None** (a list)
+    :type store: :class:`proxycurl.results.ResultStore`
+    :param keep_exceptions: Keep the exception of failed operations as their `error`, rather than
+        a :class:`proxycurl.results.ResultError` recording its type, status code, endpoint and message.
+        Defaults to **False**
+    :type keep_exceptions: bool
+    :param metrics: Hook receiving the queue depth, the credits spent and the spans of the job and its operations,
+        defaults to the `metrics` hook of the client of the operations
+    :type metrics: :class:`proxycurl.metrics.MetricsHook`
+    :return: Once all operation is finished this function will return List[:class:`proxycurl.gevent.base.Result`],
+        or `store` holding them
+    :rtype: Union[List[:class:`proxycurl.gevent.base.Result`], :class:`proxycurl.results.ResultStore`]
 
     """
 
-    results = [None for _ in range(len(ops))]
+    if fields is not None:
+        ops = [(op[0], {'fields': fields, **op[1]}) for op in ops]
+
+    if store is not None:
+        store.allocate(len(ops), Result)
+        results = store
+    else:
+        results = [None for _ in range(len(ops))]
+
+    if metrics is None and ops:
+        metrics = operation_metrics(ops[0][0])
+
+    budget = None
+    if max_credits is not None and ops:
+        budget = CreditBudget(max_credits, balance_check_interval)
+        _reconcile(budget, operation_client(ops[0][0]))
+
     queue = Queue()
 
     for job in enumerate(ops):
         queue.put(job)
 
     workers = []
-    for _ in range(max_workers):
-        workers.append(gevent.spawn(_worker, queue, results))
+    bulk_span = NO_SPAN
+    if metrics is not None:
+        bulk_span = metrics.span('proxycurl.bulk', operations=len(ops), max_workers=max_workers)
+    with bulk_span as bulk:
+        for _ in range(max_workers):
+            workers.append(gevent.spawn(_worker, queue, results, budget, keep_exceptions, metrics, bulk))
 
-    gevent.joinall(workers)
+        gevent.joinall(workers)
     return results
 
 
-def _worker(queue, results):
+def _reconcile(budget: CreditBudget, client):
+    balance = client.refresh_balances()
+    budget.reconcile(balance)
+
+
+def _worker(queue, results, budget=None, keep_exceptions=False, metrics=None, bulk=None):
     while True:
         try:
             index, op = queue.get_nowait()
         except Empty:
             break
 
+        if metrics is not None:
+            # operations are queued in order
+            metrics.on_queue(len(results) - index - 1)
+
+        cost = 0
+        if budget is not None:
+            cost = estimate_op_cost(op)
+            if not budget.reserve(cost):
+                error = CreditBudgetExceeded(f'credit budget of {budget.max_credits} reached')
+                results[index] = Result(False, None, error if keep_exceptions else ResultError.from_exception(error))
+                continue
+
+        operation_span = metrics.span('proxycurl.operation', bulk, index=index) if metrics is not None else NO_SPAN
+        with operation_span as span:
+            try:
+                response = op[0](**op[1])
+                result = Result(True, response, None)
+            except Exception as e:
+                if span is not None:
+                    span.record_error(e)
+                result = Result(False, None, e if keep_exceptions else ResultError.from_exception(e))
+        results[index] = result
+
+        if metrics is not None and result.success:
+            endpoint = operation_endpoint(op[0])
+            if endpoint is not None:
+                metrics.on_credits(endpoint, response_cost(endpoint, op[1], result.value))
+
+        if budget is not None:
+            budget.settle(cost, op_cost(op, result.value) if result.success else 0)
+            if budget.reconcile_due:
+                try:
+                    _reconcile(budget, operation_client(op[0]))
+                except Exception as e:
+                    logger.exception(str(e))
+
+
+def do_pipeline(
+    source: Iterator,
+    op: Callable,
+    params: Callable[[Any], Dict],
+    max_workers: int = MAX_WORKERS,
+    queue_size: int = None,
+    keep_exceptions: bool = False
+) -> Iterator[Tuple[Any, Result]]:
+    """Fan-out pipeline
+
+    Items of `source`, e.g. the employees streamed by `employee_list_iter`,
+    are passed through a bounded queue to `max_workers` workers calling `op`
+    with each of them. Workers start with the first item, and once the queue
+    is full `source` waits, so its next page is not fetched before there is
+    room for its items.
+
+    :param source: Iterator of items
+    :type source: Iterator
+    :param op: Operation function called for every item, e.g. `linkedin.person.get`
+    :type op: Callable
+    :param params: Returns the parameters of `op` for an item
+    :type params: Callable[[Any], Dict]
+    :param max_workers: Total concurrent request, defaults to 10
+    :type max_workers: int
+    :param queue_size: Items waiting for a worker, defaults to `max_workers`
+    :type queue_size: int
+    :param keep_exceptions: Keep the exception of failed calls of `op` as their `error`, rather than
+        a :class:`proxycurl.results.ResultError` recording its type, status code, endpoint and message.
+        Defaults to **False**
+    :type keep_exceptions: bool
+    :return: Iterator of every item and the :class:`proxycurl.gevent.base.Result` of `op`,
+        in the order they finish
+    :rtype: Iterator[Tuple[Any, :class:`proxycurl.gevent.base.Result`]]
+
+    """
+
+    inputs = Queue(queue_size or max_workers)
+    outputs = Queue(max_workers)
+    source_errors = []
+
+    def produce():
         try:
-            response = op[0](**op[1])
-            results[index] = Result(True, response, None)
+            for item in source:
+                inputs.put(item)
         except Exception as e:
-            results[index] = Result(False, None, e)
+            source_errors.append(e)
+        # need to define empty item to stop the worker
+        for _ in range(max_workers):
+            inputs.put(None)
+
+    def work():
+        while True:
+            item = inputs.get()
+            if item is None:
+                break
+            try:
+                response = op(**params(item))
+                result = Result(True, response, None)
+            except Exception as e:
+                result = Result(False, None, e if keep_exceptions else ResultError.from_exception(e))
+            outputs.put((item, result))
+        outputs.put(None)
+
+    greenlets = [gevent.spawn(produce)]
+    for _ in range(max_workers):
+        greenlets.append(gevent.spawn(work))
+
+    try:
+        running = max_workers
+        while running:
+            output = outputs.get()
+            if output is None:
+                running -= 1
+                continue
+            yield output
+    finally:
+        gevent.killall(greenlets, block=False)
+
+    if source_errors:
+        raise source_errors[0]
+
+
+def do_enrich(
+    proxycurl,
+    records: List[Dict],
+    stages: List[Stage] = LEAD_STAGES,
+    max_workers: int = MAX_WORKERS,
+    cache: ResponseCache = None,
+    keep_exceptions: bool = False
+) -> List[Result]:
+    """Multi-step enrichment
+
+    Every record goes through `stages` on its own, a stage starting as soon as
+    the stages it requires are done for that record, so records never wait for
+    a stage to finish across the batch. All requests share the rate limit of
+    `proxycurl` and identical calls are answered from `cache`.
+
+    :param proxycurl: Client calling the operations of the stages
+    :type proxycurl: :class:`proxycurl.gevent.Proxycurl`
+    :param records: Input of every record, e.g. `first_name` and `company_domain` for the default stages
+    :type records: List[Dict]
+    :param stages: Stages in dependency order, defaults to :data:`proxycurl.enrichment.LEAD_STAGES`
+        (resolve, get, personal email and personal contact)
+    :type stages: List[:class:`proxycurl.enrichment.Stage`]
+    :param max_workers: Records enriched at once, defaults to 10
+    :type max_workers: int
+    :param cache: Responses shared between records, defaults to a new :class:`proxycurl.enrichment.ResponseCache`
+    :type cache: :class:`proxycurl.enrichment.ResponseCache`
+    :param keep_exceptions: Keep the exception of failed records as their `error`, rather than
+        a :class:`proxycurl.results.ResultError` recording its type, status code, endpoint and message.
+        Defaults to **False**
+    :type keep_exceptions: bool
+    :return: Once all records are finished this function will return List[:class:`proxycurl.gevent.base.Result`],
+        the value of which maps `record` and the name of every stage to its response, or **None** when skipped
+    :rtype: List[:class:`proxycurl.gevent.base.Result`]
+
+    """
+
+    check_stages(stages)
+    if cache is None:
+        cache = ResponseCache()
+
+    results = [None for _ in range(len(records))]
+
+    queue = Queue()
+
+    for job in enumerate(records):
+        queue.put(job)
+
+    workers = []
+    for _ in range(max_workers):
+        workers.append(gevent.spawn(_enrich_worker, proxycurl, queue, results, stages, cache, keep_exceptions))
+
+    gevent.joinall(workers)
+    return results
+
+
+def _enrich_worker(proxycurl, queue, results, stages, cache, keep_exceptions=False):
+    while True:
+        try:
+            index, record = queue.get_nowait()
+        except Empty:
+            break
+
+        context = {'record': record}
+        errors = []
+        tasks = {}
+        for stage in stages:
+            tasks[stage.name] = gevent.spawn(
+                _enrich_stage, proxycurl, stage, context, tasks, errors, cache
+            )
+        gevent.joinall(list(tasks.values()))
+
+        if errors:
+            error = errors[0]
+            results[index] = Result(False, context, error if keep_exceptions else ResultError.from_exception(error))
+        else:
+            results[index] = Result(True, context, None)
+
+
+def _enrich_stage(proxycurl, stage, context, tasks, errors, cache):
+    if stage.requires:
+        gevent.joinall([tasks[name] for name in stage.requires])
+    context[stage.name] = None
+    # a failed stage stops the record
+    if errors:
+        return
+
+    try:
+        params = stage_params(stage, context)
+        if params is None:
+            return
+        key = cache.key(stage.operation, params)
+        found, response = cache.get(key)
+        if proxycurl.metrics is not None:
+            proxycurl.metrics.on_cache(found)
+        if not found:
+            response = resolve_operation(proxycurl, stage.operation)(**params)
+            cache.set(key, response)
+        context[stage.name] = response
+    except Exception as e:
+        errors.append(e)
@@ -1,10 +1,17 @@
+from typing import Iterator, List, Union
 from proxycurl.config import (
-    BASE_URL, PROXYCURL_API_KEY, TIMEOUT, MAX_RETRIES, MAX_BACKOFF_SECONDS
+    BASE_URL, PROXYCURL_API_KEY, TIMEOUT, MAX_RETRIES, MAX_BACKOFF_SECONDS,
+    RATE_LIMIT, JSON_CODEC
 )
 from proxycurl.gevent.base import ProxycurlBase
+from proxycurl.codec import JsonCodec
+from proxycurl.interning import InternTable
+from proxycurl.metrics import MetricsHook
+from proxycurl.pagination import CursorStore
 from proxycurl.models import (
     PersonEndpointResponse,
     PersonSearchResult,
+    SearchResult,
     PersonLookupUrlEnrichResult,
     ReverseEmailUrlEnrichResult,
     ReverseContactNumberResult,
@@ -14,16 +21,21 @@ from proxycurl.models import (
     ProfilePicture,
     LinkedinCompany,
     CompanySearchResult,
+    CSearchResult,
     CompanyUrlEnrichResult,
     JobListPage,
+    JobListEntry,
     JobListCount,
     EmployeeCount,
     EmployeeList,
+    Employee,
     RoleSearchEnrichedResult,
     LinkedinSchool,
     StudentList,
+    Student,
     JobProfile,
     CustomerList,
+    CompanyCustomer,
     CreditBalance,
 )
 
@@ -47,6 +59,7 @@ class _LinkedinPerson:
         twitter_profile_url: str = None,
         facebook_profile_url: str = None,
         linkedin_profile_url: str = None,
+        fields: List[str] = None,
     ) -> PersonEndpointResponse:
         """Person Profile Endpoint
         
@@ -141,6 +154,9 @@ class _LinkedinPerson:
 
             yes (Include only one of: `linkedin_profile_url`, `twitter_profile_url`, or `facebook_profile_url`)
         :type linkedin_profile_url: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.PersonEndpointResponse` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.PersonEndpointResponse`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -180,7 +196,8 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=PersonEndpointResponse
+            result_class=PersonEndpointResponse,
+            fields=fields
         )
 
     def search(
@@ -232,6 +249,7 @@ class _LinkedinPerson:
         page_size: str = None,
         enrich_profiles: str = None,
         after: str = None,
+        fields: List[str] = None,
     ) -> PersonSearchResult:
         """Person Search Endpoint
         
@@ -447,6 +465,12 @@ class _LinkedinPerson:
 
             Calling this API endpoint with this parameter would add `1` credit per result returned.
         :type enrich_profiles: str
+        :param after: The cursor of the page to fetch, as found in the `next_page` URL of the previous page.
+            Omit this parameter to fetch the first page.
+        :type after: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.PersonSearchResult` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.PersonSearchResult`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -554,7 +578,54 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=PersonSearchResult
+            result_class=PersonSearchResult,
+            fields=fields
+        )
+
+    def search_iter(
+        self,
+        max_results: int = None,
+        max_credits: int = None,
+        prefetch: bool = True,
+        cursor: CursorStore = None,
+        stream: bool = False,
+        **kwargs
+    ) -> Iterator[SearchResult]:
+        """Person Search Endpoint, streaming results across pages
+
+        Takes the parameters of :meth:`search` and follows `next_page` until the last page.
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Stop before fetching a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :param prefetch: Fetch the next page while the current page is consumed, defaults to **True**
+        :type prefetch: bool
+        :param cursor: Resume from the page saved in this store and save the next page to it
+            once the current page is consumed, defaults to **None**
+        :type cursor: :class:`proxycurl.pagination.CursorStore`
+        :param stream: Parse every page as it is received, one page at a time, so that its first results
+            are returned before it finishes and about one result is held in memory, defaults to **False**
+        :type stream: bool
+        :return: An iterator of :class:`proxycurl.models.SearchResult`
+        :rtype: Iterator[:class:`proxycurl.models.SearchResult`]
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate(
+            first_page=self.search,
+            params=kwargs,
+            url='/proxycurl/api/v2/search/person',
+            result_class=PersonSearchResult,
+            items_key='results',
+            max_results=max_results,
+            max_credits=max_credits,
+            prefetch=prefetch,
+            cursor=cursor,
+            stream=stream
         )
 
     def resolve(
@@ -566,6 +637,7 @@ class _LinkedinPerson:
         location: str = None,
         title: str = None,
         last_name: str = None,
+        fields: List[str] = None,
     ) -> PersonLookupUrlEnrichResult:
         """Person Lookup Endpoint
         
@@ -620,6 +692,9 @@ class _LinkedinPerson:
         :type title: str
         :param last_name: Last name of the user
         :type last_name: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.PersonLookupUrlEnrichResult` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.PersonLookupUrlEnrichResult`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -645,7 +720,8 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=PersonLookupUrlEnrichResult
+            result_class=PersonLookupUrlEnrichResult,
+            fields=fields
         )
 
     def resolve_by_email(
@@ -653,6 +729,7 @@ class _LinkedinPerson:
         email: str,
         lookup_depth: str,
         enrich_profile: str = None,
+        fields: List[str] = None,
     ) -> ReverseEmailUrlEnrichResult:
         """Reverse Email Lookup Endpoint
         
@@ -684,6 +761,9 @@ class _LinkedinPerson:
 
             If you require [fresh profile data](https://nubela.co/blog/how-fresh-are-profiles-returned-by-proxycurl-api/),  please chain this API call with the `linkedin_profile_url` result with the [Person Profile Endpoint](https://nubela.co/proxycurl/docs#people-api-person-profile-endpoint) with the `use_cache=if-recent` parameter.
         :type enrich_profile: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.ReverseEmailUrlEnrichResult` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.ReverseEmailUrlEnrichResult`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -701,12 +781,14 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=ReverseEmailUrlEnrichResult
+            result_class=ReverseEmailUrlEnrichResult,
+            fields=fields
         )
 
     def resolve_by_phone(
         self,
         phone_number: str,
+        fields: List[str] = None,
     ) -> ReverseContactNumberResult:
         """Reverse Contact Number Lookup Endpoint
         
@@ -715,6 +797,9 @@ class _LinkedinPerson:
         
         :param phone_number: [E.164 formatted](https://www.twilio.com/docs/glossary/what-e164) phone number of the person you want to identify social media profiles of.
         :type phone_number: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.ReverseContactNumberResult` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.ReverseContactNumberResult`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -729,13 +814,15 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=ReverseContactNumberResult
+            result_class=ReverseContactNumberResult,
+            fields=fields
         )
 
     def lookup_email(
         self,
         linkedin_profile_url: str,
         callback_url: str = None,
+        fields: List[str] = None,
     ) -> ExtractionEmailResult:
         """Work Email Lookup Endpoint
         
@@ -758,6 +845,9 @@ class _LinkedinPerson:
         :param callback_url: Webhook to notify your application when
             the request has finished processing.
         :type callback_url: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.ExtractionEmailResult` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.ExtractionEmailResult`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -774,7 +864,8 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=ExtractionEmailResult
+            result_class=ExtractionEmailResult,
+            fields=fields
         )
 
     def personal_contact(
@@ -783,6 +874,7 @@ class _LinkedinPerson:
         twitter_profile_url: str = None,
         facebook_profile_url: str = None,
         linkedin_profile_url: str = None,
+        fields: List[str] = None,
     ) -> PersonalContactNumbers:
         """Personal Contact Number Lookup Endpoint
         
@@ -815,6 +907,9 @@ class _LinkedinPerson:
             Yes (Include only one of: `linkedin_profile_url`,
             `twitter_profile_url`, or `facebook_profile_url`)
         :type linkedin_profile_url: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.PersonalContactNumbers` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.PersonalContactNumbers`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -836,7 +931,8 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=PersonalContactNumbers
+            result_class=PersonalContactNumbers,
+            fields=fields
         )
 
     def personal_email(
@@ -846,6 +942,7 @@ class _LinkedinPerson:
         twitter_profile_url: str = None,
         facebook_profile_url: str = None,
         linkedin_profile_url: str = None,
+        fields: List[str] = None,
     ) -> PDLEmailResult:
         """Personal Email Lookup Endpoint
         
@@ -874,6 +971,9 @@ class _LinkedinPerson:
         :param linkedin_profile_url: The LinkedIn Profile URL from which you wish to extract personal email addresses.
             yes (Include only one of: `linkedin_profile_url`, `twitter_profile_url`, or `facebook_profile_url`)
         :type linkedin_profile_url: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.PDLEmailResult` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.PDLEmailResult`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -897,12 +997,14 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=PDLEmailResult
+            result_class=PDLEmailResult,
+            fields=fields
         )
 
     def profile_picture(
         self,
         linkedin_person_profile_url: str,
+        fields: List[str] = None,
     ) -> ProfilePicture:
         """Person Profile Picture Endpoint
         
@@ -914,6 +1016,9 @@ class _LinkedinPerson:
         
         :param linkedin_person_profile_url: LinkedIn Profile URL of the person that you are trying to get the profile picture of.
         :type linkedin_person_profile_url: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.ProfilePicture` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.ProfilePicture`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -928,7 +1033,8 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=ProfilePicture
+            result_class=ProfilePicture,
+            fields=fields
         )
 
 
@@ -946,6 +1052,7 @@ class _LinkedinCompany:
         exit_data: str = None,
         acquisitions: str = None,
         use_cache: str = None,
+        fields: List[str] = None,
     ) -> LinkedinCompany:
         """Company Profile Endpoint
         
@@ -995,6 +1102,9 @@ class _LinkedinCompany:
 
             `if-recent` API will make a best effort to return a fresh profile no older than 29 days.Costs an extra `1` credit on top of the cost of the base endpoint.
         :type use_cache: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.LinkedinCompany` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.LinkedinCompany`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -1023,7 +1133,8 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=LinkedinCompany
+            result_class=LinkedinCompany,
+            fields=fields
         )
 
     def search(
@@ -1050,6 +1161,7 @@ class _LinkedinCompany:
         region: str = None,
         country: str = None,
         after: str = None,
+        fields: List[str] = None,
     ) -> CompanySearchResult:
         """Company Search Endpoint
         
@@ -1148,6 +1260,12 @@ class _LinkedinCompany:
 
             This parameter accepts a case-insensitive [Alpha-2 ISO3166 country code](https://en.wikipedia.org/wiki/ISO_3166-1_alpha-2).
         :type country: str
+        :param after: The cursor of the page to fetch, as found in the `next_page` URL of the previous page.
+            Omit this parameter to fetch the first page.
+        :type after: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.CompanySearchResult` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.CompanySearchResult`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -1205,7 +1323,54 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=CompanySearchResult
+            result_class=CompanySearchResult,
+            fields=fields
+        )
+
+    def search_iter(
+        self,
+        max_results: int = None,
+        max_credits: int = None,
+        prefetch: bool = True,
+        cursor: CursorStore = None,
+        stream: bool = False,
+        **kwargs
+    ) -> Iterator[CSearchResult]:
+        """Company Search Endpoint, streaming results across pages
+
+        Takes the parameters of :meth:`search` and follows `next_page` until the last page.
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Stop before fetching a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :param prefetch: Fetch the next page while the current page is consumed, defaults to **True**
+        :type prefetch: bool
+        :param cursor: Resume from the page saved in this store and save the next page to it
+            once the current page is consumed, defaults to **None**
+        :type cursor: :class:`proxycurl.pagination.CursorStore`
+        :param stream: Parse every page as it is received, one page at a time, so that its first results
+            are returned before it finishes and about one result is held in memory, defaults to **False**
+        :type stream: bool
+        :return: An iterator of :class:`proxycurl.models.CSearchResult`
+        :rtype: Iterator[:class:`proxycurl.models.CSearchResult`]
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate(
+            first_page=self.search,
+            params=kwargs,
+            url='/proxycurl/api/v2/search/company',
+            result_class=CompanySearchResult,
+            items_key='results',
+            max_results=max_results,
+            max_credits=max_credits,
+            prefetch=prefetch,
+            cursor=cursor,
+            stream=stream
         )
 
     def resolve(
@@ -1214,6 +1379,7 @@ class _LinkedinCompany:
         company_domain: str = None,
         company_name: str = None,
         enrich_profile: str = None,
+        fields: List[str] = None,
     ) -> CompanyUrlEnrichResult:
         """Company Lookup Endpoint
         
@@ -1242,6 +1408,9 @@ class _LinkedinCompany:
             If you require [fresh profile data](https://nubela.co/blog/how-fresh-are-profiles-returned-by-proxycurl-api/),
             please chain this API call with the [Company Profile Endpoint](https://nubela.co/proxycurl/docs#company-api-company-profile-endpoint) with the `use_cache=if-recent` parameter.
         :type enrich_profile: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.CompanyUrlEnrichResult` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.CompanyUrlEnrichResult`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -1263,7 +1432,8 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=CompanyUrlEnrichResult
+            result_class=CompanyUrlEnrichResult,
+            fields=fields
         )
 
     def find_job(
@@ -1275,6 +1445,7 @@ class _LinkedinCompany:
         geo_id: str = None,
         keyword: str = None,
         search_id: str = None,
+        fields: List[str] = None,
     ) -> JobListPage:
         """Job Search Endpoint
         
@@ -1325,6 +1496,9 @@ class _LinkedinCompany:
             You can get the `search_id` of a LinkedIn company via
             [Company Profile API](#company-api-company-profile-endpoint).
         :type search_id: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.JobListPage` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.JobListPage`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -1352,7 +1526,47 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=JobListPage
+            result_class=JobListPage,
+            fields=fields
+        )
+
+    def find_job_iter(
+        self,
+        concurrency: int = 4,
+        max_results: int = None,
+        max_credits: int = None,
+        **kwargs
+    ) -> Iterator[JobListEntry]:
+        """Job Search Endpoint, streaming results across pages
+
+        Takes the parameters of :meth:`find_job`, requests up to `concurrency` following pages
+        at once and returns the results in page order.
+        Results with the `job_url` of a previous result are skipped.
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param concurrency: Pages requested at once, defaults to 4
+        :type concurrency: int
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Do not request a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :return: An iterator of :class:`proxycurl.models.JobListEntry`
+        :rtype: Iterator[:class:`proxycurl.models.JobListEntry`]
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate_pages(
+            first_page=self.find_job,
+            params=kwargs,
+            url='/proxycurl/api/v2/linkedin/company/job',
+            result_class=JobListPage,
+            items_key='job',
+            dedupe_key='job_url',
+            concurrency=concurrency,
+            max_results=max_results,
+            max_credits=max_credits
         )
 
     def job_count(
@@ -1364,6 +1578,7 @@ class _LinkedinCompany:
         geo_id: str = None,
         keyword: str = None,
         search_id: str = None,
+        fields: List[str] = None,
     ) -> JobListCount:
         """Jobs Listing Count Endpoint
         
@@ -1414,6 +1629,9 @@ class _LinkedinCompany:
             You can get the `search_id` of a LinkedIn company via
             [Company Profile API](#company-api-company-profile-endpoint).
         :type search_id: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.JobListCount` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.JobListCount`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -1441,7 +1659,8 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=JobListCount
+            result_class=JobListCount,
+            fields=fields
         )
 
     def employee_count(
@@ -1450,6 +1669,7 @@ class _LinkedinCompany:
         use_cache: str = None,
         linkedin_employee_count: str = None,
         employment_status: str = None,
+        fields: List[str] = None,
     ) -> EmployeeCount:
         """Employee Count Endpoint
         
@@ -1483,6 +1703,9 @@ class _LinkedinCompany:
             * `past` : count past employees
             * `all` : count current & past employees
         :type employment_status: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.EmployeeCount` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.EmployeeCount`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -1503,7 +1726,8 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=EmployeeCount
+            result_class=EmployeeCount,
+            fields=fields
         )
 
     def employee_list(
@@ -1517,6 +1741,7 @@ class _LinkedinCompany:
         sort_by: str = None,
         resolve_numeric_id: str = None,
         after: str = None,
+        fields: List[str] = None,
     ) -> EmployeeList:
         """Employee Listing Endpoint
         
@@ -1590,6 +1815,12 @@ class _LinkedinCompany:
             - `true` - Enable support for Company Profile URLs with numerical IDs. 
             Costs an extra `2` credit on top of the base cost of the endpoint.
         :type resolve_numeric_id: str
+        :param after: The cursor of the page to fetch, as found in the `next_page` URL of the previous page.
+            Omit this parameter to fetch the first page.
+        :type after: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.EmployeeList` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.EmployeeList`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -1620,7 +1851,54 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=EmployeeList
+            result_class=EmployeeList,
+            fields=fields
+        )
+
+    def employee_list_iter(
+        self,
+        max_results: int = None,
+        max_credits: int = None,
+        prefetch: bool = True,
+        cursor: CursorStore = None,
+        stream: bool = False,
+        **kwargs
+    ) -> Iterator[Employee]:
+        """Employee Listing Endpoint, streaming results across pages
+
+        Takes the parameters of :meth:`employee_list` and follows `next_page` until the last page.
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Stop before fetching a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :param prefetch: Fetch the next page while the current page is consumed, defaults to **True**
+        :type prefetch: bool
+        :param cursor: Resume from the page saved in this store and save the next page to it
+            once the current page is consumed, defaults to **None**
+        :type cursor: :class:`proxycurl.pagination.CursorStore`
+        :param stream: Parse every page as it is received, one page at a time, so that its first results
+            are returned before it finishes and about one result is held in memory, defaults to **False**
+        :type stream: bool
+        :return: An iterator of :class:`proxycurl.models.Employee`
+        :rtype: Iterator[:class:`proxycurl.models.Employee`]
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate(
+            first_page=self.employee_list,
+            params=kwargs,
+            url='/proxycurl/api/linkedin/company/employees',
+            result_class=EmployeeList,
+            items_key='employees',
+            max_results=max_results,
+            max_credits=max_credits,
+            prefetch=prefetch,
+            cursor=cursor,
+            stream=stream
         )
 
     def employee_search(
@@ -1632,6 +1910,7 @@ class _LinkedinCompany:
         enrich_profiles: str = None,
         resolve_numeric_id: str = None,
         after: str = None,
+        fields: List[str] = None,
     ) -> EmployeeList:
         """Employee Search Endpoint
         
@@ -1679,6 +1958,12 @@ class _LinkedinCompany:
             - `true` - Enable support for Company Profile URLs with numerical IDs. 
             Costs an extra `2` credit on top of the base cost of the endpoint.
         :type resolve_numeric_id: str
+        :param after: The cursor of the page to fetch, as found in the `next_page` URL of the previous page.
+            Omit this parameter to fetch the first page.
+        :type after: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.EmployeeList` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.EmployeeList`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -1704,7 +1989,54 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=EmployeeList
+            result_class=EmployeeList,
+            fields=fields
+        )
+
+    def employee_search_iter(
+        self,
+        max_results: int = None,
+        max_credits: int = None,
+        prefetch: bool = True,
+        cursor: CursorStore = None,
+        stream: bool = False,
+        **kwargs
+    ) -> Iterator[Employee]:
+        """Employee Search Endpoint, streaming results across pages
+
+        Takes the parameters of :meth:`employee_search` and follows `next_page` until the last page.
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Stop before fetching a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :param prefetch: Fetch the next page while the current page is consumed, defaults to **True**
+        :type prefetch: bool
+        :param cursor: Resume from the page saved in this store and save the next page to it
+            once the current page is consumed, defaults to **None**
+        :type cursor: :class:`proxycurl.pagination.CursorStore`
+        :param stream: Parse every page as it is received, one page at a time, so that its first results
+            are returned before it finishes and about one result is held in memory, defaults to **False**
+        :type stream: bool
+        :return: An iterator of :class:`proxycurl.models.Employee`
+        :rtype: Iterator[:class:`proxycurl.models.Employee`]
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate(
+            first_page=self.employee_search,
+            params=kwargs,
+            url='/proxycurl/api/linkedin/company/employee/search',
+            result_class=EmployeeList,
+            items_key='employees',
+            max_results=max_results,
+            max_credits=max_credits,
+            prefetch=prefetch,
+            cursor=cursor,
+            stream=stream
         )
 
     def role_lookup(
@@ -1712,6 +2044,7 @@ class _LinkedinCompany:
         company_name: str,
         role: str,
         enrich_profile: str = None,
+        fields: List[str] = None,
     ) -> RoleSearchEnrichedResult:
         """Role Lookup Endpoint
         
@@ -1741,6 +2074,9 @@ class _LinkedinCompany:
             If you require [fresh profile data](https://nubela.co/blog/how-fresh-are-profiles-returned-by-proxycurl-api/),
             please chain this API call with the [Person Profile Endpoint](#people-api-person-profile-endpoint) with the `use_cache=if-recent` parameter.
         :type enrich_profile: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.RoleSearchEnrichedResult` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.RoleSearchEnrichedResult`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -1758,12 +2094,14 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=RoleSearchEnrichedResult
+            result_class=RoleSearchEnrichedResult,
+            fields=fields
         )
 
     def profile_picture(
         self,
         linkedin_company_profile_url: str,
+        fields: List[str] = None,
     ) -> ProfilePicture:
         """Company Profile Picture Endpoint
         
@@ -1775,6 +2113,9 @@ class _LinkedinCompany:
         
         :param linkedin_company_profile_url: LinkedIn Profile URL of the company that you are trying to get the profile picture of.
         :type linkedin_company_profile_url: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.ProfilePicture` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.ProfilePicture`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -1789,7 +2130,8 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=ProfilePicture
+            result_class=ProfilePicture,
+            fields=fields
         )
 
 
@@ -1801,6 +2143,7 @@ class _LinkedinSchool:
         self,
         url: str,
         use_cache: str = None,
+        fields: List[str] = None,
     ) -> LinkedinSchool:
         """School Profile Endpoint
         
@@ -1815,6 +2158,9 @@ class _LinkedinSchool:
 
             `if-recent` API will make a best effort to return a fresh profile no older than 29 days.Costs an extra `1` credit on top of the cost of the base endpoint.
         :type use_cache: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.LinkedinSchool` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.LinkedinSchool`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -1831,7 +2177,8 @@ class _LinkedinSchool:
             params=params,
             data={
             },
-            result_class=LinkedinSchool
+            result_class=LinkedinSchool,
+            fields=fields
         )
 
     def student_list(
@@ -1844,6 +2191,7 @@ class _LinkedinSchool:
         student_status: str = None,
         sort_by: str = None,
         resolve_numeric_id: str = None,
+        fields: List[str] = None,
     ) -> StudentList:
         """Student Listing Endpoint
         
@@ -1914,6 +2262,9 @@ class _LinkedinSchool:
             - `true` - Enable support for School Profile URLs with numerical IDs. 
             Costs an extra `2` credit on top of the base cost of the endpoint.
         :type resolve_numeric_id: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.StudentList` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.StudentList`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -1942,7 +2293,54 @@ class _LinkedinSchool:
             params=params,
             data={
             },
-            result_class=StudentList
+            result_class=StudentList,
+            fields=fields
+        )
+
+    def student_list_iter(
+        self,
+        max_results: int = None,
+        max_credits: int = None,
+        prefetch: bool = True,
+        cursor: CursorStore = None,
+        stream: bool = False,
+        **kwargs
+    ) -> Iterator[Student]:
+        """Student Listing Endpoint, streaming results across pages
+
+        Takes the parameters of :meth:`student_list` and follows `next_page` until the last page.
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Stop before fetching a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :param prefetch: Fetch the next page while the current page is consumed, defaults to **True**
+        :type prefetch: bool
+        :param cursor: Resume from the page saved in this store and save the next page to it
+            once the current page is consumed, defaults to **None**
+        :type cursor: :class:`proxycurl.pagination.CursorStore`
+        :param stream: Parse every page as it is received, one page at a time, so that its first results
+            are returned before it finishes and about one result is held in memory, defaults to **False**
+        :type stream: bool
+        :return: An iterator of :class:`proxycurl.models.Student`
+        :rtype: Iterator[:class:`proxycurl.models.Student`]
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate(
+            first_page=self.student_list,
+            params=kwargs,
+            url='/proxycurl/api/linkedin/school/students',
+            result_class=StudentList,
+            items_key='students',
+            max_results=max_results,
+            max_credits=max_credits,
+            prefetch=prefetch,
+            cursor=cursor,
+            stream=stream
         )
 
 
@@ -1953,6 +2351,7 @@ class _LinkedinJob:
     def get(
         self,
         url: str,
+        fields: List[str] = None,
     ) -> JobProfile:
         """Job Profile Endpoint
         
@@ -1966,6 +2365,9 @@ class _LinkedinJob:
             [Jobs Listing Endpoint](#jobs-api-jobs-listing-endpoint)
             can be used to retrieve a job URL.
         :type url: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.JobProfile` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.JobProfile`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -1980,7 +2382,8 @@ class _LinkedinJob:
             params=params,
             data={
             },
-            result_class=JobProfile
+            result_class=JobProfile,
+            fields=fields
         )
 
 
@@ -1994,6 +2397,7 @@ class _LinkedinCustomers:
         twitter_profile_url: str = None,
         page_size: str = None,
         after: str = None,
+        fields: List[str] = None,
     ) -> CustomerList:
         """Customer Listing Endpoint
         
@@ -2020,6 +2424,12 @@ class _LinkedinCustomers:
 
             Accepted values for this parameter is an integer ranging from 0 to 1000.
         :type page_size: str
+        :param after: The cursor of the page to fetch, as found in the `next_page` URL of the previous page.
+            Omit this parameter to fetch the first page.
+        :type after: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.CustomerList` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.CustomerList`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -2041,7 +2451,54 @@ class _LinkedinCustomers:
             params=params,
             data={
             },
-            result_class=CustomerList
+            result_class=CustomerList,
+            fields=fields
+        )
+
+    def listing_iter(
+        self,
+        max_results: int = None,
+        max_credits: int = None,
+        prefetch: bool = True,
+        cursor: CursorStore = None,
+        stream: bool = False,
+        **kwargs
+    ) -> Iterator[CompanyCustomer]:
+        """Customer Listing Endpoint, streaming results across pages
+
+        Takes the parameters of :meth:`listing` and follows `next_page` until the last page.
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Stop before fetching a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :param prefetch: Fetch the next page while the current page is consumed, defaults to **True**
+        :type prefetch: bool
+        :param cursor: Resume from the page saved in this store and save the next page to it
+            once the current page is consumed, defaults to **None**
+        :type cursor: :class:`proxycurl.pagination.CursorStore`
+        :param stream: Parse every page as it is received, one page at a time, so that its first results
+            are returned before it finishes and about one result is held in memory, defaults to **False**
+        :type stream: bool
+        :return: An iterator of :class:`proxycurl.models.CompanyCustomer`
+        :rtype: Iterator[:class:`proxycurl.models.CompanyCustomer`]
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate(
+            first_page=self.listing,
+            params=kwargs,
+            url='/proxycurl/api/customers',
+            result_class=CustomerList,
+            items_key='companies',
+            max_results=max_results,
+            max_credits=max_credits,
+            prefetch=prefetch,
+            cursor=cursor,
+            stream=stream
         )
 
 
@@ -2066,27 +2523,49 @@ class Proxycurl(ProxycurlBase):
 
     def __init__(
         self,
-        api_key: str = PROXYCURL_API_KEY,
+        api_key: Union[str, List[str]] = PROXYCURL_API_KEY,
         base_url: str = BASE_URL,
         timeout: int = TIMEOUT,
         max_retries: int = MAX_RETRIES,
-        max_backoff_seconds: int = MAX_BACKOFF_SECONDS
+        max_backoff_seconds: int = MAX_BACKOFF_SECONDS,
+        rate_limit: int = RATE_LIMIT,
+        json_codec: Union[str, JsonCodec] = JSON_CODEC,
+        raw: bool = False,
+        lazy: bool = False,
+        structs: bool = False,
+        validate: bool = False,
+        intern: Union[bool, InternTable] = False,
+        metrics: MetricsHook = None
     ) -> None:
-        self.api_key = api_key
-        self.base_url = base_url
-        self.timeout = timeout
-        self.max_retries = max_retries
-        self.max_backoff_seconds = max_backoff_seconds
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            max_backoff_seconds=max_backoff_seconds,
+            rate_limit=rate_limit,
+            json_codec=json_codec,
+            raw=raw,
+            lazy=lazy,
+            structs=structs,
+            validate=validate,
+            intern=intern,
+            metrics=metrics
+        )
         self.linkedin = _Linkedin(self)
 
     def get_balance(
         self,
+        fields: List[str] = None,
     ) -> CreditBalance:
         """View Credit Balance Endpoint
         
                 Cost: 0 credit / successful request.
         Get your current credit(s) balance
         
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of :class:`proxycurl.models.CreditBalance` or **None** if there is an error.
         :rtype: :class:`proxycurl.models.CreditBalance`
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.gevent.ProxycurlException`
@@ -2100,5 +2579,6 @@ class Proxycurl(ProxycurlBase):
             params=params,
             data={
             },
-            result_class=CreditBalance
+            result_class=CreditBalance,
+            fields=fields
         )
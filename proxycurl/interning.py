@@ -0,0 +1,142 @@
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, get_type_hints
+from proxycurl.schema import get_args, get_origin, is_model, unwrap_optional
+
+# Interning of the values of low-cardinality fields, such as the `country` of a profile or the
+# `company` of its experiences, so that the results held by a bulk job share one copy of each
+# value instead of one per result. Responses are walked by a function compiled per model, which
+# only visits the objects holding interned fields.
+
+_PERSON_FIELDS = ('country', 'country_full_name', 'city', 'state')
+
+# fields interned per model, their values being shared by many results; fields whose
+# values are mostly distinct, such as titles or logo URLs, are left out, as interning
+# them costs a lookup per value and keeps every value in the table
+INTERNED_FIELDS: Dict[str, Tuple[str, ...]] = {
+    'PersonEndpointResponse': _PERSON_FIELDS + ('industry', 'gender', 'languages'),
+    'PublicPerson': _PERSON_FIELDS,
+    'Experience': ('company', 'company_linkedin_profile_url'),
+    'Education': ('school', 'school_linkedin_profile_url', 'degree_name'),
+    'VolunteeringExperience': ('company', 'company_linkedin_profile_url'),
+    'LinkedinCompany': ('industry', 'company_type'),
+    'CompanyLocation': ('country', 'city', 'state'),
+}
+
+
+class InternTable:
+    """Values shared by the results of a client created with `intern=True`
+
+    Every such client has its own table, or the table given as `intern`,
+    e.g. :data:`INTERNED` to share values across clients. Up to `max_size`
+    distinct values are kept, further values are left as they are. Values
+    stay referenced by the table until :meth:`clear` is called, e.g. once the
+    results of a bulk job are released, or the table itself is released.
+
+    :param max_size: Distinct values kept, defaults to 1000000
+    :type max_size: int
+    """
+    max_size: int
+
+    def __init__(self, max_size: int = 1000000) -> None:
+        self.max_size = max_size
+        self._values = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def intern(self, value):
+        """Returns the shared copy of `value`"""
+        values = self._values
+        shared = values.get(value)
+        if shared is None:
+            if len(values) >= self.max_size:
+                return value
+            values[value] = shared = value
+        return shared
+
+    def clear(self) -> None:
+        self._values = {}
+
+
+# the table shared by the clients created with `intern=INTERNED`, and by default by `intern_response`
+INTERNED = InternTable()
+
+# interns the fields of an object in place
+Walker = Callable[[Any, InternTable], None]
+
+
+def _is_interned_type(hint) -> bool:
+    return hint in (str, int) or isinstance(hint, type) and issubclass(hint, str)
+
+
+def _field_action(hint) -> Optional[str]:
+    hint, _ = unwrap_optional(hint)
+    if get_origin(hint) in (list, tuple):
+        args = [arg for arg in get_args(hint) if arg is not Ellipsis]
+        return 'items' if args and _is_interned_type(unwrap_optional(args[0])[0]) else None
+    # enums are decoded as strings
+    return 'value' if _is_interned_type(hint) else None
+
+
+@lru_cache(maxsize=None)
+def _walker(model) -> Optional[Walker]:
+    interned = INTERNED_FIELDS.get(model.__name__, ())
+    values: List[str] = []
+    items: List[str] = []
+    nested: List[Tuple[str, Walker]] = []
+    for name, hint in get_type_hints(model).items():
+        if name in interned:
+            action = _field_action(hint)
+            if action == 'value':
+                values.append(name)
+            elif action == 'items':
+                items.append(name)
+        else:
+            hint, _ = unwrap_optional(hint)
+            walk_field = _walker(hint) if is_model(hint) else None
+            if walk_field is not None:
+                nested.append((name, walk_field))
+    if not (values or items or nested):
+        # nothing to intern below this model, its objects are not visited
+        return None
+
+    def walk(value, table):
+        intern = table.intern
+        for name in values:
+            field = value.get(name)
+            if type(field) is str or type(field) is int:
+                value[name] = intern(field)
+        for name in items:
+            field = value.get(name)
+            if type(field) is list:
+                for i, item in enumerate(field):
+                    if type(item) is str:
+                        field[i] = intern(item)
+        for name, walk_field in nested:
+            field = value.get(name)
+            if type(field) is dict:
+                walk_field(field, table)
+            elif type(field) is list:
+                # lists of objects are typed by their items in the models
+                for item in field:
+                    if type(item) is dict:
+                        walk_field(item, table)
+    return walk
+
+
+def intern_response(result_class, response: Any, table: InternTable = None) -> Any:
+    """Intern the low-cardinality fields of a decoded response in place
+
+    :param result_class: Model of the response, e.g. :class:`proxycurl.models.PersonEndpointResponse`
+    :param response: Decoded response, other results such as structs are left as they are
+    :param table: Table of the shared values, defaults to :data:`INTERNED`
+    :type table: :class:`InternTable`
+    :return: `response`
+    """
+    walk = _walker(result_class) if is_model(result_class) else None
+    if walk is not None:
+        table = INTERNED if table is None else table
+        for value in response if isinstance(response, list) else [response]:
+            if type(value) is dict:
+                walk(value, table)
+    return response
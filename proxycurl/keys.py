@@ -0,0 +1,125 @@
+import time
+from typing import List, Optional, Tuple, Union
+
+
+class ApiKey:
+    """State of one API key: its token bucket, 429 back-off and credit balance"""
+    key: str
+    rate_limit: Optional[float]
+    tokens: float
+    capacity: float
+    updated_at: float
+    backoff_until: float
+    in_flight: int
+    balance: Optional[int]
+
+    def __init__(self, key: str, rate_limit: Optional[float] = None) -> None:
+        self.key = key
+        self.rate_limit = rate_limit
+        # allow a burst of one second worth of requests
+        self.capacity = max(1.0, rate_limit / 60) if rate_limit else 1.0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.backoff_until = 0.0
+        self.in_flight = 0
+        self.balance = None
+
+    def __repr__(self) -> str:
+        return f'ApiKey(...{self.key[-4:]}, in_flight={self.in_flight}, balance={self.balance})'
+
+    def refill(self, now: float) -> None:
+        if self.rate_limit:
+            elapsed = now - self.updated_at
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate_limit / 60)
+        self.updated_at = now
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until a request can be sent with this key"""
+        self.refill(now)
+        wait = max(0.0, self.backoff_until - now)
+        if self.rate_limit and self.tokens < 1:
+            wait = max(wait, (1 - self.tokens) * 60 / self.rate_limit)
+        return wait
+
+    @property
+    def exhausted(self) -> bool:
+        return self.balance is not None and self.balance <= 0
+
+
+class KeyPool:
+    """Route requests across several API keys
+
+    Every key has its own token bucket and 429 back-off. A request is sent
+    with the key available the soonest, preferring the least loaded key and
+    then the key with the highest known credit balance. Keys without credits
+    left are only used once every key has run out.
+    """
+    keys: List[ApiKey]
+
+    def __init__(
+        self,
+        api_keys: Union[str, List[str]],
+        rate_limit: Optional[float] = None
+    ) -> None:
+        if isinstance(api_keys, str):
+            # several keys can be given as a comma-separated string, e.g. in PROXYCURL_API_KEY
+            api_keys = api_keys.split(',')
+        api_keys = [key.strip() for key in api_keys] or ['']
+        self.keys = [
+            ApiKey(key, float(rate_limit) if rate_limit else None)
+            for key in api_keys
+        ]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def acquire(
+        self,
+        pinned: ApiKey = None,
+        now: float = None
+    ) -> Tuple[ApiKey, float]:
+        """Pick a key for the next request
+
+        Returns the key and **0** once a token has been taken from its bucket,
+        otherwise the key and the seconds to wait before calling `acquire` again.
+        A `pinned` key is always returned instead of the best available key.
+        """
+        if now is None:
+            now = time.monotonic()
+        if pinned is not None:
+            candidates = [pinned]
+        else:
+            candidates = [key for key in self.keys if not key.exhausted] or self.keys
+        key = min(
+            candidates,
+            key=lambda key: (
+                key.wait_time(now),
+                key.in_flight,
+                -(key.balance if key.balance is not None else float('inf'))
+            )
+        )
+        wait = key.wait_time(now)
+        if wait > 0:
+            return key, wait
+        if key.rate_limit:
+            key.tokens -= 1
+        key.in_flight += 1
+        return key, 0.0
+
+    def release(self, key: ApiKey) -> None:
+        key.in_flight -= 1
+
+    def backoff(self, key: ApiKey, seconds: float) -> None:
+        """Stop using a key for some seconds after it was rate limited"""
+        key.backoff_until = max(key.backoff_until, time.monotonic() + seconds)
+
+    def set_balance(self, key: ApiKey, balance: int) -> None:
+        key.balance = balance
+
+    @property
+    def balance(self) -> int:
+        return sum(key.balance or 0 for key in self.keys)
+
+    @property
+    def has_credits(self) -> bool:
+        return any(not key.exhausted for key in self.keys)
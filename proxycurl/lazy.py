@@ -0,0 +1,73 @@
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator
+from proxycurl.codec import JsonCodec, get_codec
+
+try:
+    import msgspec
+    _split = msgspec.json.Decoder(Dict[str, msgspec.Raw]).decode
+    _decode = msgspec.json.Decoder().decode
+except ImportError:
+    msgspec = None
+
+
+class LazyResponse(Mapping):
+    """Response decoded field by field, when first accessed
+
+    Returned instead of the decoded result by clients created with `lazy=True`.
+    It reads like the `TypedDict` of the result, e.g. `profile['full_name']`
+    or `profile.get('experiences')`, but keeps the raw body and only decodes
+    the fields which are accessed, so the hundreds of nested entries of a
+    large profile are never built when unused.
+
+    The top level of the body is split without decoding its values with
+    `msgspec <https://jcristharif.com/msgspec/>`_ when installed (the `structs`
+    extra), otherwise the
+    whole body is decoded on first access.
+    """
+    __slots__ = ('_body', '_codec', '_fields', '_values')
+
+    def __init__(self, body: bytes, codec: JsonCodec = None) -> None:
+        self._body = body
+        self._codec = codec
+        self._fields = None
+        self._values = {}
+
+    def _index(self) -> Dict[str, Any]:
+        if self._fields is None:
+            if msgspec is not None:
+                self._fields = _split(self._body)
+            else:
+                self._values = get_codec(self._codec).loads(self._body)
+                self._fields = self._values
+        return self._fields
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+        fields = self._index()
+        if fields is self._values:
+            # the whole body was decoded without msgspec
+            return fields[key]
+        value = _decode(fields[key])
+        self._values[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index())
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index()
+
+    def __repr__(self) -> str:
+        return f'LazyResponse({len(self._body)} bytes, {len(self._values)} fields decoded)'
+
+    @property
+    def body(self) -> bytes:
+        return self._body
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Decode every field"""
+        return {key: self[key] for key in self}
@@ -0,0 +1,422 @@
+import sys
+from collections import Counter
+from contextlib import ExitStack, contextmanager, nullcontext
+from time import perf_counter
+from typing import Callable, ContextManager, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from proxycurl.budget import operation_client
+
+# Instrumentation of the requests of the clients. A client created with `metrics=hook` times every
+# attempt of a request into an `AttemptEvent` given to `hook.on_attempt` once the attempt ends;
+# without a hook no event is made, so a request only checks that it is **None**.
+
+# phases of an attempt, in seconds, `total` being the sum of the phases but `wait`
+PHASES = ('wait', 'connect', 'ttfb', 'body', 'decode', 'total')
+
+# the span of hooks which do not trace, entered by `do_bulk` and left at once
+NO_SPAN = nullcontext()
+
+
+def endpoint_path(url: str, base_url: str) -> str:
+    """Returns the path of the endpoint called by `url`
+
+    Paginated results link their next page by its absolute URL, which is
+    made relative to `base_url`, so that its attempts count for the same
+    endpoint as the first page.
+    """
+    if url.startswith(base_url):
+        return url[len(base_url):]
+    if url.startswith('http'):
+        return urlsplit(url).path
+    return url
+
+
+class AttemptEvent:
+    """Timings of one attempt of a request
+
+    `wait` is the time spent waiting for an API key, rate limit pacing and
+    backoff after a 429 included, `ttfb` the time from sending the request
+    to receiving the headers of the response, connection included, of which
+    `connect` is the part opening the connection, `body` the time reading
+    the body and `decode` the time decoding it. `connect` is only measured
+    by the *asyncio* backend, and phases which did not happen are **None**.
+    """
+    __slots__ = (
+        'method', 'endpoint', 'attempt', 'status', 'bytes', 'error',
+        'wait', 'connect', 'ttfb', 'body', 'decode', 'started', 'ended', '_mark', '_connecting',
+    )
+    method: str
+    endpoint: str
+    attempt: int
+    status: Optional[int]
+    bytes: Optional[int]
+    error: Optional[str]
+    # `time.perf_counter()` at the start and end of the attempt
+    started: float
+    ended: Optional[float]
+
+    def __init__(self, method: str, url: str, attempt: int) -> None:
+        self.method = method.upper()
+        self.endpoint = url.split('?', 1)[0]
+        self.attempt = attempt
+        self.status = None
+        self.bytes = None
+        self.error = None
+        self.wait = self.connect = self.ttfb = self.body = self.decode = None
+        self._connecting = None
+        self.ended = None
+        self.started = self._mark = perf_counter()
+
+    def key_acquired(self) -> None:
+        now = perf_counter()
+        self.wait = now - self._mark
+        self._mark = now
+
+    def connection_started(self) -> None:
+        self._connecting = perf_counter()
+
+    def connection_made(self) -> None:
+        if self._connecting is not None:
+            self.connect = (self.connect or 0.0) + perf_counter() - self._connecting
+
+    def headers_received(self, status: int, ttfb: float = None) -> None:
+        """Mark the headers of the response, or set `ttfb` when measured by the HTTP client"""
+        now = perf_counter()
+        self.status = status
+        if ttfb is None:
+            self.ttfb = now - self._mark
+            self._mark = now
+        else:
+            self.ttfb = ttfb
+            self._mark += ttfb
+
+    def body_received(self, size: int) -> None:
+        now = perf_counter()
+        self.bytes = size
+        self.body = now - self._mark
+        self._mark = now
+
+    def finish(self, error: BaseException = None) -> 'AttemptEvent':
+        """End the attempt, the time since the body was received being its decoding
+
+        :param error: Exception ending the attempt, defaults to the exception being raised, if any
+        """
+        if error is None:
+            error = sys.exc_info()[1]
+            if not isinstance(error, Exception):
+                # e.g. a value returned by a generator
+                error = None
+        self.ended = perf_counter()
+        if error is not None:
+            self.error = type(error).__name__
+        elif self.body is not None and self.status in (200, 202):
+            self.decode = self.ended - self._mark
+        return self
+
+    @property
+    def total(self) -> float:
+        return sum(phase for phase in (self.ttfb, self.body, self.decode) if phase is not None)
+
+    @property
+    def retry(self) -> bool:
+        return self.attempt > 1
+
+    def __repr__(self) -> str:
+        phases = ' '.join(
+            f'{name}={value * 1000:.1f}ms' for name in PHASES
+            for value in [getattr(self, name)] if value is not None
+        )
+        return f'<AttemptEvent {self.method} {self.endpoint} #{self.attempt} {self.status or self.error} {phases}>'
+
+
+class MetricsHook:
+    """Receives the :class:`AttemptEvent` of every request attempt of the clients created with `metrics=hook`
+
+    Hooks are called by the event loop of the client, so they must return
+    quickly: record the event, and leave aggregating or exporting it to
+    another thread or process. `do_bulk` and `do_enrich` also report their
+    queue, credits and cache to the hook of the client of their operations,
+    and `do_bulk` runs its job and operations in the spans of the hook, see
+    :class:`proxycurl.tracing.TracingHook`.
+    """
+
+    def span(self, name: str, parent=None, **attributes) -> ContextManager:
+        """Returns a context manager timing a span of `parent`, which is the current span by default
+
+        Hooks which do not trace return :data:`NO_SPAN`, entering it gives **None**.
+        """
+        return NO_SPAN
+
+    def on_attempt_start(self, event: AttemptEvent) -> None:
+        """The attempt got an API key and is being sent"""
+
+    def on_attempt(self, event: AttemptEvent) -> None:
+        """The attempt ended, see :meth:`AttemptEvent.finish`"""
+
+    def on_queue(self, depth: int) -> None:
+        """A worker of `do_bulk` took an operation, `depth` operations are left in its queue"""
+
+    def on_credits(self, endpoint: str, credits: int) -> None:
+        """An operation of `do_bulk` succeeded, spending `credits` estimated from its response"""
+
+    def on_cache(self, hit: bool) -> None:
+        """A call of `do_enrich` was looked up in its response cache"""
+
+
+class MetricsHooks(MetricsHook):
+    """Give every event to several hooks"""
+    hooks: List[MetricsHook]
+
+    def __init__(self, *hooks: MetricsHook) -> None:
+        self.hooks = list(hooks)
+
+    @contextmanager
+    def span(self, name: str, parent=None, **attributes):
+        with ExitStack() as stack:
+            spans = [stack.enter_context(hook.span(name, parent, **attributes)) for hook in self.hooks]
+            # the span of the first hook tracing
+            yield next((span for span in spans if span is not None), None)
+
+    def on_attempt_start(self, event: AttemptEvent) -> None:
+        for hook in self.hooks:
+            hook.on_attempt_start(event)
+
+    def on_attempt(self, event: AttemptEvent) -> None:
+        for hook in self.hooks:
+            hook.on_attempt(event)
+
+    def on_queue(self, depth: int) -> None:
+        for hook in self.hooks:
+            hook.on_queue(depth)
+
+    def on_credits(self, endpoint: str, credits: int) -> None:
+        for hook in self.hooks:
+            hook.on_credits(endpoint, credits)
+
+    def on_cache(self, hit: bool) -> None:
+        for hook in self.hooks:
+            hook.on_cache(hit)
+
+
+class Histogram:
+    """Histogram of durations with a bounded relative error, in the manner of HdrHistogram
+
+    Durations are counted in microseconds into buckets of exact values up to
+    `2 ** precision_bits`, and of geometrically growing width above, so that
+    a percentile is within `2 ** -(precision_bits - 1)` of the actual value
+    (under 2% by default) whatever its magnitude, with a few hundred buckets
+    for any range of durations.
+
+    :param precision_bits: Bits of precision of the buckets, defaults to 7
+    :type precision_bits: int
+    """
+    count: int
+    sum: float
+    min: Optional[float]
+    max: Optional[float]
+
+    def __init__(self, precision_bits: int = 7) -> None:
+        self.precision_bits = precision_bits
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+        self._counts: Dict[int, int] = {}
+
+    def _index(self, value: int) -> int:
+        bits = self.precision_bits
+        shift = value.bit_length() - bits
+        if shift <= 0:
+            return value
+        # the top `bits` bits of the value, the first of which is always set
+        return (shift << bits - 1) + (value >> shift)
+
+    def _value(self, index: int) -> int:
+        """Returns the highest value of a bucket"""
+        bits = self.precision_bits
+        if index < 1 << bits:
+            return index
+        shift = (index >> bits - 1) - 1
+        top = index - (shift << bits - 1)
+        return (top + 1 << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        """Count a duration"""
+        self.count += 1
+        self.sum += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+        index = self._index(max(0, int(seconds * 1e6)))
+        self._counts[index] = self._counts.get(index, 0) + 1
+
+    def merge(self, other: 'Histogram') -> None:
+        """Add the durations of a histogram of the same precision"""
+        if other.precision_bits != self.precision_bits:
+            raise ValueError('cannot merge histograms of different precisions')
+        self.count += other.count
+        self.sum += other.sum
+        for bound in (other.min, other.max):
+            if bound is not None:
+                self.min = bound if self.min is None else min(self.min, bound)
+                self.max = bound if self.max is None else max(self.max, bound)
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    def buckets(self) -> Iterator[Tuple[float, int]]:
+        """Returns the highest duration of every non-empty bucket, in seconds, and its count, in increasing order"""
+        for index in sorted(self._counts):
+            yield self._value(index) / 1e6, self._counts[index]
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Returns the duration under which `percentile` percent of the durations are, in seconds"""
+        if not self.count:
+            return None
+        rank = max(1, percentile / 100 * self.count)
+        seen = 0
+        for value, count in self.buckets():
+            seen += count
+            if seen >= rank:
+                return min(value, self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """Returns the count and the mean, median, 90th, 99th percentiles and maximum in seconds"""
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'max': self.max,
+        }
+
+
+class EndpointMetrics:
+    """Histograms of the phases of the attempts of an endpoint, and their counters"""
+    attempts: int
+    in_flight: int
+    retries: int
+    bytes: int
+    credits: int
+    statuses: Counter
+    errors: Counter
+    histograms: Dict[str, Histogram]
+
+    def __init__(self, precision_bits: int = 7) -> None:
+        self.attempts = 0
+        self.in_flight = 0
+        self.retries = 0
+        self.bytes = 0
+        self.credits = 0
+        self.statuses = Counter()
+        self.errors = Counter()
+        self.histograms = {phase: Histogram(precision_bits) for phase in PHASES}
+
+    def record(self, event: AttemptEvent) -> None:
+        self.attempts += 1
+        if event.attempt > 1:
+            self.retries += 1
+        if event.bytes is not None:
+            self.bytes += event.bytes
+        if event.status is not None:
+            self.statuses[event.status] += 1
+        if event.error is not None:
+            self.errors[event.error] += 1
+        histograms = self.histograms
+        for phase in ('wait', 'connect', 'ttfb', 'body', 'decode'):
+            value = getattr(event, phase)
+            if value is not None:
+                histograms[phase].record(value)
+        if event.ttfb is not None:
+            histograms['total'].record(event.total)
+
+
+class HistogramCollector(MetricsHook):
+    """Collect the attempts of every endpoint into :class:`EndpointMetrics`
+
+    ::
+
+        collector = HistogramCollector()
+        proxycurl = Proxycurl(metrics=collector)
+        ...
+        for endpoint, metrics in collector.endpoints.items():
+            print(endpoint, metrics.histograms['ttfb'].summary())
+
+    The collector also keeps the queue depth of `do_bulk` and the cache
+    lookups of `do_enrich`, see :mod:`proxycurl.prometheus` to export it all.
+
+    :param precision_bits: Bits of precision of the histograms, defaults to 7
+    :type precision_bits: int
+    """
+    endpoints: Dict[str, EndpointMetrics]
+    queue_depth: int
+    cache_hits: int
+    cache_misses: int
+
+    def __init__(self, precision_bits: int = 7) -> None:
+        self.precision_bits = precision_bits
+        self.reset()
+
+    def endpoint(self, endpoint: str) -> EndpointMetrics:
+        metrics = self.endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self.endpoints[endpoint] = EndpointMetrics(self.precision_bits)
+        return metrics
+
+    def on_attempt_start(self, event: AttemptEvent) -> None:
+        self.endpoint(event.endpoint).in_flight += 1
+
+    def on_attempt(self, event: AttemptEvent) -> None:
+        metrics = self.endpoint(event.endpoint)
+        if metrics.in_flight:
+            metrics.in_flight -= 1
+        metrics.record(event)
+
+    def on_queue(self, depth: int) -> None:
+        self.queue_depth = depth
+
+    def on_credits(self, endpoint: str, credits: int) -> None:
+        self.endpoint(endpoint).credits += credits
+
+    def on_cache(self, hit: bool) -> None:
+        if hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+
+    @property
+    def cache_hit_ratio(self) -> Optional[float]:
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else None
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, Optional[float]]]]:
+        """Returns the summary of every histogram of every endpoint with attempts"""
+        return {
+            endpoint: {
+                phase: histogram.summary()
+                for phase, histogram in metrics.histograms.items() if histogram.count
+            }
+            for endpoint, metrics in self.endpoints.items()
+        }
+
+    def reset(self) -> None:
+        self.endpoints = {}
+        self.queue_depth = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+
+def operation_metrics(func: Callable) -> Optional[MetricsHook]:
+    """Returns the hook of the client an operation is bound to, if any"""
+    try:
+        return operation_client(func).metrics
+    except AttributeError:
+        # not a method of a client
+        return None
@@ -368,6 +368,7 @@ class CompanyCustomer(TypedDict):
 
 class CustomerList(TypedDict):
     companies: CompanyCustomer
+    next_page: Optional[str]
 
 
 class CSearchResult(TypedDict):
@@ -0,0 +1,89 @@
+import json
+import os
+from typing import Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+def page_url(api_url: str, page_no: int) -> str:
+    """Returns `api_url` with its `page` parameter set to `page_no`
+
+    Endpoints paginated by page number, such as the job search, only return
+    the URL of the next page, from which the URL of any later page is derived.
+    """
+    parts = urlsplit(api_url)
+    query = [
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name != 'page'
+    ]
+    query.append(('page', str(page_no)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def page_fields(
+    fields: Optional[Iterable[str]],
+    items_key: str,
+    page_keys: List[str],
+    item_keys: List[str] = ()
+) -> Optional[List[str]]:
+    """Returns the `fields` of a page for the `fields` of its items
+
+    The keys of the page, such as `next_page`, and `item_keys` of the items
+    are kept for the pagination to follow.
+    """
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = [fields]
+    return [f'{items_key}.*.{field}' for field in [*fields, *item_keys]] + list(page_keys)
+
+
+class CursorStore:
+    """Remember the page a paginated crawl resumes from
+
+    The `next_page` URL is saved once every item of the current page has
+    been consumed, so a crawl which stopped part way through a page resumes
+    with that page. The cursor is cleared once the last page is consumed.
+    This store keeps the cursor in memory, see :class:`FileCursorStore`
+    to persist it across runs.
+    """
+    next_page: Optional[str]
+
+    def __init__(self, next_page: Optional[str] = None) -> None:
+        self.next_page = next_page
+
+    def load(self) -> Optional[str]:
+        return self.next_page
+
+    def save(self, next_page: str) -> None:
+        self.next_page = next_page
+
+    def clear(self) -> None:
+        self.next_page = None
+
+
+class FileCursorStore(CursorStore):
+    """Persist the cursor of a paginated crawl in a JSON file"""
+    path: str
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def load(self) -> Optional[str]:
+        try:
+            with open(self.path, 'r') as file:
+                return json.load(file).get('next_page')
+        except FileNotFoundError:
+            return None
+
+    def save(self, next_page: str) -> None:
+        # write a temporary file first so a crash never leaves a truncated cursor
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as file:
+            json.dump({'next_page': next_page}, file)
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
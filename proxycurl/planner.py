@@ -0,0 +1,187 @@
+import argparse
+import csv
+import math
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from proxycurl.budget import effective_page_size, estimate_cost, operation_endpoint
+from proxycurl.config import MAX_WORKERS, RATE_LIMIT
+from proxycurl.costs import ENDPOINT_COSTS, NAMED_OPERATIONS
+
+PlannedOp = Tuple[Union[Callable, str], Dict]
+
+# page size assumed for paginated endpoints without a `page_size` parameter
+DEFAULT_PAGE_SIZE = 10
+
+
+@dataclass
+class EndpointPlan:
+    operations: int = 0
+    requests: int = 0
+    credits: int = 0
+
+
+@dataclass
+class Plan:
+    operations: int = 0
+    requests: int = 0
+    credits: int = 0
+    seconds: float = 0.0
+    endpoints: Dict[str, EndpointPlan] = field(default_factory=dict)
+    unknown_operations: int = 0
+
+    @property
+    def hours(self) -> float:
+        return self.seconds / 3600
+
+    def __str__(self) -> str:
+        width = max([len(endpoint) for endpoint in self.endpoints] + [len('Endpoint')])
+        lines = [f'{"Endpoint":<{width}}  {"Ops":>8}  {"Requests":>10}  {"Credits":>10}']
+        for endpoint, endpoint_plan in sorted(self.endpoints.items()):
+            lines.append(
+                f'{endpoint:<{width}}  {endpoint_plan.operations:>8}  '
+                f'{endpoint_plan.requests:>10}  {endpoint_plan.credits:>10}'
+            )
+        lines.append(
+            f'{"Total":<{width}}  {self.operations:>8}  {self.requests:>10}  {self.credits:>10}'
+        )
+        if self.unknown_operations:
+            lines.append(f'{self.unknown_operations} operation(s) with unknown cost were not planned')
+        lines.append(f'Projected wall-clock time: {self.hours:.2f} hours')
+        return '\n'.join(lines)
+
+
+def resolve_endpoint(operation: Union[Callable, str]) -> Optional[str]:
+    """Returns the API endpoint of a library method or of an operation name such as `linkedin.person.get`"""
+    if isinstance(operation, str):
+        return NAMED_OPERATIONS.get(operation)
+    return operation_endpoint(operation)
+
+
+def plan(
+    ops: List[PlannedOp],
+    concurrency: int = MAX_WORKERS,
+    rate_limit: int = RATE_LIMIT,
+    latency: float = 2.0,
+    results_per_op: Optional[int] = None
+) -> Plan:
+    """Dry-run planner
+
+    Estimate the requests, credits and wall-clock time a bulk job will take
+    without calling the API.
+
+    :param ops: List of operation (library method or name such as `linkedin.person.get`) and parameter
+    :type ops: List[Tuple[Union[Callable, str], Dict]]
+    :param concurrency: Total concurrent request, defaults to 10
+    :type concurrency: int
+    :param rate_limit: Requests allowed per minute, defaults to 300
+    :type rate_limit: int
+    :param latency: Expected seconds per request, defaults to 2.0
+    :type latency: float
+    :param results_per_op: Expected results of each paginated operation, defaults to a single page
+    :type results_per_op: int
+    :return: Estimated requests and credits per endpoint and projected wall-clock time
+    :rtype: :class:`proxycurl.planner.Plan`
+    """
+    result = Plan()
+    longest_chain = 0
+    for operation, params in ops:
+        endpoint = resolve_endpoint(operation)
+        if endpoint is None:
+            result.unknown_operations += 1
+            continue
+
+        cost = ENDPOINT_COSTS[endpoint]
+        requests = 1
+        credits = estimate_cost(endpoint, params)
+        if cost.paginated and results_per_op is not None:
+            page_size = effective_page_size(endpoint, params) or DEFAULT_PAGE_SIZE
+            requests = max(1, math.ceil(results_per_op / page_size))
+            # the base cost is charged per page, results are charged once
+            base_credits = estimate_cost(endpoint, params, 0)
+            credits = (
+                base_credits * (requests - 1)
+                + estimate_cost(endpoint, params, results_per_op)
+            )
+
+        endpoint_plan = result.endpoints.setdefault(endpoint, EndpointPlan())
+        endpoint_plan.operations += 1
+        endpoint_plan.requests += requests
+        endpoint_plan.credits += credits
+        result.operations += 1
+        result.requests += requests
+        result.credits += credits
+        longest_chain = max(longest_chain, requests)
+
+    # pages of one operation are fetched one after another
+    throughput_seconds = result.requests * 60 / int(rate_limit)
+    concurrency_seconds = max(
+        result.requests * latency / int(concurrency),
+        longest_chain * latency
+    )
+    result.seconds = max(throughput_seconds, concurrency_seconds)
+    return result
+
+
+def plan_csv(
+    path: str,
+    operation: Union[Callable, str],
+    param: str,
+    column: int = 0,
+    params: Dict = None,
+    **kwargs
+) -> Plan:
+    """Dry-run planner for a CSV file with one operation per row
+
+    :param path: Path of the CSV file, the first row is a header
+    :type path: str
+    :param operation: Library method or operation name such as `linkedin.person.get`
+    :type operation: Union[Callable, str]
+    :param param: Parameter filled with the value of `column`, e.g. `linkedin_profile_url`
+    :type param: str
+    :param column: Index of the column, defaults to 0
+    :type column: int
+    :param params: Parameters shared by every operation
+    :type params: Dict
+    :return: See :func:`proxycurl.planner.plan`, which receives the remaining keyword arguments
+    :rtype: :class:`proxycurl.planner.Plan`
+    """
+    ops = []
+    with open(path, 'r') as file:
+        reader = csv.reader(file)
+        next(reader, None)
+        for row in reader:
+            ops.append((operation, {**(params or {}), param: row[column]}))
+    return plan(ops, **kwargs)
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description='Estimate credits, requests and time of a bulk job without calling the API'
+    )
+    parser.add_argument('csv', help='CSV file with a header row')
+    parser.add_argument('operation', choices=sorted(NAMED_OPERATIONS))
+    parser.add_argument('param', help='parameter filled from the CSV column')
+    parser.add_argument('--column', type=int, default=0)
+    parser.add_argument('--set', action='append', default=[], metavar='NAME=VALUE',
+                        help='parameter shared by every operation')
+    parser.add_argument('--concurrency', type=int, default=int(MAX_WORKERS))
+    parser.add_argument('--rate-limit', type=int, default=int(RATE_LIMIT))
+    parser.add_argument('--latency', type=float, default=2.0)
+    parser.add_argument('--results-per-op', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    print(plan_csv(
+        args.csv,
+        args.operation,
+        args.param,
+        column=args.column,
+        params=dict(value.split('=', 1) for value in args.set),
+        concurrency=args.concurrency,
+        rate_limit=args.rate_limit,
+        latency=args.latency,
+        results_per_op=args.results_per_op
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+from collections.abc import Mapping
+from functools import lru_cache
+from itertools import count
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from proxycurl.codec import JsonCodec, get_codec
+from proxycurl.costs import ENDPOINT_COSTS
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# a projection tree maps the kept keys of an object to the tree of their value, or to None to keep
+# the whole value; the key `*` applies its tree to every item of a list
+Tree = Optional[Dict[str, 'Tree']]
+
+_struct_names = count()
+
+
+def _check(tree: Tree, path: str) -> None:
+    if tree is None:
+        return
+    if '*' in tree and len(tree) > 1:
+        raise ValueError(f'cannot mix * with keys under {path}')
+    for key, subtree in tree.items():
+        _check(subtree, f'{path}.{key}' if path else key)
+
+
+def _compile(fields: Iterable[str]) -> Dict[str, Tree]:
+    tree = {}
+    for field in fields:
+        keys = field.split('.')
+        if not all(keys):
+            raise ValueError(f'invalid field {field}')
+        node = tree
+        for key in keys[:-1]:
+            if key in node and node[key] is None:
+                # the whole value is already kept
+                break
+            node = node.setdefault(key, {})
+        else:
+            node[keys[-1]] = None
+    _check(tree, '')
+    return tree
+
+
+def _apply(tree: Tree, value: Any) -> Any:
+    if tree is None:
+        return value
+    if isinstance(value, list):
+        # fields of a list of objects apply to every object, with or without `*`
+        item_tree = tree['*'] if '*' in tree else tree
+        return [_apply(item_tree, item) for item in value]
+    if isinstance(value, Mapping):
+        if '*' in tree:
+            return {key: _apply(tree['*'], item) for key, item in value.items()}
+        return {key: _apply(subtree, value[key]) for key, subtree in tree.items() if key in value}
+    return value
+
+
+def _struct_type(tree: Tree):
+    if tree is None:
+        return Any
+    if '*' in tree:
+        return Union[List[_struct_type(tree['*'])], None]
+    # field names are generated, the JSON keys may not be valid identifiers
+    names = {f'f{i}': key for i, key in enumerate(tree)}
+    struct = msgspec.defstruct(
+        f'Projection{next(_struct_names)}',
+        [
+            (name, Union[_struct_type(tree[key]), msgspec.UnsetType], msgspec.UNSET)
+            for name, key in names.items()
+        ],
+        rename=names,
+        kw_only=True,
+        gc=False,
+    )
+    return Union[struct, List[struct], None]
+
+
+def _from_struct(value: Any) -> Any:
+    if isinstance(value, msgspec.Struct):
+        return {
+            value.__struct_encode_fields__[i]: _from_struct(field)
+            for i, field in enumerate(msgspec.structs.astuple(value))
+            if field is not msgspec.UNSET
+        }
+    if isinstance(value, list) and any(isinstance(item, (msgspec.Struct, list)) for item in value):
+        return [_from_struct(item) for item in value]
+    return value
+
+
+class Projection:
+    """Fields of a response kept by the `fields` option of the library methods
+
+    Fields are dotted paths such as `full_name` or `experiences.*.company`,
+    `*` standing for every item of a list. With `msgspec
+    <https://jcristharif.com/msgspec/>`_ installed (the `structs` extra) the
+    response is decoded straight into the kept fields, skipping the rest of
+    the body without building it, otherwise the whole body is decoded before
+    being projected.
+    """
+    fields: Tuple[str, ...]
+    tree: Dict[str, Tree]
+
+    def __init__(self, fields: Iterable[str], count_key: str = None) -> None:
+        self.fields = tuple(fields)
+        self.tree = _compile(self.fields)
+        if count_key is not None and count_key not in self.tree:
+            # keep the results as empty objects for them to be counted
+            self.tree[count_key] = {'*': {}}
+        self._decoder = None
+        if msgspec is not None:
+            self._decoder = msgspec.json.Decoder(_struct_type(self.tree))
+
+    def __repr__(self) -> str:
+        return f'Projection({", ".join(self.fields)})'
+
+    def apply(self, response: Any) -> Any:
+        """Project a decoded response"""
+        return _apply(self.tree, response)
+
+    def decode(self, body: bytes, codec: JsonCodec = None) -> Any:
+        """Decode the kept fields of a response body"""
+        if self._decoder is not None:
+            try:
+                return _from_struct(self._decoder.decode(body))
+            except msgspec.ValidationError:
+                # a field of another shape than its path, e.g. `*` on an object
+                pass
+        return self.apply(get_codec(codec).loads(body))
+
+
+@lru_cache(maxsize=256)
+def _projection(fields: Tuple[str, ...], count_key: Optional[str]) -> Projection:
+    return Projection(fields, count_key)
+
+
+def get_projection(fields: Union[Iterable[str], Projection], endpoint: str = None) -> Projection:
+    """Returns the projection of `fields`
+
+    The results of endpoints charged per result are always kept, as empty
+    objects unless requested, for the credits of a call to be counted.
+
+    :param fields: Dotted paths of the fields to keep, or a :class:`Projection`
+    :type fields: Union[Iterable[str], Projection]
+    :param endpoint: API endpoint the response is from
+    :type endpoint: str
+    :rtype: :class:`proxycurl.projection.Projection`
+    :raise ValueError: If a path is invalid
+    """
+    if isinstance(fields, Projection):
+        return fields
+    if isinstance(fields, str):
+        fields = [fields]
+    cost = ENDPOINT_COSTS.get(endpoint)
+    return _projection(tuple(fields), cost.results_key if cost is not None else None)
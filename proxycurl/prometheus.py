@@ -0,0 +1,193 @@
+import os
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterable, List, Optional, Tuple
+
+from proxycurl.metrics import PHASES, Histogram, HistogramCollector
+
+# Rendering of a `HistogramCollector` in the Prometheus text exposition format, served by a small
+# HTTP server in a thread or written to a file of the textfile collector of the node exporter.
+# Histograms are rendered with fixed `le` buckets, counted from the finer buckets they record.
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# upper bounds of the buckets of the duration histograms, in seconds
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels: Iterable[Tuple[str, object]]) -> str:
+    text = ','.join(f'{name}="{_escape(str(value))}"' for name, value in labels)
+    return '{' + text + '}' if text else ''
+
+
+def _number(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Family:
+    def __init__(self, name: str, kind: str, help: str) -> None:
+        self.name = name
+        self.kind = kind
+        self.help = help
+        self.samples: List[str] = []
+
+    def add(self, value: float, labels: Iterable[Tuple[str, object]] = (), suffix: str = '') -> None:
+        self.samples.append(f'{self.name}{suffix}{_labels(labels)} {_number(value)}')
+
+    def histogram(self, histogram: Histogram, labels: List[Tuple[str, object]], bounds: Tuple[float, ...]) -> None:
+        recorded = list(histogram.buckets())
+        count = position = 0
+        for bound in bounds + (float('inf'),):
+            while position < len(recorded) and recorded[position][0] <= bound:
+                count += recorded[position][1]
+                position += 1
+            self.add(count, labels + [('le', _number(bound))], '_bucket')
+        self.add(histogram.sum, labels, '_sum')
+        self.add(histogram.count, labels, '_count')
+
+    def render(self) -> List[str]:
+        return [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} {self.kind}'] + self.samples
+
+
+def render(collector: HistogramCollector, prefix: str = 'proxycurl', buckets: Tuple[float, ...] = BUCKETS) -> str:
+    """Returns the metrics of a collector in the Prometheus text format
+
+    :param collector: Collector of the clients, i.e. their `metrics` hook
+    :type collector: :class:`proxycurl.metrics.HistogramCollector`
+    :param prefix: Prefix of the names of the metrics, defaults to `proxycurl`
+    :type prefix: str
+    :param buckets: Upper bounds of the buckets of the duration histograms in seconds, defaults to :data:`BUCKETS`
+    :type buckets: Tuple[float, ...]
+    :rtype: str
+    """
+    def family(name: str, kind: str, help: str) -> _Family:
+        return _Family(f'{prefix}_{name}', kind, help)
+
+    requests = family('requests_total', 'counter', 'Responses received, by endpoint and HTTP status')
+    errors = family('request_errors_total', 'counter', 'Failed attempts, by endpoint and exception')
+    retries = family('retries_total', 'counter', 'Attempts retrying a request')
+    rate_limited = family('rate_limited_total', 'counter', 'Responses with the 429 status')
+    in_flight = family('requests_in_flight', 'gauge', 'Attempts being sent')
+    received = family('response_bytes_total', 'counter', 'Bytes of the bodies of the responses')
+    credits = family('credits_spent_total', 'counter', 'Credits spent by do_bulk, estimated from the responses')
+    durations = family(
+        'request_duration_seconds', 'histogram', f'Duration of the phases of the attempts: {", ".join(PHASES)}'
+    )
+    # the collector is updated by the event loop of the clients while it is rendered
+    for endpoint, metrics in list(collector.endpoints.items()):
+        labels = [('endpoint', endpoint)]
+        for status, count in sorted(list(metrics.statuses.items())):
+            requests.add(count, labels + [('status', status)])
+        for error, count in sorted(list(metrics.errors.items())):
+            errors.add(count, labels + [('error', error)])
+        retries.add(metrics.retries, labels)
+        rate_limited.add(metrics.statuses.get(429, 0), labels)
+        in_flight.add(metrics.in_flight, labels)
+        received.add(metrics.bytes, labels)
+        credits.add(metrics.credits, labels)
+        for phase in PHASES:
+            histogram = metrics.histograms[phase]
+            if histogram.count:
+                durations.histogram(histogram, labels + [('phase', phase)], buckets)
+
+    queue_depth = family('bulk_queue_depth', 'gauge', 'Operations left in the queue of do_bulk')
+    queue_depth.add(collector.queue_depth)
+    cache_hits = family('cache_hits_total', 'counter', 'Calls of do_enrich answered from its response cache')
+    cache_hits.add(collector.cache_hits)
+    cache_misses = family('cache_misses_total', 'counter', 'Calls of do_enrich sent to the API')
+    cache_misses.add(collector.cache_misses)
+    hit_ratio = family('cache_hit_ratio', 'gauge', 'Ratio of the calls of do_enrich answered from its cache')
+    hit_ratio.add(collector.cache_hit_ratio or 0.0)
+
+    lines = []
+    for metric in (
+        requests, errors, retries, rate_limited, in_flight, received, credits, durations,
+        queue_depth, cache_hits, cache_misses, hit_ratio,
+    ):
+        lines += metric.render()
+    return '\n'.join(lines) + '\n'
+
+
+def write_textfile(collector: HistogramCollector, path: str, **kwargs) -> None:
+    """Write the metrics of a collector to `path`, e.g. in the directory of the textfile collector
+
+    The file is replaced at once, so it is never read half written.
+    """
+    text = render(collector, **kwargs)
+    descriptor, temporary = tempfile.mkstemp(prefix='.proxycurl-', dir=os.path.dirname(path) or '.')
+    try:
+        with os.fdopen(descriptor, 'w', encoding='utf-8') as file:
+            file.write(text)
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+
+
+class MetricsServer:
+    """Serve the metrics of a collector at `http://host:port/metrics` from a thread
+
+    ::
+
+        collector = HistogramCollector()
+        proxycurl = Proxycurl(metrics=collector)
+        server = MetricsServer(collector, port=9464)
+        ...
+        server.close()
+
+    :param collector: Collector of the clients, i.e. their `metrics` hook
+    :type collector: :class:`proxycurl.metrics.HistogramCollector`
+    :param port: Port to listen to, 0 picks a free port, see :attr:`port`
+    :type port: int
+    :param host: Address to listen to, defaults to `127.0.0.1`
+    :type host: str
+    """
+    collector: HistogramCollector
+    port: int
+
+    def __init__(self, collector: HistogramCollector, port: int = 9464, host: str = '127.0.0.1', **kwargs) -> None:
+        self.collector = collector
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(handler) -> None:
+                if handler.path.split('?', 1)[0] not in ('/', '/metrics'):
+                    handler.send_error(404)
+                    return
+                body = render(collector, **kwargs).encode('utf-8')
+                handler.send_response(200)
+                handler.send_header('Content-Type', CONTENT_TYPE)
+                handler.send_header('Content-Length', str(len(body)))
+                handler.end_headers()
+                handler.wfile.write(body)
+
+            def log_message(handler, format: str, *args) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread: Optional[threading.Thread] = threading.Thread(
+            target=self._server.serve_forever, name='proxycurl-metrics', daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'MetricsServer':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
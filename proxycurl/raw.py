@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import IO, Any, Dict
+from proxycurl.codec import JsonCodec, get_codec
+
+
+@dataclass
+class RawResponse:
+    """Undecoded body of a successful API response
+
+    Returned instead of the decoded result by clients created with `raw=True`,
+    e.g. to archive responses without parsing them.
+    """
+    body: bytes
+    status: int
+    url: str
+    headers: Dict[str, str]
+
+    def json(self, codec: JsonCodec = None) -> Any:
+        """Decode the body"""
+        return get_codec(codec).loads(self.body)
+
+    def write_to(self, file: IO[bytes]) -> int:
+        """Write the body to a binary file, returns the number of bytes written"""
+        return file.write(memoryview(self.body))
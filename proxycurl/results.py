@@ -0,0 +1,241 @@
+import os
+import pickle
+import sqlite3
+import tempfile
+from collections.abc import Sequence
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type
+from proxycurl.interning import InternTable
+
+# Stores of the results of `do_bulk`, indexed by the position of their operation. Results are
+# kept in memory by default, and spilled to a SQLite database past a memory threshold by
+# `SpillingResultStore`, so that a bulk job of millions of operations does not hold all of them.
+
+# characters of the message of an exception kept by its record
+MAX_ERROR_MESSAGE = 200
+
+# failures repeat the same few messages, e.g. the body of a 404
+_messages = InternTable(max_size=10000)
+
+
+class ResultError:
+    """Compact record of the exception of a failed operation
+
+    :func:`do_bulk`, :func:`do_pipeline` and :func:`do_enrich` keep this
+    record in place of the exception unless called with
+    `keep_exceptions=True`, so that failed results do not hold tracebacks,
+    their frames and whole response bodies.
+    """
+    __slots__ = ('type', 'status_code', 'endpoint', 'message')
+    type: Type[BaseException]
+    status_code: Optional[int]
+    endpoint: Optional[str]
+    message: str
+
+    def __init__(
+        self,
+        type: Type[BaseException],
+        status_code: Optional[int] = None,
+        endpoint: Optional[str] = None,
+        message: str = ''
+    ) -> None:
+        self.type = type
+        self.status_code = status_code
+        self.endpoint = endpoint
+        self.message = message
+
+    @classmethod
+    def from_exception(cls, error: BaseException) -> 'ResultError':
+        """Record the type, status code, endpoint and the start of the message of `error`"""
+        return cls(
+            type(error),
+            getattr(error, 'status_code', None),
+            getattr(error, 'endpoint', None),
+            _messages.intern(str(error)[:MAX_ERROR_MESSAGE]),
+        )
+
+    def __repr__(self) -> str:
+        status = f' {self.status_code}' if self.status_code is not None else ''
+        return f'<{self.type.__name__}{status} {self.endpoint or ""} {self.message!r}>'
+
+    def __str__(self) -> str:
+        return self.message
+
+
+# builds a result from its success, value and error, i.e. the `Result` of a backend
+ResultType = Callable[[bool, Any, Optional[BaseException]], Any]
+
+# the slot of a result held by the database
+_SPILLED = object()
+
+
+class ResultStore(Sequence):
+    """Results of :func:`do_bulk`, by the position of their operation
+
+    Stores are sequences, so results are iterated and indexed as the list
+    returned by default. This store keeps them in memory, see
+    :class:`SpillingResultStore` to bound the memory they take::
+
+        with SpillingResultStore(max_memory=512 * 2 ** 20) as store:
+            for result in await do_bulk(ops, store=store):
+                ...
+    """
+
+    def __init__(self) -> None:
+        self._results = []
+        self._result_type = None
+
+    def allocate(self, size: int, result_type: ResultType) -> None:
+        """Make room for the results of `size` operations, called by :func:`do_bulk`"""
+        self._results = [None] * size
+        self._result_type = result_type
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __getitem__(self, index):
+        return self._results[index]
+
+    def __setitem__(self, index: int, result) -> None:
+        self._results[index] = result
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({len(self)} results)'
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> 'ResultStore':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class SpillingResultStore(ResultStore):
+    """Keep results in memory up to `max_memory` bytes, and the next ones in a SQLite database
+
+    The memory taken by a result is estimated by its pickled size. Results
+    past the threshold are pickled into the `results` table of the database,
+    keyed by position, and unpickled when read. Results which cannot be
+    pickled are kept in memory.
+
+    :param max_memory: Estimated bytes of the results kept in memory, defaults to 256MB
+    :type max_memory: int
+    :param path: Path of the database, defaults to a temporary file removed by :meth:`close`
+    :type path: str
+    :param batch_size: Results written to the database at once, defaults to 100
+    :type batch_size: int
+
+    Once :meth:`close` removed the database, its results can no longer be
+    read, and reading one of them raises a `ValueError`.
+    """
+    max_memory: int
+    memory: int
+    spilled: int
+    closed: bool
+
+    def __init__(self, max_memory: int = 256 * 2 ** 20, path: str = None, batch_size: int = 100) -> None:
+        super().__init__()
+        self.max_memory = max_memory
+        self.memory = 0
+        self.spilled = 0
+        self.closed = False
+        self.path = path
+        self.batch_size = batch_size
+        self._temporary = path is None
+        self._db = None
+        self._pending: List[Tuple[int, bytes]] = []
+        # estimated bytes of the results kept in memory, by position
+        self._sizes: Dict[int, int] = {}
+
+    def __setitem__(self, index: int, result) -> None:
+        if self.closed:
+            raise ValueError('store is closed')
+        spilled = self._results[index] is _SPILLED
+        position = index % len(self)
+        data = _dumps(result)
+        # the result replaced, if kept in memory, no longer takes any
+        self.memory -= self._sizes.pop(position, 0)
+        if data is None or self._db is None and self.memory + len(data) <= self.max_memory:
+            if spilled:
+                self._flush()
+                self._db.execute('DELETE FROM results WHERE position = ?', (position,))
+                self.spilled -= 1
+            if data is not None:
+                self._sizes[position] = len(data)
+                self.memory += len(data)
+            self._results[index] = result
+            return
+        if self._db is None:
+            self._open()
+        if not spilled:
+            self._results[index] = _SPILLED
+            self.spilled += 1
+        self._pending.append((position, data))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        result = self._results[index]
+        if result is not _SPILLED:
+            return result
+        if self.closed:
+            raise ValueError('store is closed')
+        self._flush()
+        data, = self._db.execute('SELECT data FROM results WHERE position = ?', (index % len(self),)).fetchone()
+        return self._loads(data)
+
+    def __iter__(self) -> Iterator:
+        if self.closed and self.spilled:
+            raise ValueError('store is closed')
+        if self._db is None:
+            yield from self._results
+            return
+        self._flush()
+        # both are in order of position, so spilled results are read in one pass
+        rows = iter(self._db.execute('SELECT data FROM results ORDER BY position'))
+        for result in self._results:
+            yield self._loads(next(rows)[0]) if result is _SPILLED else result
+
+    def _loads(self, data: bytes):
+        return self._result_type(*pickle.loads(data))
+
+    def _open(self) -> None:
+        if self._temporary:
+            descriptor, self.path = tempfile.mkstemp(prefix='proxycurl-results-', suffix='.sqlite')
+            os.close(descriptor)
+        self._db = sqlite3.connect(self.path)
+        # the database only holds results until they are read, it is not made durable
+        self._db.execute('PRAGMA synchronous = OFF')
+        self._db.execute('PRAGMA journal_mode = OFF')
+        self._db.execute('DROP TABLE IF EXISTS results')
+        self._db.execute('CREATE TABLE results (position INTEGER PRIMARY KEY, data BLOB NOT NULL)')
+
+    def _flush(self) -> None:
+        if self._pending:
+            self._db.executemany('INSERT OR REPLACE INTO results VALUES (?, ?)', self._pending)
+            self._db.commit()
+            self._pending = []
+
+    def close(self) -> None:
+        """Close the database, and remove it unless its `path` was given"""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+            if self._temporary:
+                os.remove(self.path)
+                self.path = None
+        self._pending = []
+        self.closed = True
+
+
+def _dumps(result) -> Optional[bytes]:
+    if result is None:
+        return None
+    try:
+        return pickle.dumps((result.success, result.value, result.error), pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        # e.g. an error holding a connection
+        return None
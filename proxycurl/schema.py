@@ -0,0 +1,53 @@
+from typing import Any, Tuple, Union
+import sys
+if sys.version_info >= (3, 8):
+    from typing import get_args, get_origin
+else:
+    from typing_extensions import get_args, get_origin
+
+# the models type a list of objects as the object itself, which is told apart from a single object
+# by its nullability; these fields are the exceptions
+SINGLE_OBJECTS = frozenset([
+    ('PersonLookupUrlEnrichResult', 'profile'),
+    ('RoleSearchEnrichedResult', 'profile'),
+    ('CompanyUrlEnrichResult', 'profile'),
+    ('JobProfile', 'location'),
+    ('JobProfile', 'company'),
+])
+OBJECT_LISTS = frozenset([
+    ('Funding', 'investor_list'),
+    ('LinkedinCompany', 'funding_data'),
+    ('LinkedinCompany', 'exit_data'),
+])
+
+
+def is_model(hint) -> bool:
+    """Whether a type hint is one of the `TypedDict` models"""
+    return isinstance(hint, type) and issubclass(hint, dict) and hasattr(hint, '__annotations__')
+
+
+def unwrap_optional(hint) -> Tuple[Any, bool]:
+    """Returns the type of an `Optional` hint and whether it was optional"""
+    if get_origin(hint) is not Union:
+        return hint, False
+    args = [arg for arg in get_args(hint) if arg is not type(None)]
+    return (args[0] if len(args) == 1 else Any), len(args) < len(get_args(hint))
+
+
+def is_object_list(owner: str, name: str, optional: bool) -> bool:
+    """Whether the field `name` of the model `owner`, typed as a model, holds a list of objects"""
+    return (owner, name) in OBJECT_LISTS or (not optional and (owner, name) not in SINGLE_OBJECTS)
+
+
+def as_dict(result) -> Any:
+    """Returns a result as the dictionary of its model, whichever decoding the client uses"""
+    if isinstance(result, dict):
+        return result
+    if hasattr(result, '__struct_fields__'):
+        # a struct returned by a client created with `structs=True`
+        import msgspec
+        return msgspec.to_builtins(result)
+    if hasattr(result, 'to_dict'):
+        # a response returned by a client created with `lazy=True`
+        return result.to_dict()
+    return dict(result)
@@ -0,0 +1,125 @@
+import re
+from typing import Any, Callable, Dict, List, Optional
+from proxycurl.codec import JsonCodec, get_codec
+
+# bytes read from the connection at once when streaming a page
+CHUNK_SIZE = 64 * 1024
+
+# skips everything up to the next bracket or brace outside of a string, or up to a string which
+# is not complete yet
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_SKIP = re.compile(rb'[^"\[\]{}]*(?:' + _STRING + rb'[^"\[\]{}]*)*')
+_KEY = re.compile(rb'"([^"\\]*(?:\\.[^"\\]*)*)"\s*:\s*$')
+
+# bytes of the page kept before the items array to find its key
+_KEY_LOOKBACK = 256
+
+_HEAD, _ITEMS, _TAIL = range(3)
+
+
+class PageStream:
+    """Incremental parser of a page of paginated results
+
+    The body of a page is fed as it is received, and every item of the
+    `items_key` array is decoded as soon as its closing brace arrives, so
+    only about one item of the body is held in memory at once. The rest of
+    the page, such as `next_page`, is decoded once the body is complete::
+
+        stream = PageStream('employees')
+        for chunk in chunks:
+            for employee in stream.feed(chunk):
+                ...
+        next_page = stream.close().get('next_page')
+    """
+    items_key: str
+    items: int
+    page: Optional[Dict[str, Any]]
+
+    def __init__(
+        self,
+        items_key: str,
+        codec: JsonCodec = None,
+        decode_item: Callable[[bytes], Any] = None
+    ) -> None:
+        self.items_key = items_key
+        self.items = 0
+        self.page = None
+        self._key = items_key.encode()
+        self._loads = get_codec(codec).loads
+        self._decode_item = decode_item or self._loads
+        self._buffer = bytearray()
+        # the page without its items
+        self._page = bytearray()
+        self._state = _HEAD
+        self._depth = 0
+        self._item_start = None
+        # where parsing resumes in the buffer
+        self._pos = 0
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Parse the next chunk of the body, returns the items it completes"""
+        buffer = self._buffer
+        buffer += chunk
+        items = []
+        # start of the bytes not added to the page yet
+        consumed = 0
+        pos = self._pos
+        while True:
+            pos = _SKIP.match(buffer, pos).end()
+            if pos == len(buffer) or buffer[pos] == 0x22:
+                # wait for the rest of the body, or of a string
+                break
+            char = buffer[pos]
+            if char in b'[{':
+                if self._state == _HEAD and self._depth == 1 and char == 0x5b and self._is_items_key(buffer, pos):
+                    self._page += buffer[consumed:pos + 1]
+                    self._state = _ITEMS
+                elif self._state == _ITEMS and self._depth == 2:
+                    self._item_start = pos
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._state == _ITEMS:
+                    if self._depth == 2 and self._item_start is not None:
+                        items.append(self._decode_item(bytes(buffer[self._item_start:pos + 1])))
+                        self._item_start = None
+                    elif self._depth == 1:
+                        # end of the items array
+                        self._state = _TAIL
+                        consumed = pos
+            pos += 1
+
+        if self._state == _ITEMS:
+            # keep the item being received
+            cut = self._item_start if self._item_start is not None else pos
+            self._item_start = 0 if self._item_start is not None else None
+        else:
+            self._page += buffer[consumed:pos]
+            cut = pos
+        del buffer[:cut]
+        self._pos = pos - cut
+        self.items += len(items)
+        return items
+
+    def _is_items_key(self, buffer: bytearray, pos: int) -> bool:
+        head = bytes(self._page[-_KEY_LOOKBACK:]) + bytes(buffer[max(0, pos - _KEY_LOOKBACK):pos])
+        match = _KEY.search(head)
+        return match is not None and match.group(1) == self._key
+
+    def close(self) -> Dict[str, Any]:
+        """Decode the page once its body is complete, without the items already returned
+
+        :raise ValueError: If the body is incomplete or not valid JSON
+        """
+        if self._state == _ITEMS or self._depth != 0:
+            raise ValueError('incomplete page body')
+        self.page = self._loads(bytes(self._page + self._buffer))
+        return self.page
+
+    def set_page(self, page: Dict[str, Any]) -> List[Any]:
+        """Use a page decoded in full instead of the body, returns its items"""
+        self.page = dict(page)
+        items = self.page.get(self.items_key) or []
+        self.page[self.items_key] = []
+        self.items = len(items)
+        return items
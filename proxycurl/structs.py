@@ -0,0 +1,645 @@
+from typing import Dict, List, Optional, Tuple, Type, Union
+import msgspec
+
+# Compact counterparts of the TypedDict models of `proxycurl.models`,
+# decoded straight from the response body by clients created with `structs=True`.
+# Every field is optional, and an object field also accepts a list of objects.
+
+
+class CompanyLocation(msgspec.Struct, kw_only=True, gc=False):
+    country: Optional[str] = None
+    city: Optional[str] = None
+    postal_code: Optional[str] = None
+    line_1: Optional[str] = None
+    is_hq: Optional[bool] = None
+    state: Optional[str] = None
+
+
+class SimilarCompany(msgspec.Struct, kw_only=True, gc=False):
+    name: Optional[str] = None
+    link: Optional[str] = None
+    industry: Optional[str] = None
+    location: Optional[str] = None
+
+
+class AffiliatedCompany(msgspec.Struct, kw_only=True, gc=False):
+    name: Optional[str] = None
+    link: Optional[str] = None
+    industry: Optional[str] = None
+    location: Optional[str] = None
+
+
+class Date(msgspec.Struct, kw_only=True, gc=False):
+    day: Optional[int] = None
+    month: Optional[int] = None
+    year: Optional[int] = None
+
+
+class CompanyUpdate(msgspec.Struct, kw_only=True, gc=False):
+    article_link: Optional[str] = None
+    image: Optional[str] = None
+    posted_on: Union[Date, List[Date], None] = None
+    text: Optional[str] = None
+    total_likes: Optional[int] = None
+
+
+class LinkedinSchool(msgspec.Struct, kw_only=True, gc=False):
+    linkedin_internal_id: Optional[str] = None
+    description: Optional[str] = None
+    website: Optional[str] = None
+    industry: Optional[str] = None
+    company_size: Optional[Tuple[Optional[int], Optional[int]]] = None
+    company_size_on_linkedin: Optional[int] = None
+    hq: Union[CompanyLocation, List[CompanyLocation], None] = None
+    company_type: Optional[str] = None
+    founded_year: Optional[int] = None
+    specialities: Optional[List[str]] = None
+    locations: Union[CompanyLocation, List[CompanyLocation], None] = None
+    name: Optional[str] = None
+    tagline: Optional[str] = None
+    universal_name_id: Optional[str] = None
+    profile_pic_url: Optional[str] = None
+    background_cover_image_url: Optional[str] = None
+    search_id: Optional[str] = None
+    similar_companies: Union[SimilarCompany, List[SimilarCompany], None] = None
+    affiliated_companies: Union[AffiliatedCompany, List[AffiliatedCompany], None] = None
+    updates: Union[CompanyUpdate, List[CompanyUpdate], None] = None
+    follower_count: Optional[int] = None
+
+
+class AcquiredCompany(msgspec.Struct, kw_only=True, gc=False):
+    linkedin_profile_url: Optional[str] = None
+    crunchbase_profile_url: Optional[str] = None
+    announced_date: Union[Date, List[Date], None] = None
+    price: Optional[int] = None
+
+
+class Acquisitor(msgspec.Struct, kw_only=True, gc=False):
+    linkedin_profile_url: Optional[str] = None
+    crunchbase_profile_url: Optional[str] = None
+    announced_date: Union[Date, List[Date], None] = None
+    price: Optional[int] = None
+
+
+class Acquisition(msgspec.Struct, kw_only=True, gc=False):
+    acquired: Union[AcquiredCompany, List[AcquiredCompany], None] = None
+    acquired_by: Union[Acquisitor, List[Acquisitor], None] = None
+
+
+class Exit(msgspec.Struct, kw_only=True, gc=False):
+    linkedin_profile_url: Optional[str] = None
+    crunchbase_profile_url: Optional[str] = None
+    name: Optional[str] = None
+
+
+class CompanyDetails(msgspec.Struct, kw_only=True, gc=False):
+    crunchbase_profile_url: Optional[str] = None
+    ipo_status: Optional[str] = None
+    crunchbase_rank: Optional[int] = None
+    founding_date: Union[Date, List[Date], None] = None
+    operating_status: Optional[str] = None
+    company_type: Optional[str] = None
+    contact_email: Optional[str] = None
+    phone_number: Optional[str] = None
+    facebook_id: Optional[str] = None
+    twitter_id: Optional[str] = None
+    number_of_funding_rounds: Optional[int] = None
+    total_funding_amount: Optional[int] = None
+    stock_symbol: Optional[str] = None
+    ipo_date: Union[Date, List[Date], None] = None
+    number_of_lead_investors: Optional[int] = None
+    number_of_investors: Optional[int] = None
+    total_fund_raised: Optional[int] = None
+    number_of_investments: Optional[int] = None
+    number_of_lead_investments: Optional[int] = None
+    number_of_exits: Optional[int] = None
+    number_of_acquisitions: Optional[int] = None
+
+
+class Investor(msgspec.Struct, kw_only=True, gc=False):
+    linkedin_profile_url: Optional[str] = None
+    name: Optional[str] = None
+    type: Optional[str] = None
+
+
+class Funding(msgspec.Struct, kw_only=True, gc=False):
+    funding_type: Optional[str] = None
+    money_raised: Optional[int] = None
+    announced_date: Union[Date, List[Date], None] = None
+    number_of_investor: Optional[int] = None
+    investor_list: Union[Investor, List[Investor], None] = None
+
+
+class LinkedinCompany(msgspec.Struct, kw_only=True, gc=False):
+    linkedin_internal_id: Optional[str] = None
+    description: Optional[str] = None
+    website: Optional[str] = None
+    industry: Optional[str] = None
+    company_size: Optional[Tuple[Optional[int], Optional[int]]] = None
+    company_size_on_linkedin: Optional[int] = None
+    hq: Union[CompanyLocation, List[CompanyLocation], None] = None
+    company_type: Optional[str] = None
+    founded_year: Optional[int] = None
+    specialities: Optional[List[str]] = None
+    locations: Union[CompanyLocation, List[CompanyLocation], None] = None
+    name: Optional[str] = None
+    tagline: Optional[str] = None
+    universal_name_id: Optional[str] = None
+    profile_pic_url: Optional[str] = None
+    background_cover_image_url: Optional[str] = None
+    search_id: Optional[str] = None
+    similar_companies: Union[SimilarCompany, List[SimilarCompany], None] = None
+    affiliated_companies: Union[AffiliatedCompany, List[AffiliatedCompany], None] = None
+    updates: Union[CompanyUpdate, List[CompanyUpdate], None] = None
+    follower_count: Optional[int] = None
+    acquisitions: Union[Acquisition, List[Acquisition], None] = None
+    exit_data: Union[Exit, List[Exit], None] = None
+    extra: Union[CompanyDetails, List[CompanyDetails], None] = None
+    funding_data: Union[Funding, List[Funding], None] = None
+    categories: Optional[List[str]] = None
+    customer_list: Optional[List[str]] = None
+
+
+class Experience(msgspec.Struct, kw_only=True, gc=False):
+    starts_at: Union[Date, List[Date], None] = None
+    ends_at: Union[Date, List[Date], None] = None
+    company: Optional[str] = None
+    company_linkedin_profile_url: Optional[str] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    location: Optional[str] = None
+    logo_url: Optional[str] = None
+
+
+class Education(msgspec.Struct, kw_only=True, gc=False):
+    starts_at: Union[Date, List[Date], None] = None
+    ends_at: Union[Date, List[Date], None] = None
+    field_of_study: Optional[str] = None
+    degree_name: Optional[str] = None
+    school: Optional[str] = None
+    school_linkedin_profile_url: Optional[str] = None
+    description: Optional[str] = None
+    logo_url: Optional[str] = None
+    grade: Optional[str] = None
+    activities_and_societies: Optional[str] = None
+
+
+class AccomplishmentOrg(msgspec.Struct, kw_only=True, gc=False):
+    starts_at: Union[Date, List[Date], None] = None
+    ends_at: Union[Date, List[Date], None] = None
+    org_name: Optional[str] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+
+
+class Publication(msgspec.Struct, kw_only=True, gc=False):
+    name: Optional[str] = None
+    publisher: Optional[str] = None
+    published_on: Union[Date, List[Date], None] = None
+    description: Optional[str] = None
+    url: Optional[str] = None
+
+
+class HonourAward(msgspec.Struct, kw_only=True, gc=False):
+    title: Optional[str] = None
+    issuer: Optional[str] = None
+    issued_on: Union[Date, List[Date], None] = None
+    description: Optional[str] = None
+
+
+class Patent(msgspec.Struct, kw_only=True, gc=False):
+    title: Optional[str] = None
+    issuer: Optional[str] = None
+    issued_on: Union[Date, List[Date], None] = None
+    description: Optional[str] = None
+    application_number: Optional[str] = None
+    patent_number: Optional[str] = None
+    url: Optional[str] = None
+
+
+class Course(msgspec.Struct, kw_only=True, gc=False):
+    name: Optional[str] = None
+    number: Optional[str] = None
+
+
+class Project(msgspec.Struct, kw_only=True, gc=False):
+    starts_at: Union[Date, List[Date], None] = None
+    ends_at: Union[Date, List[Date], None] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    url: Optional[str] = None
+
+
+class TestScore(msgspec.Struct, kw_only=True, gc=False):
+    name: Optional[str] = None
+    score: Optional[str] = None
+    date_on: Union[Date, List[Date], None] = None
+    description: Optional[str] = None
+
+
+class VolunteeringExperience(msgspec.Struct, kw_only=True, gc=False):
+    starts_at: Union[Date, List[Date], None] = None
+    ends_at: Union[Date, List[Date], None] = None
+    title: Optional[str] = None
+    cause: Optional[str] = None
+    company: Optional[str] = None
+    company_linkedin_profile_url: Optional[str] = None
+    description: Optional[str] = None
+    logo_url: Optional[str] = None
+
+
+class Certification(msgspec.Struct, kw_only=True, gc=False):
+    starts_at: Union[Date, List[Date], None] = None
+    ends_at: Union[Date, List[Date], None] = None
+    name: Optional[str] = None
+    license_number: Optional[str] = None
+    display_source: Optional[str] = None
+    authority: Optional[str] = None
+    url: Optional[str] = None
+
+
+class PeopleAlsoViewed(msgspec.Struct, kw_only=True, gc=False):
+    link: Optional[str] = None
+    name: Optional[str] = None
+    summary: Optional[str] = None
+    location: Optional[str] = None
+
+
+class Activity(msgspec.Struct, kw_only=True, gc=False):
+    title: Optional[str] = None
+    link: Optional[str] = None
+    activity_status: Optional[str] = None
+
+
+class SimilarProfile(msgspec.Struct, kw_only=True, gc=False):
+    name: Optional[str] = None
+    link: Optional[str] = None
+    summary: Optional[str] = None
+    location: Optional[str] = None
+
+
+class Article(msgspec.Struct, kw_only=True, gc=False):
+    title: Optional[str] = None
+    link: Optional[str] = None
+    published_date: Union[Date, List[Date], None] = None
+    author: Optional[str] = None
+    image_url: Optional[str] = None
+
+
+class PersonGroup(msgspec.Struct, kw_only=True, gc=False):
+    profile_pic_url: Optional[str] = None
+    name: Optional[str] = None
+    url: Optional[str] = None
+
+
+class InferredSalary(msgspec.Struct, kw_only=True, gc=False):
+    min: Optional[float] = None
+    max: Optional[float] = None
+
+
+class PersonExtra(msgspec.Struct, kw_only=True, gc=False):
+    github_profile_id: Optional[str] = None
+    facebook_profile_id: Optional[str] = None
+    twitter_profile_id: Optional[str] = None
+
+
+class PersonEndpointResponse(msgspec.Struct, kw_only=True, gc=False):
+    public_identifier: Optional[str] = None
+    profile_pic_url: Optional[str] = None
+    background_cover_image_url: Optional[str] = None
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    full_name: Optional[str] = None
+    follower_count: Optional[int] = None
+    occupation: Optional[str] = None
+    headline: Optional[str] = None
+    summary: Optional[str] = None
+    country: Optional[str] = None
+    country_full_name: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    experiences: Union[Experience, List[Experience], None] = None
+    education: Union[Education, List[Education], None] = None
+    languages: Optional[List[str]] = None
+    accomplishment_organisations: Union[AccomplishmentOrg, List[AccomplishmentOrg], None] = None
+    accomplishment_publications: Union[Publication, List[Publication], None] = None
+    accomplishment_honors_awards: Union[HonourAward, List[HonourAward], None] = None
+    accomplishment_patents: Union[Patent, List[Patent], None] = None
+    accomplishment_courses: Union[Course, List[Course], None] = None
+    accomplishment_projects: Union[Project, List[Project], None] = None
+    accomplishment_test_scores: Union[TestScore, List[TestScore], None] = None
+    volunteer_work: Union[VolunteeringExperience, List[VolunteeringExperience], None] = None
+    certifications: Union[Certification, List[Certification], None] = None
+    connections: Optional[int] = None
+    people_also_viewed: Union[PeopleAlsoViewed, List[PeopleAlsoViewed], None] = None
+    recommendations: Optional[List[str]] = None
+    activities: Union[Activity, List[Activity], None] = None
+    similarly_named_profiles: Union[SimilarProfile, List[SimilarProfile], None] = None
+    articles: Union[Article, List[Article], None] = None
+    groups: Union[PersonGroup, List[PersonGroup], None] = None
+    skills: Optional[List[str]] = None
+    inferred_salary: Union[InferredSalary, List[InferredSalary], None] = None
+    gender: Optional[str] = None
+    birth_date: Union[Date, List[Date], None] = None
+    industry: Optional[str] = None
+    extra: Union[PersonExtra, List[PersonExtra], None] = None
+    interests: Optional[List[str]] = None
+    personal_emails: Optional[List[str]] = None
+    personal_numbers: Optional[List[str]] = None
+
+
+class CompanyCustomer(msgspec.Struct, kw_only=True, gc=False):
+    linkedin_company_profile_url: Optional[str] = None
+    twitter_profile_url: Optional[str] = None
+    email: Optional[str] = None
+
+
+class CustomerList(msgspec.Struct, kw_only=True, gc=False):
+    companies: Union[CompanyCustomer, List[CompanyCustomer], None] = None
+    next_page: Optional[str] = None
+
+
+class CSearchResult(msgspec.Struct, kw_only=True, gc=False):
+    linkedin_profile_url: Optional[str] = None
+    profile: Union[LinkedinCompany, List[LinkedinCompany], None] = None
+    last_updated: Optional[str] = None
+
+
+class CompanySearchResult(msgspec.Struct, kw_only=True, gc=False):
+    results: Union[CSearchResult, List[CSearchResult], None] = None
+    next_page: Optional[str] = None
+    total_result_count: Optional[int] = None
+
+
+class PublicPerson(msgspec.Struct, kw_only=True, gc=False):
+    public_identifier: Optional[str] = None
+    profile_pic_url: Optional[str] = None
+    background_cover_image_url: Optional[str] = None
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    full_name: Optional[str] = None
+    follower_count: Optional[int] = None
+    occupation: Optional[str] = None
+    headline: Optional[str] = None
+    summary: Optional[str] = None
+    country: Optional[str] = None
+    country_full_name: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    experiences: Union[Experience, List[Experience], None] = None
+    education: Union[Education, List[Education], None] = None
+    languages: Optional[List[str]] = None
+    accomplishment_organisations: Union[AccomplishmentOrg, List[AccomplishmentOrg], None] = None
+    accomplishment_publications: Union[Publication, List[Publication], None] = None
+    accomplishment_honors_awards: Union[HonourAward, List[HonourAward], None] = None
+    accomplishment_patents: Union[Patent, List[Patent], None] = None
+    accomplishment_courses: Union[Course, List[Course], None] = None
+    accomplishment_projects: Union[Project, List[Project], None] = None
+    accomplishment_test_scores: Union[TestScore, List[TestScore], None] = None
+    volunteer_work: Union[VolunteeringExperience, List[VolunteeringExperience], None] = None
+    certifications: Union[Certification, List[Certification], None] = None
+    connections: Optional[int] = None
+    people_also_viewed: Union[PeopleAlsoViewed, List[PeopleAlsoViewed], None] = None
+    recommendations: Optional[List[str]] = None
+    activities: Union[Activity, List[Activity], None] = None
+    similarly_named_profiles: Union[SimilarProfile, List[SimilarProfile], None] = None
+    articles: Union[Article, List[Article], None] = None
+    groups: Union[PersonGroup, List[PersonGroup], None] = None
+    skills: Optional[List[str]] = None
+
+
+class Employee(msgspec.Struct, kw_only=True, gc=False):
+    profile_url: Optional[str] = None
+    profile: Union[PublicPerson, List[PublicPerson], None] = None
+    last_updated: Optional[str] = None
+
+
+class EmployeeList(msgspec.Struct, kw_only=True, gc=False):
+    employees: Union[Employee, List[Employee], None] = None
+    next_page: Optional[str] = None
+
+
+class EmployeeCount(msgspec.Struct, kw_only=True, gc=False):
+    total_employee: Optional[int] = None
+    linkedin_employee_count: Optional[int] = None
+    linkdb_employee_count: Optional[int] = None
+    regression_notice: Optional[str] = None
+
+
+class ProfilePicture(msgspec.Struct, kw_only=True, gc=False):
+    tmp_profile_pic_url: Optional[str] = None
+
+
+class PersonLookupUrlEnrichResult(msgspec.Struct, kw_only=True, gc=False):
+    url: Optional[str] = None
+    name_similarity_score: Optional[float] = None
+    company_similarity_score: Optional[float] = None
+    title_similarity_score: Optional[float] = None
+    location_similarity_score: Optional[float] = None
+    profile: Union[PersonEndpointResponse, List[PersonEndpointResponse], None] = None
+    last_updated: Optional[str] = None
+
+
+class JobListEntry(msgspec.Struct, kw_only=True, gc=False):
+    company: Optional[str] = None
+    company_url: Optional[str] = None
+    job_title: Optional[str] = None
+    job_url: Optional[str] = None
+    list_date: Optional[str] = None
+    location: Optional[str] = None
+
+
+class JobListPage(msgspec.Struct, kw_only=True, gc=False):
+    job: Union[JobListEntry, List[JobListEntry], None] = None
+    next_page_no: Optional[int] = None
+    next_page_api_url: Optional[str] = None
+    previous_page_no: Optional[int] = None
+    previous_page_api_url: Optional[str] = None
+
+
+class JobListCount(msgspec.Struct, kw_only=True, gc=False):
+    count: Optional[int] = None
+
+
+class RoleSearchEnrichedResult(msgspec.Struct, kw_only=True, gc=False):
+    linkedin_profile_url: Optional[str] = None
+    profile: Union[PersonEndpointResponse, List[PersonEndpointResponse], None] = None
+    last_updated: Optional[str] = None
+
+
+class CompanyUrlEnrichResult(msgspec.Struct, kw_only=True, gc=False):
+    url: Optional[str] = None
+    profile: Union[LinkedinCompany, List[LinkedinCompany], None] = None
+    last_updated: Optional[str] = None
+
+
+class Student(msgspec.Struct, kw_only=True, gc=False):
+    profile_url: Optional[str] = None
+    profile: Union[PublicPerson, List[PublicPerson], None] = None
+    last_updated: Optional[str] = None
+
+
+class StudentList(msgspec.Struct, kw_only=True, gc=False):
+    students: Union[Student, List[Student], None] = None
+    next_page: Optional[str] = None
+
+
+class ReverseEmailUrlEnrichResult(msgspec.Struct, kw_only=True, gc=False):
+    linkedin_profile_url: Optional[str] = None
+    twitter_profile_url: Optional[str] = None
+    facebook_profile_url: Optional[str] = None
+    url: Optional[str] = None
+    similarity_score: Optional[float] = None
+    backwards_compatibility_notes: Optional[str] = None
+    profile: Union[PersonEndpointResponse, List[PersonEndpointResponse], None] = None
+    last_updated: Optional[str] = None
+
+
+class ReverseContactNumberResult(msgspec.Struct, kw_only=True, gc=False):
+    linkedin_profile_url: Optional[str] = None
+    twitter_profile_url: Optional[str] = None
+    facebook_profile_url: Optional[str] = None
+
+
+class ExtractionEmailResult(msgspec.Struct, kw_only=True, gc=False):
+    email_queue_count: Optional[int] = None
+
+
+class SearchResult(msgspec.Struct, kw_only=True, gc=False):
+    linkedin_profile_url: Optional[str] = None
+    profile: Union[PublicPerson, List[PublicPerson], None] = None
+    last_updated: Optional[str] = None
+
+
+class PersonSearchResult(msgspec.Struct, kw_only=True, gc=False):
+    results: Union[SearchResult, List[SearchResult], None] = None
+    next_page: Optional[str] = None
+    total_result_count: Optional[int] = None
+
+
+class JobLocation(msgspec.Struct, kw_only=True, gc=False):
+    country: Optional[str] = None
+    region: Optional[str] = None
+    city: Optional[str] = None
+    postal_code: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    street: Optional[str] = None
+
+
+class JobCompany(msgspec.Struct, kw_only=True, gc=False):
+    name: Optional[str] = None
+    url: Optional[str] = None
+    logo: Optional[str] = None
+
+
+class JobProfile(msgspec.Struct, kw_only=True, gc=False):
+    linkedin_internal_id: Optional[str] = None
+    job_description: Optional[str] = None
+    apply_url: Optional[str] = None
+    title: Optional[str] = None
+    location: Union[JobLocation, List[JobLocation], None] = None
+    company: Union[JobCompany, List[JobCompany], None] = None
+    seniority_level: Optional[str] = None
+    industry: Optional[List[str]] = None
+    employment_type: Optional[str] = None
+    job_functions: Optional[List[str]] = None
+    total_applicants: Optional[int] = None
+
+
+class CreditBalance(msgspec.Struct, kw_only=True, gc=False):
+    credit_balance: Optional[int] = None
+
+
+class DisposableEmail(msgspec.Struct, kw_only=True, gc=False):
+    is_disposable_email: Optional[bool] = None
+    is_free_email: Optional[bool] = None
+
+
+class PersonalContactNumbers(msgspec.Struct, kw_only=True, gc=False):
+    numbers: Optional[List[str]] = None
+
+
+class PDLEmailResult(msgspec.Struct, kw_only=True, gc=False):
+    emails: Optional[List[str]] = None
+    invalid_emails: Optional[List[str]] = None
+
+
+STRUCTS: Dict[str, Type[msgspec.Struct]] = {
+    'CompanyLocation': CompanyLocation,
+    'SimilarCompany': SimilarCompany,
+    'AffiliatedCompany': AffiliatedCompany,
+    'Date': Date,
+    'CompanyUpdate': CompanyUpdate,
+    'LinkedinSchool': LinkedinSchool,
+    'AcquiredCompany': AcquiredCompany,
+    'Acquisitor': Acquisitor,
+    'Acquisition': Acquisition,
+    'Exit': Exit,
+    'CompanyDetails': CompanyDetails,
+    'Investor': Investor,
+    'Funding': Funding,
+    'LinkedinCompany': LinkedinCompany,
+    'Experience': Experience,
+    'Education': Education,
+    'AccomplishmentOrg': AccomplishmentOrg,
+    'Publication': Publication,
+    'HonourAward': HonourAward,
+    'Patent': Patent,
+    'Course': Course,
+    'Project': Project,
+    'TestScore': TestScore,
+    'VolunteeringExperience': VolunteeringExperience,
+    'Certification': Certification,
+    'PeopleAlsoViewed': PeopleAlsoViewed,
+    'Activity': Activity,
+    'SimilarProfile': SimilarProfile,
+    'Article': Article,
+    'PersonGroup': PersonGroup,
+    'InferredSalary': InferredSalary,
+    'PersonExtra': PersonExtra,
+    'PersonEndpointResponse': PersonEndpointResponse,
+    'CompanyCustomer': CompanyCustomer,
+    'CustomerList': CustomerList,
+    'CSearchResult': CSearchResult,
+    'CompanySearchResult': CompanySearchResult,
+    'PublicPerson': PublicPerson,
+    'Employee': Employee,
+    'EmployeeList': EmployeeList,
+    'EmployeeCount': EmployeeCount,
+    'ProfilePicture': ProfilePicture,
+    'PersonLookupUrlEnrichResult': PersonLookupUrlEnrichResult,
+    'JobListEntry': JobListEntry,
+    'JobListPage': JobListPage,
+    'JobListCount': JobListCount,
+    'RoleSearchEnrichedResult': RoleSearchEnrichedResult,
+    'CompanyUrlEnrichResult': CompanyUrlEnrichResult,
+    'Student': Student,
+    'StudentList': StudentList,
+    'ReverseEmailUrlEnrichResult': ReverseEmailUrlEnrichResult,
+    'ReverseContactNumberResult': ReverseContactNumberResult,
+    'ExtractionEmailResult': ExtractionEmailResult,
+    'SearchResult': SearchResult,
+    'PersonSearchResult': PersonSearchResult,
+    'JobLocation': JobLocation,
+    'JobCompany': JobCompany,
+    'JobProfile': JobProfile,
+    'CreditBalance': CreditBalance,
+    'DisposableEmail': DisposableEmail,
+    'PersonalContactNumbers': PersonalContactNumbers,
+    'PDLEmailResult': PDLEmailResult,
+}
+
+_decoders: Dict[str, msgspec.json.Decoder] = {}
+
+
+def decoder(result_class: str) -> msgspec.json.Decoder:
+    """Returns the decoder of the struct named like a result class of `proxycurl.models`"""
+    if result_class not in _decoders:
+        _decoders[result_class] = msgspec.json.Decoder(STRUCTS[result_class], strict=False)
+    return _decoders[result_class]
+
+
+def to_builtins(struct: msgspec.Struct) -> Dict:
+    """Convert a struct to the dictionary of its TypedDict model"""
+    return msgspec.to_builtins(struct)
\ No newline at end of file
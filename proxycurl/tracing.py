@@ -0,0 +1,244 @@
+import json
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import IO, Any, Dict, Iterator, List, Optional, Union
+
+from proxycurl.metrics import AttemptEvent, MetricsHook
+
+# Tracing of bulk jobs, their operations and the attempts of their requests, in the manner of
+# OpenTelemetry. A client created with `metrics=TracingHook(tracer)` gets a span per `do_bulk` job,
+# per operation and per HTTP attempt, the latter with child spans for the wait for an API key
+# (backoff included) and the decoding of the response. Without a hook nothing is traced.
+
+# converts `time.perf_counter()`, which spans are timed with, to seconds since the epoch
+_EPOCH = time.time() - perf_counter()
+
+_current_span: 'ContextVar[Optional[Span]]' = ContextVar('proxycurl_span', default=None)
+
+
+def current_span() -> Optional['Span']:
+    """Returns the span entered by the current task, greenlet or `inlineCallbacks` generator, if any"""
+    return _current_span.get()
+
+
+class Span:
+    """A timed step of a trace, e.g. an operation of a bulk job
+
+    Times are given by `time.perf_counter()`, :meth:`to_dict` converts them
+    to nanoseconds since the epoch.
+    """
+    __slots__ = ('name', 'trace_id', 'span_id', 'parent_id', 'start', 'end', 'attributes', 'error')
+    name: str
+    trace_id: int
+    span_id: int
+    parent_id: Optional[int]
+    start: float
+    end: Optional[float]
+    attributes: Dict[str, Any]
+    error: Optional[str]
+
+    def __init__(
+        self,
+        name: str,
+        parent: 'Span' = None,
+        attributes: Dict[str, Any] = None,
+        start: float = None
+    ) -> None:
+        self.name = name
+        self.trace_id = parent.trace_id if parent is not None else random.getrandbits(128)
+        self.span_id = random.getrandbits(64)
+        self.parent_id = parent.span_id if parent is not None else None
+        self.start = perf_counter() if start is None else start
+        self.end = None
+        self.attributes = attributes or {}
+        self.error = None
+
+    def set_attribute(self, name: str, value: Any) -> None:
+        self.attributes[name] = value
+
+    def record_error(self, error: Union[BaseException, str]) -> None:
+        """Mark the span as failed, with the class name of `error`"""
+        self.error = error if isinstance(error, str) else type(error).__name__
+
+    @property
+    def duration(self) -> Optional[float]:
+        return self.end - self.start if self.end is not None else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the span in the JSON encoding of OpenTelemetry"""
+        span = {
+            'traceId': f'{self.trace_id:032x}',
+            'spanId': f'{self.span_id:016x}',
+            'name': self.name,
+            'startTimeUnixNano': int((self.start + _EPOCH) * 1e9),
+            'endTimeUnixNano': int((self.end + _EPOCH) * 1e9) if self.end is not None else None,
+            'attributes': self.attributes,
+            'status': {'code': 'ERROR', 'message': self.error} if self.error is not None else {'code': 'OK'},
+        }
+        if self.parent_id is not None:
+            span['parentSpanId'] = f'{self.parent_id:016x}'
+        return span
+
+    def __repr__(self) -> str:
+        duration = f' {self.duration * 1000:.1f}ms' if self.end is not None else ''
+        return f'<Span {self.name}{duration}{" " + self.error if self.error else ""}>'
+
+
+class SpanExporter:
+    """Receives the ended spans of a :class:`Tracer`, in batches"""
+
+    def export(self, spans: List[Span]) -> None:
+        """A batch of spans ended, children before their parent"""
+
+    def close(self) -> None:
+        """The tracer was closed, no more spans are exported"""
+
+
+class InMemoryExporter(SpanExporter):
+    """Keep the spans in :attr:`spans`, e.g. for tests"""
+    spans: List[Span]
+
+    def __init__(self) -> None:
+        self.spans = []
+
+    def export(self, spans: List[Span]) -> None:
+        self.spans.extend(spans)
+
+
+class JsonLinesExporter(SpanExporter):
+    """Write every span as a line of JSON, see :meth:`Span.to_dict`
+
+    :param file: Path of the file, which is appended to, or a text file
+    :type file: Union[str, IO[str]]
+    """
+
+    def __init__(self, file: Union[str, IO[str]]) -> None:
+        self._close = isinstance(file, str)
+        self._file = open(file, 'a', encoding='utf-8') if self._close else file
+
+    def export(self, spans: List[Span]) -> None:
+        self._file.writelines(json.dumps(span.to_dict(), default=str) + '\n' for span in spans)
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._close:
+            self._file.close()
+
+
+class Tracer:
+    """Start spans and give them to an exporter once they end
+
+    Ended spans are exported in batches of `batch_size`, and when a trace
+    ends, i.e. a span without parent, or :meth:`flush` is called.
+
+    :param exporter: Exporter of the spans
+    :type exporter: :class:`SpanExporter`
+    :param batch_size: Ended spans exported at once, defaults to 512
+    :type batch_size: int
+    """
+    exporter: SpanExporter
+    batch_size: int
+
+    def __init__(self, exporter: SpanExporter, batch_size: int = 512) -> None:
+        self.exporter = exporter
+        self.batch_size = batch_size
+        self._ended: List[Span] = []
+
+    def start_span(
+        self,
+        name: str,
+        parent: Span = None,
+        attributes: Dict[str, Any] = None,
+        start: float = None
+    ) -> Span:
+        """Returns a new span, the child of `parent` or else of the current span"""
+        return Span(name, parent if parent is not None else _current_span.get(), attributes, start)
+
+    def end_span(self, span: Span, end: float = None) -> None:
+        span.end = perf_counter() if end is None else end
+        self._ended.append(span)
+        if span.parent_id is None or len(self._ended) >= self.batch_size:
+            self.flush()
+
+    @contextmanager
+    def span(self, name: str, parent: Span = None, **attributes) -> Iterator[Span]:
+        """Time a span, which is the current span until it ends
+
+        ::
+
+            with tracer.span('enrich', source='crm') as span:
+                results = await do_bulk(ops)
+        """
+        span = self.start_span(name, parent, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except Exception as e:
+            span.record_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span)
+
+    def flush(self) -> None:
+        ended, self._ended = self._ended, []
+        if ended:
+            self.exporter.export(ended)
+
+    def close(self) -> None:
+        self.flush()
+        self.exporter.close()
+
+
+class TracingHook(MetricsHook):
+    """Trace bulk jobs, their operations and every attempt of their requests
+
+    `do_bulk` runs in a `proxycurl.bulk` span, and each of its operations in
+    a `proxycurl.operation` span. Each attempt of a request is a
+    `proxycurl.attempt` span of the current span, with its status, size and
+    phases as attributes. Its `proxycurl.wait` child is the wait for an API
+    key, rate limit pacing and backoff after a 429 included, and its
+    `proxycurl.decode` child the decoding of the response::
+
+        tracer = Tracer(JsonLinesExporter('spans.jsonl'))
+        proxycurl = Proxycurl(metrics=TracingHook(tracer))
+
+    Use :class:`proxycurl.metrics.MetricsHooks` to also collect metrics.
+
+    :param tracer: Tracer of the spans
+    :type tracer: :class:`Tracer`
+    """
+    tracer: Tracer
+
+    def __init__(self, tracer: Tracer) -> None:
+        self.tracer = tracer
+
+    def span(self, name: str, parent: Span = None, **attributes):
+        return self.tracer.span(name, parent, **attributes)
+
+    def on_attempt(self, event: AttemptEvent) -> None:
+        tracer = self.tracer
+        attributes = {
+            'http.method': event.method,
+            'proxycurl.endpoint': event.endpoint,
+            'proxycurl.attempt': event.attempt,
+        }
+        if event.status is not None:
+            attributes['http.status_code'] = event.status
+        if event.bytes is not None:
+            attributes['proxycurl.bytes'] = event.bytes
+        for phase in ('connect', 'ttfb', 'body'):
+            value = getattr(event, phase)
+            if value is not None:
+                attributes[f'proxycurl.{phase}'] = value
+        attempt = tracer.start_span('proxycurl.attempt', attributes=attributes, start=event.started)
+        if event.error is not None:
+            attempt.record_error(event.error)
+        if event.wait is not None:
+            tracer.end_span(Span('proxycurl.wait', attempt, start=event.started), end=event.started + event.wait)
+        if event.decode is not None:
+            tracer.end_span(Span('proxycurl.decode', attempt, start=event.ended - event.decode), end=event.ended)
+        tracer.end_span(attempt, end=event.ended)
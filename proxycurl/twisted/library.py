@@ -1,12 +1,19 @@
 from twisted.internet import defer
 from twisted.internet.defer import Deferred, inlineCallbacks
+from typing import Any, Callable, List, Union
 from proxycurl.config import (
-    BASE_URL, PROXYCURL_API_KEY, TIMEOUT, MAX_RETRIES, MAX_BACKOFF_SECONDS
+    BASE_URL, PROXYCURL_API_KEY, TIMEOUT, MAX_RETRIES, MAX_BACKOFF_SECONDS,
+    RATE_LIMIT, JSON_CODEC
 )
 from proxycurl.twisted.base import ProxycurlBase
+from proxycurl.codec import JsonCodec
+from proxycurl.interning import InternTable
+from proxycurl.metrics import MetricsHook
+from proxycurl.pagination import CursorStore
 from proxycurl.models import (
     PersonEndpointResponse,
     PersonSearchResult,
+    SearchResult,
     PersonLookupUrlEnrichResult,
     ReverseEmailUrlEnrichResult,
     ReverseContactNumberResult,
@@ -16,16 +23,21 @@ from proxycurl.models import (
     ProfilePicture,
     LinkedinCompany,
     CompanySearchResult,
+    CSearchResult,
     CompanyUrlEnrichResult,
     JobListPage,
+    JobListEntry,
     JobListCount,
     EmployeeCount,
     EmployeeList,
+    Employee,
     RoleSearchEnrichedResult,
     LinkedinSchool,
     StudentList,
+    Student,
     JobProfile,
     CustomerList,
+    CompanyCustomer,
     CreditBalance,
 )
 
@@ -50,6 +62,7 @@ class _LinkedinPerson:
         twitter_profile_url: str = None,
         facebook_profile_url: str = None,
         linkedin_profile_url: str = None,
+        fields: List[str] = None,
     ) -> Deferred:
         """Person Profile Endpoint
         
@@ -144,6 +157,9 @@ class _LinkedinPerson:
 
             yes (Include only one of: `linkedin_profile_url`, `twitter_profile_url`, or `facebook_profile_url`)
         :type linkedin_profile_url: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -183,7 +199,8 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=PersonEndpointResponse
+            result_class=PersonEndpointResponse,
+            fields=fields
         )
         defer.returnValue(resp)
 
@@ -237,6 +254,7 @@ class _LinkedinPerson:
         page_size: str = None,
         enrich_profiles: str = None,
         after: str = None,
+        fields: List[str] = None,
     ) -> Deferred:
         """Person Search Endpoint
         
@@ -452,6 +470,12 @@ class _LinkedinPerson:
 
             Calling this API endpoint with this parameter would add `1` credit per result returned.
         :type enrich_profiles: str
+        :param after: The cursor of the page to fetch, as found in the `next_page` URL of the previous page.
+            Omit this parameter to fetch the first page.
+        :type after: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -559,10 +583,63 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=PersonSearchResult
+            result_class=PersonSearchResult,
+            fields=fields
         )
         defer.returnValue(resp)
 
+    def search_iter(
+        self,
+        collector: Callable[[SearchResult], Any],
+        max_results: int = None,
+        max_credits: int = None,
+        prefetch: bool = True,
+        cursor: CursorStore = None,
+        stream: bool = False,
+        **kwargs
+    ) -> Deferred:
+        """Person Search Endpoint, streaming results across pages
+
+        Takes the parameters of :meth:`search` and follows `next_page` until the last page,
+        calling `collector` with every :class:`proxycurl.models.SearchResult`.
+        When `collector` returns a Deferred, the next result waits for it to fire.
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param collector: Called with every result
+        :type collector: Callable
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Stop before fetching a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :param prefetch: Fetch the next page while the current page is consumed, defaults to **True**
+        :type prefetch: bool
+        :param cursor: Resume from the page saved in this store and save the next page to it
+            once the current page is consumed, defaults to **None**
+        :type cursor: :class:`proxycurl.pagination.CursorStore`
+        :param stream: Parse every page as it is received, one page at a time, so that its first results
+            are returned before it finishes and about one result is held in memory, defaults to **False**
+        :type stream: bool
+        :return: Deferred firing with the number of results collected
+        :rtype: Deferred
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate(
+            collector=collector,
+            first_page=self.search,
+            params=kwargs,
+            url='/proxycurl/api/v2/search/person',
+            result_class=PersonSearchResult,
+            items_key='results',
+            max_results=max_results,
+            max_credits=max_credits,
+            prefetch=prefetch,
+            cursor=cursor,
+            stream=stream
+        )
+
     @inlineCallbacks
     def resolve(
         self,
@@ -573,6 +650,7 @@ class _LinkedinPerson:
         location: str = None,
         title: str = None,
         last_name: str = None,
+        fields: List[str] = None,
     ) -> Deferred:
         """Person Lookup Endpoint
         
@@ -627,6 +705,9 @@ class _LinkedinPerson:
         :type title: str
         :param last_name: Last name of the user
         :type last_name: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -652,7 +733,8 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=PersonLookupUrlEnrichResult
+            result_class=PersonLookupUrlEnrichResult,
+            fields=fields
         )
         defer.returnValue(resp)
 
@@ -662,6 +744,7 @@ class _LinkedinPerson:
         email: str,
         lookup_depth: str,
         enrich_profile: str = None,
+        fields: List[str] = None,
     ) -> Deferred:
         """Reverse Email Lookup Endpoint
         
@@ -693,6 +776,9 @@ class _LinkedinPerson:
 
             If you require [fresh profile data](https://nubela.co/blog/how-fresh-are-profiles-returned-by-proxycurl-api/),  please chain this API call with the `linkedin_profile_url` result with the [Person Profile Endpoint](https://nubela.co/proxycurl/docs#people-api-person-profile-endpoint) with the `use_cache=if-recent` parameter.
         :type enrich_profile: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -710,7 +796,8 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=ReverseEmailUrlEnrichResult
+            result_class=ReverseEmailUrlEnrichResult,
+            fields=fields
         )
         defer.returnValue(resp)
 
@@ -718,6 +805,7 @@ class _LinkedinPerson:
     def resolve_by_phone(
         self,
         phone_number: str,
+        fields: List[str] = None,
     ) -> Deferred:
         """Reverse Contact Number Lookup Endpoint
         
@@ -726,6 +814,9 @@ class _LinkedinPerson:
         
         :param phone_number: [E.164 formatted](https://www.twilio.com/docs/glossary/what-e164) phone number of the person you want to identify social media profiles of.
         :type phone_number: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -740,7 +831,8 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=ReverseContactNumberResult
+            result_class=ReverseContactNumberResult,
+            fields=fields
         )
         defer.returnValue(resp)
 
@@ -749,6 +841,7 @@ class _LinkedinPerson:
         self,
         linkedin_profile_url: str,
         callback_url: str = None,
+        fields: List[str] = None,
     ) -> Deferred:
         """Work Email Lookup Endpoint
         
@@ -771,6 +864,9 @@ class _LinkedinPerson:
         :param callback_url: Webhook to notify your application when
             the request has finished processing.
         :type callback_url: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -787,7 +883,8 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=ExtractionEmailResult
+            result_class=ExtractionEmailResult,
+            fields=fields
         )
         defer.returnValue(resp)
 
@@ -798,6 +895,7 @@ class _LinkedinPerson:
         twitter_profile_url: str = None,
         facebook_profile_url: str = None,
         linkedin_profile_url: str = None,
+        fields: List[str] = None,
     ) -> Deferred:
         """Personal Contact Number Lookup Endpoint
         
@@ -830,6 +928,9 @@ class _LinkedinPerson:
             Yes (Include only one of: `linkedin_profile_url`,
             `twitter_profile_url`, or `facebook_profile_url`)
         :type linkedin_profile_url: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -851,7 +952,8 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=PersonalContactNumbers
+            result_class=PersonalContactNumbers,
+            fields=fields
         )
         defer.returnValue(resp)
 
@@ -863,6 +965,7 @@ class _LinkedinPerson:
         twitter_profile_url: str = None,
         facebook_profile_url: str = None,
         linkedin_profile_url: str = None,
+        fields: List[str] = None,
     ) -> Deferred:
         """Personal Email Lookup Endpoint
         
@@ -891,6 +994,9 @@ class _LinkedinPerson:
         :param linkedin_profile_url: The LinkedIn Profile URL from which you wish to extract personal email addresses.
             yes (Include only one of: `linkedin_profile_url`, `twitter_profile_url`, or `facebook_profile_url`)
         :type linkedin_profile_url: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -914,7 +1020,8 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=PDLEmailResult
+            result_class=PDLEmailResult,
+            fields=fields
         )
         defer.returnValue(resp)
 
@@ -922,6 +1029,7 @@ class _LinkedinPerson:
     def profile_picture(
         self,
         linkedin_person_profile_url: str,
+        fields: List[str] = None,
     ) -> Deferred:
         """Person Profile Picture Endpoint
         
@@ -933,6 +1041,9 @@ class _LinkedinPerson:
         
         :param linkedin_person_profile_url: LinkedIn Profile URL of the person that you are trying to get the profile picture of.
         :type linkedin_person_profile_url: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -947,7 +1058,8 @@ class _LinkedinPerson:
             params=params,
             data={
             },
-            result_class=ProfilePicture
+            result_class=ProfilePicture,
+            fields=fields
         )
         defer.returnValue(resp)
 
@@ -967,6 +1079,7 @@ class _LinkedinCompany:
         exit_data: str = None,
         acquisitions: str = None,
         use_cache: str = None,
+        fields: List[str] = None,
     ) -> Deferred:
         """Company Profile Endpoint
         
@@ -1016,6 +1129,9 @@ class _LinkedinCompany:
 
             `if-recent` API will make a best effort to return a fresh profile no older than 29 days.Costs an extra `1` credit on top of the cost of the base endpoint.
         :type use_cache: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -1044,7 +1160,8 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=LinkedinCompany
+            result_class=LinkedinCompany,
+            fields=fields
         )
         defer.returnValue(resp)
 
@@ -1073,6 +1190,7 @@ class _LinkedinCompany:
         region: str = None,
         country: str = None,
         after: str = None,
+        fields: List[str] = None,
     ) -> Deferred:
         """Company Search Endpoint
         
@@ -1171,6 +1289,12 @@ class _LinkedinCompany:
 
             This parameter accepts a case-insensitive [Alpha-2 ISO3166 country code](https://en.wikipedia.org/wiki/ISO_3166-1_alpha-2).
         :type country: str
+        :param after: The cursor of the page to fetch, as found in the `next_page` URL of the previous page.
+            Omit this parameter to fetch the first page.
+        :type after: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -1228,10 +1352,63 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=CompanySearchResult
+            result_class=CompanySearchResult,
+            fields=fields
         )
         defer.returnValue(resp)
 
+    def search_iter(
+        self,
+        collector: Callable[[CSearchResult], Any],
+        max_results: int = None,
+        max_credits: int = None,
+        prefetch: bool = True,
+        cursor: CursorStore = None,
+        stream: bool = False,
+        **kwargs
+    ) -> Deferred:
+        """Company Search Endpoint, streaming results across pages
+
+        Takes the parameters of :meth:`search` and follows `next_page` until the last page,
+        calling `collector` with every :class:`proxycurl.models.CSearchResult`.
+        When `collector` returns a Deferred, the next result waits for it to fire.
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param collector: Called with every result
+        :type collector: Callable
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Stop before fetching a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :param prefetch: Fetch the next page while the current page is consumed, defaults to **True**
+        :type prefetch: bool
+        :param cursor: Resume from the page saved in this store and save the next page to it
+            once the current page is consumed, defaults to **None**
+        :type cursor: :class:`proxycurl.pagination.CursorStore`
+        :param stream: Parse every page as it is received, one page at a time, so that its first results
+            are returned before it finishes and about one result is held in memory, defaults to **False**
+        :type stream: bool
+        :return: Deferred firing with the number of results collected
+        :rtype: Deferred
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate(
+            collector=collector,
+            first_page=self.search,
+            params=kwargs,
+            url='/proxycurl/api/v2/search/company',
+            result_class=CompanySearchResult,
+            items_key='results',
+            max_results=max_results,
+            max_credits=max_credits,
+            prefetch=prefetch,
+            cursor=cursor,
+            stream=stream
+        )
+
     @inlineCallbacks
     def resolve(
         self,
@@ -1239,6 +1416,7 @@ class _LinkedinCompany:
         company_domain: str = None,
         company_name: str = None,
         enrich_profile: str = None,
+        fields: List[str] = None,
     ) -> Deferred:
         """Company Lookup Endpoint
         
@@ -1267,6 +1445,9 @@ class _LinkedinCompany:
             If you require [fresh profile data](https://nubela.co/blog/how-fresh-are-profiles-returned-by-proxycurl-api/),
             please chain this API call with the [Company Profile Endpoint](https://nubela.co/proxycurl/docs#company-api-company-profile-endpoint) with the `use_cache=if-recent` parameter.
         :type enrich_profile: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -1288,7 +1469,8 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=CompanyUrlEnrichResult
+            result_class=CompanyUrlEnrichResult,
+            fields=fields
         )
         defer.returnValue(resp)
 
@@ -1302,6 +1484,7 @@ class _LinkedinCompany:
         geo_id: str = None,
         keyword: str = None,
         search_id: str = None,
+        fields: List[str] = None,
     ) -> Deferred:
         """Job Search Endpoint
         
@@ -1352,6 +1535,9 @@ class _LinkedinCompany:
             You can get the `search_id` of a LinkedIn company via
             [Company Profile API](#company-api-company-profile-endpoint).
         :type search_id: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -1379,10 +1565,56 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=JobListPage
+            result_class=JobListPage,
+            fields=fields
         )
         defer.returnValue(resp)
 
+    def find_job_iter(
+        self,
+        collector: Callable[[JobListEntry], Any],
+        concurrency: int = 4,
+        max_results: int = None,
+        max_credits: int = None,
+        **kwargs
+    ) -> Deferred:
+        """Job Search Endpoint, streaming results across pages
+
+        Takes the parameters of :meth:`find_job`, requests up to `concurrency` following pages
+        at once and calls `collector` with every :class:`proxycurl.models.JobListEntry`
+        in page order.
+        When `collector` returns a Deferred, the next result waits for it to fire.
+        Results with the `job_url` of a previous result are skipped.
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param collector: Called with every result
+        :type collector: Callable
+        :param concurrency: Pages requested at once, defaults to 4
+        :type concurrency: int
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Do not request a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :return: Deferred firing with the number of results collected
+        :rtype: Deferred
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate_pages(
+            collector=collector,
+            first_page=self.find_job,
+            params=kwargs,
+            url='/proxycurl/api/v2/linkedin/company/job',
+            result_class=JobListPage,
+            items_key='job',
+            dedupe_key='job_url',
+            concurrency=concurrency,
+            max_results=max_results,
+            max_credits=max_credits
+        )
+
     @inlineCallbacks
     def job_count(
         self,
@@ -1393,6 +1625,7 @@ class _LinkedinCompany:
         geo_id: str = None,
         keyword: str = None,
         search_id: str = None,
+        fields: List[str] = None,
     ) -> Deferred:
         """Jobs Listing Count Endpoint
         
@@ -1443,6 +1676,9 @@ class _LinkedinCompany:
             You can get the `search_id` of a LinkedIn company via
             [Company Profile API](#company-api-company-profile-endpoint).
         :type search_id: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -1470,7 +1706,8 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=JobListCount
+            result_class=JobListCount,
+            fields=fields
         )
         defer.returnValue(resp)
 
@@ -1481,6 +1718,7 @@ class _LinkedinCompany:
         use_cache: str = None,
         linkedin_employee_count: str = None,
         employment_status: str = None,
+        fields: List[str] = None,
     ) -> Deferred:
         """Employee Count Endpoint
         
@@ -1514,6 +1752,9 @@ class _LinkedinCompany:
             * `past` : count past employees
             * `all` : count current & past employees
         :type employment_status: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -1534,7 +1775,8 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=EmployeeCount
+            result_class=EmployeeCount,
+            fields=fields
         )
         defer.returnValue(resp)
 
@@ -1550,6 +1792,7 @@ class _LinkedinCompany:
         sort_by: str = None,
         resolve_numeric_id: str = None,
         after: str = None,
+        fields: List[str] = None,
     ) -> Deferred:
         """Employee Listing Endpoint
         
@@ -1623,6 +1866,12 @@ class _LinkedinCompany:
             - `true` - Enable support for Company Profile URLs with numerical IDs. 
             Costs an extra `2` credit on top of the base cost of the endpoint.
         :type resolve_numeric_id: str
+        :param after: The cursor of the page to fetch, as found in the `next_page` URL of the previous page.
+            Omit this parameter to fetch the first page.
+        :type after: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -1653,10 +1902,63 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=EmployeeList
+            result_class=EmployeeList,
+            fields=fields
         )
         defer.returnValue(resp)
 
+    def employee_list_iter(
+        self,
+        collector: Callable[[Employee], Any],
+        max_results: int = None,
+        max_credits: int = None,
+        prefetch: bool = True,
+        cursor: CursorStore = None,
+        stream: bool = False,
+        **kwargs
+    ) -> Deferred:
+        """Employee Listing Endpoint, streaming results across pages
+
+        Takes the parameters of :meth:`employee_list` and follows `next_page` until the last page,
+        calling `collector` with every :class:`proxycurl.models.Employee`.
+        When `collector` returns a Deferred, the next result waits for it to fire.
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param collector: Called with every result
+        :type collector: Callable
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Stop before fetching a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :param prefetch: Fetch the next page while the current page is consumed, defaults to **True**
+        :type prefetch: bool
+        :param cursor: Resume from the page saved in this store and save the next page to it
+            once the current page is consumed, defaults to **None**
+        :type cursor: :class:`proxycurl.pagination.CursorStore`
+        :param stream: Parse every page as it is received, one page at a time, so that its first results
+            are returned before it finishes and about one result is held in memory, defaults to **False**
+        :type stream: bool
+        :return: Deferred firing with the number of results collected
+        :rtype: Deferred
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate(
+            collector=collector,
+            first_page=self.employee_list,
+            params=kwargs,
+            url='/proxycurl/api/linkedin/company/employees',
+            result_class=EmployeeList,
+            items_key='employees',
+            max_results=max_results,
+            max_credits=max_credits,
+            prefetch=prefetch,
+            cursor=cursor,
+            stream=stream
+        )
+
     @inlineCallbacks
     def employee_search(
         self,
@@ -1667,6 +1969,7 @@ class _LinkedinCompany:
         enrich_profiles: str = None,
         resolve_numeric_id: str = None,
         after: str = None,
+        fields: List[str] = None,
     ) -> Deferred:
         """Employee Search Endpoint
         
@@ -1714,6 +2017,12 @@ class _LinkedinCompany:
             - `true` - Enable support for Company Profile URLs with numerical IDs. 
             Costs an extra `2` credit on top of the base cost of the endpoint.
         :type resolve_numeric_id: str
+        :param after: The cursor of the page to fetch, as found in the `next_page` URL of the previous page.
+            Omit this parameter to fetch the first page.
+        :type after: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -1739,16 +2048,70 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=EmployeeList
+            result_class=EmployeeList,
+            fields=fields
         )
         defer.returnValue(resp)
 
+    def employee_search_iter(
+        self,
+        collector: Callable[[Employee], Any],
+        max_results: int = None,
+        max_credits: int = None,
+        prefetch: bool = True,
+        cursor: CursorStore = None,
+        stream: bool = False,
+        **kwargs
+    ) -> Deferred:
+        """Employee Search Endpoint, streaming results across pages
+
+        Takes the parameters of :meth:`employee_search` and follows `next_page` until the last page,
+        calling `collector` with every :class:`proxycurl.models.Employee`.
+        When `collector` returns a Deferred, the next result waits for it to fire.
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param collector: Called with every result
+        :type collector: Callable
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Stop before fetching a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :param prefetch: Fetch the next page while the current page is consumed, defaults to **True**
+        :type prefetch: bool
+        :param cursor: Resume from the page saved in this store and save the next page to it
+            once the current page is consumed, defaults to **None**
+        :type cursor: :class:`proxycurl.pagination.CursorStore`
+        :param stream: Parse every page as it is received, one page at a time, so that its first results
+            are returned before it finishes and about one result is held in memory, defaults to **False**
+        :type stream: bool
+        :return: Deferred firing with the number of results collected
+        :rtype: Deferred
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate(
+            collector=collector,
+            first_page=self.employee_search,
+            params=kwargs,
+            url='/proxycurl/api/linkedin/company/employee/search',
+            result_class=EmployeeList,
+            items_key='employees',
+            max_results=max_results,
+            max_credits=max_credits,
+            prefetch=prefetch,
+            cursor=cursor,
+            stream=stream
+        )
+
     @inlineCallbacks
     def role_lookup(
         self,
         company_name: str,
         role: str,
         enrich_profile: str = None,
+        fields: List[str] = None,
     ) -> Deferred:
         """Role Lookup Endpoint
         
@@ -1778,6 +2141,9 @@ class _LinkedinCompany:
             If you require [fresh profile data](https://nubela.co/blog/how-fresh-are-profiles-returned-by-proxycurl-api/),
             please chain this API call with the [Person Profile Endpoint](#people-api-person-profile-endpoint) with the `use_cache=if-recent` parameter.
         :type enrich_profile: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -1795,7 +2161,8 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=RoleSearchEnrichedResult
+            result_class=RoleSearchEnrichedResult,
+            fields=fields
         )
         defer.returnValue(resp)
 
@@ -1803,6 +2170,7 @@ class _LinkedinCompany:
     def profile_picture(
         self,
         linkedin_company_profile_url: str,
+        fields: List[str] = None,
     ) -> Deferred:
         """Company Profile Picture Endpoint
         
@@ -1814,6 +2182,9 @@ class _LinkedinCompany:
         
         :param linkedin_company_profile_url: LinkedIn Profile URL of the company that you are trying to get the profile picture of.
         :type linkedin_company_profile_url: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -1828,7 +2199,8 @@ class _LinkedinCompany:
             params=params,
             data={
             },
-            result_class=ProfilePicture
+            result_class=ProfilePicture,
+            fields=fields
         )
         defer.returnValue(resp)
 
@@ -1842,6 +2214,7 @@ class _LinkedinSchool:
         self,
         url: str,
         use_cache: str = None,
+        fields: List[str] = None,
     ) -> Deferred:
         """School Profile Endpoint
         
@@ -1856,6 +2229,9 @@ class _LinkedinSchool:
 
             `if-recent` API will make a best effort to return a fresh profile no older than 29 days.Costs an extra `1` credit on top of the cost of the base endpoint.
         :type use_cache: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -1872,7 +2248,8 @@ class _LinkedinSchool:
             params=params,
             data={
             },
-            result_class=LinkedinSchool
+            result_class=LinkedinSchool,
+            fields=fields
         )
         defer.returnValue(resp)
 
@@ -1887,6 +2264,7 @@ class _LinkedinSchool:
         student_status: str = None,
         sort_by: str = None,
         resolve_numeric_id: str = None,
+        fields: List[str] = None,
     ) -> Deferred:
         """Student Listing Endpoint
         
@@ -1957,6 +2335,9 @@ class _LinkedinSchool:
             - `true` - Enable support for School Profile URLs with numerical IDs. 
             Costs an extra `2` credit on top of the base cost of the endpoint.
         :type resolve_numeric_id: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -1985,10 +2366,63 @@ class _LinkedinSchool:
             params=params,
             data={
             },
-            result_class=StudentList
+            result_class=StudentList,
+            fields=fields
         )
         defer.returnValue(resp)
 
+    def student_list_iter(
+        self,
+        collector: Callable[[Student], Any],
+        max_results: int = None,
+        max_credits: int = None,
+        prefetch: bool = True,
+        cursor: CursorStore = None,
+        stream: bool = False,
+        **kwargs
+    ) -> Deferred:
+        """Student Listing Endpoint, streaming results across pages
+
+        Takes the parameters of :meth:`student_list` and follows `next_page` until the last page,
+        calling `collector` with every :class:`proxycurl.models.Student`.
+        When `collector` returns a Deferred, the next result waits for it to fire.
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param collector: Called with every result
+        :type collector: Callable
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Stop before fetching a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :param prefetch: Fetch the next page while the current page is consumed, defaults to **True**
+        :type prefetch: bool
+        :param cursor: Resume from the page saved in this store and save the next page to it
+            once the current page is consumed, defaults to **None**
+        :type cursor: :class:`proxycurl.pagination.CursorStore`
+        :param stream: Parse every page as it is received, one page at a time, so that its first results
+            are returned before it finishes and about one result is held in memory, defaults to **False**
+        :type stream: bool
+        :return: Deferred firing with the number of results collected
+        :rtype: Deferred
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate(
+            collector=collector,
+            first_page=self.student_list,
+            params=kwargs,
+            url='/proxycurl/api/linkedin/school/students',
+            result_class=StudentList,
+            items_key='students',
+            max_results=max_results,
+            max_credits=max_credits,
+            prefetch=prefetch,
+            cursor=cursor,
+            stream=stream
+        )
+
 
 class _LinkedinJob:
     def __init__(self, linkedin):
@@ -1998,6 +2432,7 @@ class _LinkedinJob:
     def get(
         self,
         url: str,
+        fields: List[str] = None,
     ) -> Deferred:
         """Job Profile Endpoint
         
@@ -2011,6 +2446,9 @@ class _LinkedinJob:
             [Jobs Listing Endpoint](#jobs-api-jobs-listing-endpoint)
             can be used to retrieve a job URL.
         :type url: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -2025,7 +2463,8 @@ class _LinkedinJob:
             params=params,
             data={
             },
-            result_class=JobProfile
+            result_class=JobProfile,
+            fields=fields
         )
         defer.returnValue(resp)
 
@@ -2041,6 +2480,7 @@ class _LinkedinCustomers:
         twitter_profile_url: str = None,
         page_size: str = None,
         after: str = None,
+        fields: List[str] = None,
     ) -> Deferred:
         """Customer Listing Endpoint
         
@@ -2067,6 +2507,12 @@ class _LinkedinCustomers:
 
             Accepted values for this parameter is an integer ranging from 0 to 1000.
         :type page_size: str
+        :param after: The cursor of the page to fetch, as found in the `next_page` URL of the previous page.
+            Omit this parameter to fetch the first page.
+        :type after: str
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -2088,10 +2534,63 @@ class _LinkedinCustomers:
             params=params,
             data={
             },
-            result_class=CustomerList
+            result_class=CustomerList,
+            fields=fields
         )
         defer.returnValue(resp)
 
+    def listing_iter(
+        self,
+        collector: Callable[[CompanyCustomer], Any],
+        max_results: int = None,
+        max_credits: int = None,
+        prefetch: bool = True,
+        cursor: CursorStore = None,
+        stream: bool = False,
+        **kwargs
+    ) -> Deferred:
+        """Customer Listing Endpoint, streaming results across pages
+
+        Takes the parameters of :meth:`listing` and follows `next_page` until the last page,
+        calling `collector` with every :class:`proxycurl.models.CompanyCustomer`.
+        When `collector` returns a Deferred, the next result waits for it to fire.
+        Its `fields` parameter applies to every result, e.g. `['profile_url']`.
+
+        :param collector: Called with every result
+        :type collector: Callable
+        :param max_results: Stop after this many results, defaults to **None** (no limit)
+        :type max_results: int
+        :param max_credits: Stop before fetching a page estimated to exceed this many credits spent,
+            defaults to **None** (no limit)
+        :type max_credits: int
+        :param prefetch: Fetch the next page while the current page is consumed, defaults to **True**
+        :type prefetch: bool
+        :param cursor: Resume from the page saved in this store and save the next page to it
+            once the current page is consumed, defaults to **None**
+        :type cursor: :class:`proxycurl.pagination.CursorStore`
+        :param stream: Parse every page as it is received, one page at a time, so that its first results
+            are returned before it finishes and about one result is held in memory, defaults to **False**
+        :type stream: bool
+        :return: Deferred firing with the number of results collected
+        :rtype: Deferred
+        :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
+
+        """
+
+        return self.linkedin.proxycurl.paginate(
+            collector=collector,
+            first_page=self.listing,
+            params=kwargs,
+            url='/proxycurl/api/customers',
+            result_class=CustomerList,
+            items_key='companies',
+            max_results=max_results,
+            max_credits=max_credits,
+            prefetch=prefetch,
+            cursor=cursor,
+            stream=stream
+        )
+
 
 class _Linkedin:
     person: _LinkedinPerson
@@ -2114,28 +2613,50 @@ class Proxycurl(ProxycurlBase):
 
     def __init__(
         self,
-        api_key: str = PROXYCURL_API_KEY,
+        api_key: Union[str, List[str]] = PROXYCURL_API_KEY,
         base_url: str = BASE_URL,
         timeout: int = TIMEOUT,
         max_retries: int = MAX_RETRIES,
-        max_backoff_seconds: int = MAX_BACKOFF_SECONDS
+        max_backoff_seconds: int = MAX_BACKOFF_SECONDS,
+        rate_limit: int = RATE_LIMIT,
+        json_codec: Union[str, JsonCodec] = JSON_CODEC,
+        raw: bool = False,
+        lazy: bool = False,
+        structs: bool = False,
+        validate: bool = False,
+        intern: Union[bool, InternTable] = False,
+        metrics: MetricsHook = None
     ) -> None:
-        self.api_key = api_key
-        self.base_url = base_url
-        self.timeout = timeout
-        self.max_retries = max_retries
-        self.max_backoff_seconds = max_backoff_seconds
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            max_backoff_seconds=max_backoff_seconds,
+            rate_limit=rate_limit,
+            json_codec=json_codec,
+            raw=raw,
+            lazy=lazy,
+            structs=structs,
+            validate=validate,
+            intern=intern,
+            metrics=metrics
+        )
         self.linkedin = _Linkedin(self)
 
     @inlineCallbacks
     def get_balance(
         self,
+        fields: List[str] = None,
     ) -> Deferred:
         """View Credit Balance Endpoint
         
                 Cost: 0 credit / successful request.
         Get your current credit(s) balance
         
+        :param fields: Only decode and return these fields of the response,
+            e.g. `['full_name', 'experiences.*.company']`, defaults to **None** (every field)
+        :type fields: List[str]
         :return: An object of Deferred or **None** if there is an error.
         :rtype: Deferred
         :raise ProxycurlException: Every error will raise a :class:`proxycurl.twisted.ProxycurlException`
@@ -2149,6 +2670,7 @@ class Proxycurl(ProxycurlBase):
             params=params,
             data={
             },
-            result_class=CreditBalance
+            result_class=CreditBalance,
+            fields=fields
         )
         defer.returnValue(resp)
@@ -0,0 +1,138 @@
+from collections.abc import Mapping
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Tuple, Union, get_type_hints
+from proxycurl.schema import get_args, get_origin, is_model
+
+
+class ResponseValidationError(ValueError):
+    """Raised by clients created with `validate=True` when a response does not match its model"""
+    result_class: str
+    errors: List[str]
+
+    def __init__(self, result_class: str, errors: List[str]) -> None:
+        self.result_class = result_class
+        self.errors = errors
+        super().__init__(f'invalid {result_class}: {"; ".join(errors)}')
+
+
+# returns None when a value is valid, otherwise its errors as `<path>: <message>`,
+# the path being relative to the value and only built on failure
+Checker = Callable[[Any], Optional[List[str]]]
+
+
+def _type_checker(types: Tuple[type, ...], expected: str) -> Checker:
+    strict_bool = bool not in types and int in types
+
+    def check(value):
+        # the API nulls fields whatever their declared type
+        if value is None or isinstance(value, types) and not (strict_bool and isinstance(value, bool)):
+            return None
+        return [f': expected {expected}, got {type(value).__name__}']
+    return check
+
+
+def _items_errors(check_item: Checker, items: list) -> Optional[List[str]]:
+    errors = None
+    for i, item in enumerate(items):
+        item_errors = check_item(item)
+        if item_errors:
+            errors = (errors or []) + [f'[{i}]{error}' for error in item_errors]
+    return errors
+
+
+def _list_checker(check_item: Checker) -> Checker:
+    def check(value):
+        if value is None:
+            return None
+        if not isinstance(value, list):
+            return [f': expected a list, got {type(value).__name__}']
+        return _items_errors(check_item, value)
+    return check
+
+
+def _union_checker(checkers: List[Checker]) -> Checker:
+    def check(value):
+        for candidate in checkers:
+            if not candidate(value):
+                return None
+        return [f': unexpected {type(value).__name__}']
+    return check
+
+
+def _model_checker(model) -> Checker:
+    fields = None
+
+    def check(value):
+        nonlocal fields
+        if value is None:
+            return None
+        if isinstance(value, list):
+            # list fields are typed by their items in the models
+            return _items_errors(check, value)
+        if not isinstance(value, Mapping):
+            return [f': expected an object, got {type(value).__name__}']
+        if fields is None:
+            # resolved on first use, models may refer to each other
+            fields = [(name, _checker(hint)) for name, hint in get_type_hints(model).items()]
+        errors = None
+        for name, check_field in fields:
+            if name in value:
+                field_errors = check_field(value[name])
+                if field_errors:
+                    errors = (errors or []) + [f'.{name}{error}' for error in field_errors]
+        return errors
+    return check
+
+
+def _any(value) -> None:
+    return None
+
+
+@lru_cache(maxsize=None)
+def _checker(hint) -> Checker:
+    origin = get_origin(hint)
+    if origin is Union:
+        candidates = [arg for arg in get_args(hint) if arg is not type(None)]
+        if len(candidates) == 1:
+            return _checker(candidates[0])
+        return _union_checker([_checker(candidate) for candidate in candidates])
+    if origin is list:
+        item_hint, = get_args(hint) or (Any,)
+        return _list_checker(_checker(item_hint))
+    if origin is tuple:
+        return _type_checker((list,), 'a list')
+    if is_model(hint):
+        return _model_checker(hint)
+    if isinstance(hint, type) and issubclass(hint, Enum):
+        return _type_checker((str,), 'a string')
+    if hint is float:
+        return _type_checker((int, float), 'a number')
+    if hint is int:
+        return _type_checker((int,), 'an integer')
+    if isinstance(hint, type):
+        return _type_checker((hint,), hint.__name__)
+    return _any
+
+
+def validate_response(result_class, response: Any) -> Any:
+    """Check a decoded response against the `TypedDict` of its result
+
+    Fields which are present must hold the declared type, nested models
+    included; missing and unknown fields, as well as **null** values, are
+    accepted since the API omits and nulls fields freely.
+
+    :param result_class: Model of the response, e.g. :class:`proxycurl.models.PersonEndpointResponse`
+    :param response: Decoded response
+    :return: `response`, unchanged
+    :raise ResponseValidationError: If a field does not hold its declared type
+    """
+    if not is_model(result_class):
+        return response
+    errors = _checker(result_class)(response)
+    if errors:
+        raise ResponseValidationError(
+            result_class.__name__,
+            [error[1:] if error.startswith('.') else result_class.__name__ + error for error in errors]
+        )
+    return response
@@ -0,0 +1,76 @@
+import asyncio
+
+from proxycurl.asyncio import Proxycurl, do_bulk
+from proxycurl.budget import (
+    CreditBudget,
+    CreditBudgetExceeded,
+    estimate_cost,
+    operation_endpoint,
+    response_cost
+)
+
+
+def test_estimate_cost():
+    assert estimate_cost('/proxycurl/api/v2/linkedin', {}) == 1
+    assert estimate_cost('/proxycurl/api/v2/linkedin', {
+        'extra': 'include', 'skills': 'include', 'inferred_salary': 'exclude',
+    }) == 3
+    assert estimate_cost('/proxycurl/api/linkedin/company/employees', {'page_size': '100'}) == 300
+    assert estimate_cost('/proxycurl/api/linkedin/company/employees', {
+        'enrich_profiles': 'enrich',
+    }) == 40
+    assert estimate_cost('/unknown', {}) == 0
+
+
+def test_estimate_cost_default_page_size():
+    endpoint = '/proxycurl/api/linkedin/company/employee/search'
+    # pages of enriched profiles default to 100 results instead of 200000
+    assert estimate_cost(endpoint, {'enrich_profiles': 'enrich'}) == 110
+    assert estimate_cost(endpoint, {'country': 'us'}) == 310
+    assert estimate_cost(endpoint, {'country': 'us', 'page_size': '1000'}) == 3010
+    assert CreditBudget(1000).reserve(estimate_cost(endpoint, {'enrich_profiles': 'enrich', 'country': 'us'}))
+
+
+def test_response_cost():
+    response = {'employees': [{}, {}], 'next_page': None}
+    assert response_cost('/proxycurl/api/linkedin/company/employees', {}, response) == 6
+
+
+def test_operation_endpoint():
+    proxycurl = Proxycurl(api_key='')
+    assert operation_endpoint(proxycurl.linkedin.person.get) == '/proxycurl/api/v2/linkedin'
+    assert operation_endpoint(proxycurl.get_balance) == '/proxycurl/api/credit-balance'
+
+
+def test_credit_budget():
+    budget = CreditBudget(10)
+    budget.reconcile(100)
+    assert budget.reserve(6)
+    assert not budget.reserve(6)
+    # once exhausted no more operations are dispatched
+    assert not budget.reserve(1)
+    budget.settle(6, 4)
+    budget.reconcile(95)
+    assert budget.spent == 5
+
+
+def test_do_bulk_max_credits():
+    proxycurl = Proxycurl(api_key='')
+    calls = []
+
+    async def request(method, url, result_class, params=dict(), data=dict(), **kwargs):
+        calls.append(url)
+        if url == '/proxycurl/api/credit-balance':
+            return {'credit_balance': 1000}
+        return {'full_name': params['linkedin_profile_url']}
+
+    proxycurl.request = request
+    ops = [
+        (proxycurl.linkedin.person.get, {'linkedin_profile_url': str(i), 'extra': 'include'})
+        for i in range(10)
+    ]
+    results = asyncio.run(do_bulk(ops, max_workers=1, max_credits=9))
+
+    assert [r.success for r in results].count(True) == 4
+    assert all(r.error.type is CreditBudgetExceeded for r in results[4:])
+    assert calls.count('/proxycurl/api/v2/linkedin') == 4
@@ -0,0 +1,15 @@
+import json
+
+import pytest
+
+from proxycurl.codec import CODECS, JsonCodec, get_codec
+
+
+def test_get_codec():
+    assert get_codec('json').loads(b'{"full_name": "John"}') == {'full_name': 'John'}
+    codec = JsonCodec('custom', json.loads)
+    assert get_codec(codec) is codec
+    # the fastest installed codec is the default
+    assert get_codec().name in CODECS
+    with pytest.raises(ValueError):
+        get_codec('simplejson')
@@ -0,0 +1,55 @@
+import pytest
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+from proxycurl.asyncio.base import Result  # noqa: E402
+from proxycurl.columnar import ParquetSink, arrow_schema, record_batch, record_batches  # noqa: E402
+from proxycurl.models import LinkedinCompany, PersonEndpointResponse  # noqa: E402
+
+PROFILE = {
+    'full_name': 'John Doe',
+    'follower_count': 10,
+    'experiences': [{'company': 'Nubela', 'starts_at': {'day': 1, 'month': 2, 'year': 2020}}],
+    'extra': {'github_profile_id': 'john'},
+    'skills': ['python'],
+}
+
+
+def test_arrow_schema():
+    schema = arrow_schema(PersonEndpointResponse)
+    assert schema.field('full_name').type == pa.string()
+    assert schema.field('follower_count').type == pa.int64()
+    assert pa.types.is_list(schema.field('experiences').type)
+    assert schema.field('experiences').type.value_type.field('starts_at').type.field('year').type == pa.int64()
+    assert pa.types.is_struct(schema.field('extra').type)
+    assert pa.types.is_list(arrow_schema(LinkedinCompany).field('funding_data').type)
+
+
+def test_record_batch():
+    schema = arrow_schema(PersonEndpointResponse)
+    row = record_batch([PROFILE], schema).to_pylist()[0]
+    assert row['full_name'] == 'John Doe'
+    assert row['experiences'][0]['company'] == 'Nubela'
+    assert row['experiences'][0]['starts_at']['year'] == 2020
+    assert row['headline'] is None
+
+    # fields of another shape than their model are coerced
+    row = record_batch([{'experiences': {'company': 'Nubela'}, 'extra': [{'github_profile_id': 'john'}],
+                         'follower_count': '12'}], schema).to_pylist()[0]
+    assert row['experiences'][0]['company'] == 'Nubela'
+    assert row['extra']['github_profile_id'] == 'john'
+    assert row['follower_count'] == 12
+
+    assert [batch.num_rows for batch in record_batches([PROFILE] * 5, PersonEndpointResponse, 2)] == [2, 2, 1]
+
+
+def test_parquet_sink(tmp_path):
+    path = str(tmp_path / 'profiles.parquet')
+    results = [Result(True, PROFILE, None)] * 5 + [Result(False, None, Exception())]
+    with ParquetSink(path, PersonEndpointResponse, row_group_size=2) as sink:
+        assert sink.write_results(results) == 5
+    file = pq.ParquetFile(path)
+    assert file.metadata.num_rows == 5
+    assert file.metadata.num_row_groups == 3
+    assert file.read().column('full_name').to_pylist() == ['John Doe'] * 5
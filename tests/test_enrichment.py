@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from proxycurl.asyncio import Proxycurl, do_enrich
+from proxycurl.enrichment import ResponseCache, Stage, check_stages, is_empty
+
+
+def test_check_stages():
+    check_stages([Stage('a', 'linkedin.person.get', dict), Stage('b', 'linkedin.person.get', dict, ('a',))])
+    with pytest.raises(ValueError):
+        check_stages([Stage('b', 'linkedin.person.get', dict, ('a',)), Stage('a', 'linkedin.person.get', dict)])
+
+
+def test_is_empty():
+    assert is_empty({'url': None, 'profile': None})
+    assert not is_empty({'url': 'https://www.linkedin.com/in/john/'})
+
+
+def test_response_cache():
+    cache = ResponseCache(max_size=1)
+    cache.set(cache.key('a', {'x': 1}), 'first')
+    assert cache.get(cache.key('a', {'x': '1'})) == (True, 'first')
+    cache.set(cache.key('a', {'x': 2}), 'second')
+    assert cache.get(cache.key('a', {'x': 1})) == (False, None)
+
+
+def test_do_enrich():
+    proxycurl = Proxycurl(api_key='')
+    calls = []
+
+    async def resolve(first_name, company_domain, **kwargs):
+        calls.append(('resolve', first_name))
+        return {'url': f'https://www.linkedin.com/in/{first_name}/' if first_name != 'nobody' else None}
+
+    async def get(linkedin_profile_url, **kwargs):
+        calls.append(('get', linkedin_profile_url))
+        return {'full_name': linkedin_profile_url}
+
+    async def personal_email(linkedin_profile_url, **kwargs):
+        calls.append(('personal_email', linkedin_profile_url))
+        return {'emails': ['john@example.com']}
+
+    async def personal_contact(linkedin_profile_url, **kwargs):
+        raise ValueError('no contact')
+
+    proxycurl.linkedin.person.resolve = resolve
+    proxycurl.linkedin.person.get = get
+    proxycurl.linkedin.person.personal_email = personal_email
+    proxycurl.linkedin.person.personal_contact = personal_contact
+
+    stages = [
+        Stage('resolve', 'linkedin.person.resolve', lambda context: context['record']),
+        Stage('profile', 'linkedin.person.get',
+              lambda context: {'linkedin_profile_url': context['resolve']['url']}, ('resolve',)),
+        Stage('personal_email', 'linkedin.person.personal_email',
+              lambda context: {'linkedin_profile_url': context['resolve']['url']}, ('resolve', 'profile')),
+    ]
+    records = [
+        {'first_name': 'john', 'company_domain': 'example.com'},
+        {'first_name': 'nobody', 'company_domain': 'example.com'},
+        {'first_name': 'john', 'company_domain': 'example.com'},
+    ]
+    results = asyncio.run(do_enrich(proxycurl, records, stages, max_workers=1))
+
+    assert results[0].success
+    assert results[0].value['personal_email'] == {'emails': ['john@example.com']}
+    # nothing resolved, so the following stages are skipped
+    assert results[1].success and results[1].value['profile'] is None
+    # the third record is answered from the cache
+    assert results[2].value == results[0].value
+    assert calls.count(('resolve', 'john')) == 1
+
+    failing = stages + [
+        Stage('personal_contact', 'linkedin.person.personal_contact',
+              lambda context: {'linkedin_profile_url': context['resolve']['url']}, ('profile',)),
+    ]
+    results = asyncio.run(do_enrich(proxycurl, records[:1], failing))
+    assert not results[0].success
+    assert results[0].error.type is ValueError
+    results = asyncio.run(do_enrich(proxycurl, records[:1], failing, keep_exceptions=True))
+    assert isinstance(results[0].error, ValueError)
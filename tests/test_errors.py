@@ -0,0 +1,34 @@
+import pickle
+
+from proxycurl.asyncio import ProxycurlException
+from proxycurl.errors import NotFound, RateLimited, ServerError, rate_limit_headers, response_error
+
+
+def test_response_error():
+    error = response_error(
+        '{"description": "rate limited"}',
+        429,
+        '/proxycurl/api/v2/linkedin?url=x',
+        attempts=3,
+        elapsed=1.5,
+        headers={'Retry-After': '2', 'X-RateLimit-Remaining': '0', 'Content-Type': 'application/json'},
+    )
+    assert isinstance(error, RateLimited) and isinstance(error, ProxycurlException)
+    assert (error.status_code, error.endpoint, error.attempts, error.elapsed) == (
+        429, '/proxycurl/api/v2/linkedin', 3, 1.5)
+    assert error.rate_limit == {'retry-after': '2', 'x-ratelimit-remaining': '0'}
+    assert error.retry_after == 2.0
+    assert str(error) == '{"description": "rate limited"}'
+
+    assert isinstance(response_error('', 404, '/'), NotFound)
+    assert isinstance(response_error('', 503, '/'), ServerError)
+    assert type(response_error('', 418, '/')) is ProxycurlException
+    assert response_error('', 404, '/').retry_after is None
+
+    # attributes survive pickling, e.g. by a result store
+    copy = pickle.loads(pickle.dumps(error))
+    assert type(copy) is RateLimited and copy.attempts == 3 and copy.rate_limit == error.rate_limit
+
+
+def test_rate_limit_headers():
+    assert rate_limit_headers([('x-ratelimit-limit', '300'), ('Server', 'x')]) == {'x-ratelimit-limit': '300'}
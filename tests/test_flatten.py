@@ -0,0 +1,75 @@
+import csv
+import io
+
+import pytest
+
+from proxycurl.asyncio.base import Result
+from proxycurl.flatten import CsvSink, Flattener
+from proxycurl.models import Employee, PersonEndpointResponse
+
+PROFILE = {
+    'full_name': 'John Doe',
+    'birth_date': {'day': 1, 'month': 2, 'year': 1990},
+    'skills': ['python', 'go'],
+    'experiences': [
+        {'company': 'Nubela', 'starts_at': {'day': 1, 'month': 2, 'year': 2020}},
+        {'company': 'Acme', 'title': 'Engineer'},
+    ],
+    'education': [{'school': 'NUS'}],
+}
+
+
+def as_row(flattener, row):
+    return dict(zip(flattener.columns, row))
+
+
+def test_flatten_row_per_result():
+    flattener = Flattener(PersonEndpointResponse)
+    row, = flattener.rows(PROFILE)
+    row = as_row(flattener, row)
+    assert row['full_name'] == 'John Doe'
+    assert row['birth_date.year'] == 1990
+    assert row['skills'] == 'python; go'
+    assert row['education'] == '[{"school":"NUS"}]'
+    assert row['headline'] is None
+
+    # fields of another shape than their model
+    row, = flattener.rows({'birth_date': [{'year': 1990}], 'experiences': {'company': 'Nubela'}})
+    row = as_row(flattener, row)
+    assert row['birth_date.year'] == 1990
+    assert row['experiences'] == '{"company":"Nubela"}'
+
+
+def test_flatten_explode():
+    flattener = Flattener(PersonEndpointResponse, explode='experiences')
+    assert 'experiences' not in flattener.columns
+    rows = [as_row(flattener, row) for row in flattener.rows(PROFILE)]
+    assert [row['experiences.company'] for row in rows] == ['Nubela', 'Acme']
+    assert [row['experiences.starts_at.year'] for row in rows] == [2020, None]
+    assert all(row['full_name'] == 'John Doe' for row in rows)
+
+    # a result without items still has a row
+    row, = flattener.rows({'full_name': 'Jane Doe'})
+    assert as_row(flattener, row)['experiences.company'] is None
+
+    # lists nested in single objects
+    flattener = Flattener(Employee, explode='profile.experiences')
+    rows = [as_row(flattener, row) for row in flattener.rows({'profile_url': 'url', 'profile': PROFILE})]
+    assert [(row['profile_url'], row['profile.full_name'], row['profile.experiences.company']) for row in rows] == [
+        ('url', 'John Doe', 'Nubela'), ('url', 'John Doe', 'Acme')]
+
+    with pytest.raises(ValueError):
+        Flattener(PersonEndpointResponse, explode='full_name')
+
+
+def test_csv_sink():
+    file = io.StringIO()
+    with CsvSink(file, PersonEndpointResponse, explode='experiences') as sink:
+        added = sink.write_results([
+            Result(True, PROFILE, None),
+            Result(False, None, Exception('failed')),
+        ])
+    assert (added, sink.rows) == (1, 2)
+    rows = list(csv.DictReader(io.StringIO(file.getvalue())))
+    assert [row['experiences.company'] for row in rows] == ['Nubela', 'Acme']
+    assert rows[0]['headline'] == ''
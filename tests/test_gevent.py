@@ -0,0 +1,69 @@
+import json
+
+import gevent
+from gevent.pywsgi import WSGIServer
+
+from proxycurl.gevent import Proxycurl
+
+STATUSES = {200: '200 OK', 403: '403 Forbidden', 429: '429 Too Many Requests'}
+
+
+class Linkedin:
+    """Answers with the status set for the API key of a request, and 200 otherwise"""
+
+    def __init__(self, statuses=None, delay=0):
+        self.statuses = statuses or {}
+        self.delay = delay
+        self.keys = []
+
+    def __call__(self, environ, start_response):
+        key = environ['HTTP_AUTHORIZATION'][len('Bearer '):]
+        self.keys.append(key)
+        gevent.sleep(self.delay)
+        status = self.statuses.get(key, 200)
+        start_response(STATUSES[status], [('Content-Type', 'application/json')])
+        return [json.dumps({'full_name': key} if status == 200 else {'description': 'failed'}).encode()]
+
+
+def _serve(app):
+    server = WSGIServer(('127.0.0.1', 0), app, log=None)
+    server.start()
+    return server, Proxycurl(api_key='k1,k2', base_url=f'http://127.0.0.1:{server.server_port}', rate_limit=0)
+
+
+def test_key_rotation():
+    app = Linkedin(delay=0.05)
+    server, proxycurl = _serve(app)
+    try:
+        requests = [gevent.spawn(proxycurl.linkedin.person.get, linkedin_profile_url=url) for url in 'xy']
+        gevent.joinall(requests, raise_error=True)
+    finally:
+        server.stop()
+    # a request in flight on a key sends the next one to the other key
+    assert sorted(request.value['full_name'] for request in requests) == ['k1', 'k2']
+    assert [key.in_flight for key in proxycurl.key_pool.keys] == [0, 0]
+
+
+def test_rate_limited_key_backoff():
+    app = Linkedin({'k1': 429})
+    server, proxycurl = _serve(app)
+    try:
+        response = proxycurl.linkedin.person.get(linkedin_profile_url='x')
+    finally:
+        server.stop()
+    # the rate limited key waits, so the request is retried with the other one
+    assert response == {'full_name': 'k2'} and app.keys == ['k1', 'k2']
+    assert proxycurl.key_pool.keys[0].backoff_until > proxycurl.key_pool.keys[1].backoff_until
+
+
+def test_key_out_of_credits():
+    app = Linkedin({'k1': 403})
+    server, proxycurl = _serve(app)
+    try:
+        response = proxycurl.linkedin.person.get(linkedin_profile_url='x')
+        # the next requests skip the key out of credits
+        following = proxycurl.linkedin.person.get(linkedin_profile_url='y')
+    finally:
+        server.stop()
+    assert response == following == {'full_name': 'k2'} and app.keys == ['k1', 'k2', 'k2']
+    assert proxycurl.key_pool.keys[0].balance == 0
@@ -0,0 +1,60 @@
+from typing import get_type_hints
+
+from proxycurl import models
+from proxycurl.interning import INTERNED_FIELDS, InternTable, intern_response
+from proxycurl.models import EmployeeList, PersonEndpointResponse
+
+
+def profile(company: str) -> dict:
+    # strings built at runtime are distinct objects even when equal
+    return {
+        'country': ''.join(['U', 'S']),
+        'headline': ''.join(['Engineer at ', company]),
+        'skills': [''.join(['pyt', 'hon'])],
+        'languages': [''.join(['Eng', 'lish'])],
+        'experiences': [{'company': company[:], 'starts_at': {'year': int('2020')}}],
+    }
+
+
+def test_interned_fields_exist():
+    for model, fields in INTERNED_FIELDS.items():
+        hints = get_type_hints(getattr(models, model))
+        assert all(field in hints for field in fields), model
+
+
+def test_intern_response():
+    table = InternTable()
+    first = intern_response(PersonEndpointResponse, profile(''.join(['Nu', 'bela'])), table)
+    second = intern_response(PersonEndpointResponse, profile(''.join(['Nu', 'bela'])), table)
+    assert first['country'] is second['country']
+    assert first['languages'][0] is second['languages'][0]
+    assert first['experiences'][0]['company'] is second['experiences'][0]['company']
+    # fields which are not interned are left as they are
+    assert first['headline'] == second['headline'] and first['headline'] is not second['headline']
+    assert first['skills'][0] == second['skills'][0] and first['skills'][0] is not second['skills'][0]
+
+    # objects nested in other results
+    page = intern_response(EmployeeList, {'employees': [{'profile': profile('Nubela')}]}, table)
+    assert page['employees'][0]['profile']['country'] is first['country']
+
+
+def test_intern_table_max_size():
+    table = InternTable(max_size=1)
+    assert table.intern('a') == 'a'
+    value = ''.join(['b', 'c'])
+    assert table.intern(value) is value
+    assert len(table) == 1
+    table.clear()
+    assert len(table) == 0
+
+
+def test_client_intern_table():
+    from proxycurl.asyncio import Proxycurl
+    from proxycurl.interning import INTERNED
+
+    first, second = Proxycurl(api_key='', intern=True), Proxycurl(api_key='', intern=True)
+    # every client has its own table, released with it, unless one is shared explicitly
+    assert first.intern_table is not second.intern_table
+    assert first.intern_table is not INTERNED
+    assert Proxycurl(api_key='', intern=INTERNED).intern_table is INTERNED
+    assert Proxycurl(api_key='').intern_table is None
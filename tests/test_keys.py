@@ -0,0 +1,38 @@
+from proxycurl.keys import KeyPool
+
+
+def test_key_pool_least_loaded():
+    pool = KeyPool('k1,k2')
+    first, wait = pool.acquire()
+    assert wait == 0
+    second, wait = pool.acquire()
+    assert wait == 0
+    assert {first.key, second.key} == {'k1', 'k2'}
+    pool.release(first)
+    assert pool.acquire()[0] is first
+
+
+def test_key_pool_rate_limit():
+    pool = KeyPool(['k1'], rate_limit=60)
+    key = pool.keys[0]
+    assert pool.acquire(now=key.updated_at)[1] == 0
+    pool.release(key)
+    # a single token refills in a second at 60 requests per minute
+    assert pool.acquire(now=key.updated_at)[1] == 1
+    assert pool.acquire(now=key.updated_at + 1)[1] == 0
+
+
+def test_key_pool_balance():
+    pool = KeyPool(['k1', 'k2'])
+    pool.set_balance(pool.keys[0], 10)
+    pool.set_balance(pool.keys[1], 20)
+    assert pool.acquire()[0].key == 'k2'
+    pool.set_balance(pool.keys[1], 0)
+    assert pool.acquire()[0].key == 'k1'
+    assert pool.balance == 10
+
+
+def test_key_pool_backoff():
+    pool = KeyPool(['k1', 'k2'])
+    pool.backoff(pool.keys[0], 30)
+    assert pool.acquire()[0].key == 'k2'
@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from proxycurl import lazy
+from proxycurl.lazy import LazyResponse
+
+PROFILE = {
+    'full_name': 'John Smith',
+    'experiences': [{'company': 'Acme', 'title': 'CEO'}],
+    'activities': [{'title': 'Hello'}] * 100,
+    'extra': None,
+}
+
+
+@pytest.mark.parametrize('split', [True, False])
+def test_lazy_response(monkeypatch, split):
+    if not split:
+        monkeypatch.setattr(lazy, 'msgspec', None)
+    elif lazy.msgspec is None:
+        pytest.skip('msgspec is not installed')
+
+    response = LazyResponse(json.dumps(PROFILE).encode())
+    assert response['full_name'] == 'John Smith'
+    assert response['experiences'][0]['company'] == 'Acme'
+    assert response.get('extra') is None
+    assert response.get('missing') is None
+    assert 'activities' in response
+    assert len(response) == len(PROFILE)
+    assert response == PROFILE
+    assert response.to_dict() == PROFILE
+    with pytest.raises(KeyError):
+        response['missing']
@@ -0,0 +1,150 @@
+import asyncio
+
+from aiohttp import web
+
+from proxycurl.asyncio import Proxycurl
+from proxycurl.metrics import AttemptEvent, Histogram, HistogramCollector, MetricsHook, MetricsHooks, endpoint_path
+
+
+def test_histogram():
+    histogram = Histogram()
+    for i in range(1, 1001):
+        histogram.record(i / 1000)
+    assert histogram.count == 1000 and histogram.min == 0.001 and histogram.max == 1.0
+    for percentile in (50, 90, 99):
+        # within the precision of the buckets
+        assert abs(histogram.percentile(percentile) - percentile / 100) <= percentile / 100 * 2 ** -6
+    assert histogram.percentile(100) == 1.0
+    assert sum(count for _, count in histogram.buckets()) == 1000
+    bounds = [bound for bound, _ in histogram.buckets()]
+    assert bounds == sorted(bounds)
+
+    other = Histogram()
+    other.record(5.0)
+    histogram.merge(other)
+    assert histogram.count == 1001 and histogram.max == 5.0
+    assert Histogram().summary()['p50'] is None
+
+
+def test_histogram_collector():
+    collector = HistogramCollector()
+    event = AttemptEvent('get', '/proxycurl/api/v2/linkedin?url=x', 2)
+    event.key_acquired()
+    event.headers_received(200, ttfb=0.25)
+    event.body_received(100)
+    collector.on_attempt(event.finish())
+    failed = AttemptEvent('get', '/proxycurl/api/v2/linkedin', 1)
+    collector.on_attempt(failed.finish(TimeoutError()))
+
+    metrics = collector.endpoints['/proxycurl/api/v2/linkedin']
+    assert (metrics.attempts, metrics.retries, metrics.bytes) == (2, 1, 100)
+    assert metrics.statuses == {200: 1} and metrics.errors == {'TimeoutError': 1}
+    assert metrics.histograms['ttfb'].max == 0.25
+    assert metrics.histograms['decode'].count == 1
+    assert 'connect' not in collector.summary()['/proxycurl/api/v2/linkedin']
+
+
+class Events(MetricsHook):
+    def __init__(self):
+        self.events = []
+
+    def on_attempt(self, event):
+        self.events.append(event)
+
+
+async def _serve(responses, path='/proxycurl/api/v2/linkedin'):
+    async def handler(request):
+        return responses.pop(0)
+
+    app = web.Application()
+    app.router.add_get(path, handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    return runner, f'http://127.0.0.1:{runner.addresses[0][1]}'
+
+
+def test_request_metrics():
+    async def run():
+        runner, base_url = await _serve([
+            web.json_response({'description': 'Too many requests'}, status=429),
+            web.json_response({'full_name': 'John Doe'}),
+        ])
+        events = Events()
+        collector = HistogramCollector()
+        proxycurl = Proxycurl(
+            api_key='key', base_url=base_url, max_backoff_seconds=0, metrics=MetricsHooks(events, collector)
+        )
+        try:
+            response = await proxycurl.linkedin.person.get(linkedin_profile_url='x')
+        finally:
+            await runner.cleanup()
+        return response, events.events, collector
+
+    response, events, collector = asyncio.run(run())
+    assert response['full_name'] == 'John Doe'
+    limited, served = events
+    assert (limited.attempt, limited.status, limited.error, limited.decode) == (1, 429, 'RateLimited', None)
+    assert (served.attempt, served.status, served.error) == (2, 200, None)
+    assert served.retry and served.bytes == len(b'{"full_name": "John Doe"}')
+    for phase in ('wait', 'connect', 'ttfb', 'body', 'decode'):
+        assert getattr(served, phase) >= 0
+    assert collector.endpoints['/proxycurl/api/v2/linkedin'].attempts == 2
+
+
+def test_stream_page_metrics():
+    async def run():
+        page = {'employees': [{'profile_url': str(i)} for i in range(3)], 'next_page': None}
+        runner, base_url = await _serve([
+            web.json_response({'description': 'Too many requests'}, status=429),
+            web.json_response(page),
+        ], '/proxycurl/api/linkedin/company/employees')
+        events = Events()
+        proxycurl = Proxycurl(api_key='key', base_url=base_url, max_backoff_seconds=0, metrics=events)
+        try:
+            employees = [
+                employee async for employee in proxycurl.linkedin.company.employee_list_iter(
+                    url='x', stream=True, max_results=2
+                )
+            ]
+        finally:
+            await runner.cleanup()
+        return employees, events.events, proxycurl.key_pool.keys
+
+    employees, events, keys = asyncio.run(run())
+    assert len(employees) == 2
+    # the key of every streamed page is released
+    assert [key.in_flight for key in keys] == [0]
+    streamed, retried = events
+    assert (streamed.status, streamed.error) == (429, 'RateLimited')
+    assert (retried.status, retried.error) == (200, None)
+
+
+def test_next_page_endpoint():
+    assert endpoint_path('https://nubela.co/proxycurl/api/v2/search/person?page=2', 'https://nubela.co') == \
+        '/proxycurl/api/v2/search/person?page=2'
+    assert endpoint_path('https://example.com/proxycurl/api/v2/search/person', 'https://nubela.co') == \
+        '/proxycurl/api/v2/search/person'
+
+    async def run():
+        pages = []
+        runner, base_url = await _serve(pages, '/proxycurl/api/linkedin/company/employees')
+        next_page = f'{base_url}/proxycurl/api/linkedin/company/employees?after=1'
+        pages.extend([
+            web.json_response({'employees': [{'profile_url': '1'}], 'next_page': next_page}),
+            web.json_response({'employees': [{'profile_url': '2'}], 'next_page': None}),
+        ])
+        collector = HistogramCollector()
+        proxycurl = Proxycurl(api_key='key', base_url=base_url, metrics=collector)
+        try:
+            employees = [employee async for employee in proxycurl.linkedin.company.employee_list_iter(url='x')]
+        finally:
+            await runner.cleanup()
+        return employees, collector
+
+    employees, collector = asyncio.run(run())
+    assert len(employees) == 2
+    # the next page counts for the same endpoint as the first one
+    assert list(collector.endpoints) == ['/proxycurl/api/linkedin/company/employees']
+    assert collector.endpoints['/proxycurl/api/linkedin/company/employees'].attempts == 2
@@ -0,0 +1,118 @@
+import asyncio
+
+from proxycurl.asyncio import Proxycurl
+from proxycurl.costs import ENDPOINT_COSTS, NAMED_OPERATIONS
+from proxycurl.pagination import CursorStore, FileCursorStore, page_url
+
+
+def fake_pages(proxycurl, calls):
+    async def request(method, url, result_class, params=dict(), data=dict(), **kwargs):
+        calls.append(url)
+        after = int(url.rsplit('=', 1)[1]) if 'after=' in url else 0
+        next_page = f'https://example.com/employees?after={after + 10}' if after < 20 else None
+        return {
+            'employees': [{'profile_url': str(i)} for i in range(after, after + 10)],
+            'next_page': next_page,
+        }
+
+    proxycurl.request = request
+
+
+async def collect(iterator):
+    return [item['profile_url'] async for item in iterator]
+
+
+def test_employee_list_iter_resumes_from_cursor():
+    proxycurl = Proxycurl(api_key='')
+    calls = []
+    fake_pages(proxycurl, calls)
+    cursor = CursorStore()
+
+    items = asyncio.run(collect(proxycurl.linkedin.company.employee_list_iter(
+        url='https://www.linkedin.com/company/apple/', max_results=15, cursor=cursor
+    )))
+    assert items == [str(i) for i in range(15)]
+    # the second page was not fully consumed, so the crawl resumes with it
+    assert cursor.load() == 'https://example.com/employees?after=10'
+
+    items = asyncio.run(collect(proxycurl.linkedin.company.employee_list_iter(cursor=cursor)))
+    assert items == [str(i) for i in range(10, 30)]
+    assert cursor.load() is None
+
+
+def test_file_cursor_store(tmp_path):
+    cursor = FileCursorStore(str(tmp_path / 'cursor.json'))
+    assert cursor.load() is None
+    cursor.save('https://example.com/employees?after=10')
+    assert FileCursorStore(cursor.path).load() == 'https://example.com/employees?after=10'
+    cursor.clear()
+    assert cursor.load() is None
+    cursor.clear()
+
+
+def test_page_url():
+    assert page_url('https://example.com/job?search_id=1&page=2', 5) == 'https://example.com/job?search_id=1&page=5'
+    assert page_url('https://example.com/job?search_id=1', 2) == 'https://example.com/job?search_id=1&page=2'
+
+
+def test_find_job_iter_in_page_order():
+    proxycurl = Proxycurl(api_key='')
+    calls = []
+
+    async def request(method, url, result_class, params=dict(), data=dict(), **kwargs):
+        page = int(url.rsplit('page=', 1)[1]) if 'page=' in url else 1
+        calls.append(page)
+        # later pages answer first
+        await asyncio.sleep(0.01 * (5 - page))
+        return {
+            # the first job of every page is listed again
+            'job': [{'job_url': f'{page}-{i}' if i else 'pinned'} for i in range(3)],
+            'next_page_no': page + 1 if page < 3 else None,
+            'next_page_api_url': f'https://example.com/job?search_id=1&page={page + 1}' if page < 3 else None,
+        }
+
+    proxycurl.request = request
+    items = asyncio.run(collect_jobs(proxycurl.linkedin.company.find_job_iter(search_id='1', concurrency=3)))
+    assert items == ['pinned', '1-1', '1-2', '2-1', '2-2', '3-1', '3-2']
+    # the pages following the first page were requested together
+    assert calls[:4] == [1, 2, 3, 4]
+
+
+async def collect_jobs(iterator):
+    return [item['job_url'] async for item in iterator]
+
+
+def test_find_job_iter_requests_pages_needed_for_max_results():
+    proxycurl = Proxycurl(api_key='')
+    calls = []
+
+    async def request(method, url, result_class, params=dict(), data=dict(), **kwargs):
+        page = int(url.rsplit('page=', 1)[1]) if 'page=' in url else 1
+        calls.append(page)
+        return {
+            'job': [{'job_url': f'{page}-{i}'} for i in range(3)],
+            'next_page_no': page + 1,
+            'next_page_api_url': f'https://example.com/job?search_id=1&page={page + 1}',
+        }
+
+    proxycurl.request = request
+    items = asyncio.run(collect_jobs(proxycurl.linkedin.company.find_job_iter(
+        search_id='1', concurrency=4, max_results=3
+    )))
+    # the first page holds every result, so no other page is charged
+    assert items == ['1-0', '1-1', '1-2'] and calls == [1]
+
+    calls.clear()
+    items = asyncio.run(collect_jobs(proxycurl.linkedin.company.find_job_iter(
+        search_id='1', concurrency=4, max_results=5
+    )))
+    assert items == ['1-0', '1-1', '1-2', '2-0', '2-1'] and calls == [1, 2]
+
+
+def test_iter_for_every_paginated_endpoint():
+    proxycurl = Proxycurl(api_key='')
+    for name, endpoint in NAMED_OPERATIONS.items():
+        if not ENDPOINT_COSTS[endpoint].paginated:
+            continue
+        namespace, package, action = name.split('.')
+        assert hasattr(getattr(getattr(proxycurl, namespace), package), f'{action}_iter'), name
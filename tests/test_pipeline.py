@@ -0,0 +1,35 @@
+import asyncio
+
+from proxycurl.asyncio import do_pipeline
+
+
+def test_do_pipeline_backpressure():
+    produced = []
+
+    async def source():
+        for i in range(100):
+            produced.append(i)
+            yield {'profile_url': str(i)}
+
+    async def op(linkedin_profile_url):
+        await asyncio.sleep(0.001)
+        if linkedin_profile_url == '3':
+            raise ValueError(linkedin_profile_url)
+        return {'full_name': linkedin_profile_url}
+
+    async def run():
+        results = []
+        async for item, result in do_pipeline(
+            source(), op, lambda item: {'linkedin_profile_url': item['profile_url']},
+            max_workers=2, queue_size=3
+        ):
+            if not results:
+                # items held by the workers, by both queues and the one waiting to be queued
+                assert len(produced) <= 2 + 3 + 2 + 1
+            results.append((item, result))
+        return results
+
+    results = asyncio.run(run())
+    assert len(results) == 100
+    failed = [item['profile_url'] for item, result in results if not result.success]
+    assert failed == ['3']
@@ -0,0 +1,23 @@
+from proxycurl.planner import plan
+
+
+def test_plan():
+    result = plan(
+        [('linkedin.person.get', {'linkedin_profile_url': str(i), 'skills': 'include'}) for i in range(600)]
+        + [('linkedin.company.employee_list', {'url': 'https://www.linkedin.com/company/apple', 'page_size': '100'})],
+        concurrency=10,
+        rate_limit=300,
+        results_per_op=1000
+    )
+    assert result.endpoints['/proxycurl/api/v2/linkedin'].credits == 1200
+    assert result.endpoints['/proxycurl/api/linkedin/company/employees'].requests == 10
+    assert result.endpoints['/proxycurl/api/linkedin/company/employees'].credits == 3000
+    assert result.requests == 610
+    # bound by the rate limit of 300 requests per minute
+    assert result.seconds == 122
+
+
+def test_plan_unknown_operation():
+    result = plan([('linkedin.unknown', {})])
+    assert result.unknown_operations == 1
+    assert result.requests == 0
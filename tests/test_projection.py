@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from proxycurl.pagination import page_fields
+from proxycurl.projection import Projection, get_projection
+
+PROFILE = {
+    'full_name': 'John Doe',
+    'city': None,
+    'experiences': [
+        {'company': 'Nubela', 'title': 'Engineer', 'starts_at': {'day': 1, 'month': 2, 'year': 2020}},
+        {'company': 'Acme', 'title': None, 'starts_at': None},
+    ],
+    'extra': {'github_profile_id': 'john', 'twitter_profile_id': None},
+    'skills': ['python', 'go'],
+}
+
+
+def test_projection():
+    projection = Projection(['full_name', 'city', 'experiences.*.company', 'experiences.*.starts_at.year', 'skills'])
+    expected = {
+        'full_name': 'John Doe',
+        'city': None,
+        'experiences': [{'company': 'Nubela', 'starts_at': {'year': 2020}}, {'company': 'Acme', 'starts_at': None}],
+        'skills': ['python', 'go'],
+    }
+    assert projection.apply(PROFILE) == expected
+    assert projection.decode(json.dumps(PROFILE).encode()) == expected
+    # a list of objects is projected without `*` as well
+    assert Projection(['experiences.title', 'extra.github_profile_id', 'missing']).decode(
+        json.dumps(PROFILE).encode()
+    ) == {'experiences': [{'title': 'Engineer'}, {'title': None}], 'extra': {'github_profile_id': 'john'}}
+    assert Projection(['extra', 'extra.github_profile_id']).tree == {'extra': None}
+
+    with pytest.raises(ValueError):
+        Projection(['experiences.*.company', 'experiences.company'])
+    with pytest.raises(ValueError):
+        Projection(['experiences..company'])
+
+
+def test_projection_keeps_charged_results():
+    projection = get_projection(['next_page'], '/proxycurl/api/linkedin/company/employees')
+    body = b'{"employees": [{"profile_url": "a"}, {"profile_url": "b"}], "next_page": null}'
+    assert projection.decode(body) == {'employees': [{}, {}], 'next_page': None}
+    assert get_projection(['next_page'], '/proxycurl/api/linkedin/company/employees') is projection
+
+
+def test_page_fields():
+    assert page_fields(None, 'employees', ['next_page']) is None
+    assert page_fields(['profile_url'], 'job', ['next_page_no'], ['job_url']) == [
+        'job.*.profile_url', 'job.*.job_url', 'next_page_no'
+    ]
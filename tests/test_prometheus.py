@@ -0,0 +1,62 @@
+import urllib.request
+
+from proxycurl.metrics import AttemptEvent, HistogramCollector
+from proxycurl.prometheus import CONTENT_TYPE, MetricsServer, render, write_textfile
+
+
+def _collector():
+    collector = HistogramCollector()
+    for attempt, status, ttfb in ((1, 429, 0.02), (2, 200, 0.3)):
+        event = AttemptEvent('GET', '/proxycurl/api/v2/linkedin', attempt)
+        collector.on_attempt_start(event)
+        event.key_acquired()
+        event.headers_received(status, ttfb=ttfb)
+        event.body_received(1000)
+        collector.on_attempt(event.finish(RuntimeError() if status == 429 else None))
+    collector.on_attempt_start(AttemptEvent('GET', '/proxycurl/api/v2/linkedin', 1))
+    collector.on_credits('/proxycurl/api/v2/linkedin', 3)
+    collector.on_queue(7)
+    collector.on_cache(True)
+    collector.on_cache(False)
+    return collector
+
+
+def _samples(text):
+    return dict(line.rsplit(' ', 1) for line in text.splitlines() if not line.startswith('#'))
+
+
+def test_render():
+    text = render(_collector())
+    samples = _samples(text)
+    labels = '{endpoint="/proxycurl/api/v2/linkedin"}'
+    assert samples['proxycurl_requests_total{endpoint="/proxycurl/api/v2/linkedin",status="429"}'] == '1'
+    assert samples['proxycurl_request_errors_total{endpoint="/proxycurl/api/v2/linkedin",error="RuntimeError"}'] == '1'
+    assert samples[f'proxycurl_retries_total{labels}'] == '1'
+    assert samples[f'proxycurl_rate_limited_total{labels}'] == '1'
+    assert samples[f'proxycurl_requests_in_flight{labels}'] == '1'
+    assert samples[f'proxycurl_response_bytes_total{labels}'] == '2000'
+    assert samples[f'proxycurl_credits_spent_total{labels}'] == '3'
+    assert samples['proxycurl_bulk_queue_depth'] == '7'
+    assert samples['proxycurl_cache_hit_ratio'] == '0.5'
+    assert '# TYPE proxycurl_request_duration_seconds histogram' in text
+
+    ttfb = '{endpoint="/proxycurl/api/v2/linkedin",phase="ttfb",le="%s"}'
+    assert samples['proxycurl_request_duration_seconds_bucket' + ttfb % '0.01'] == '0'
+    assert samples['proxycurl_request_duration_seconds_bucket' + ttfb % '0.025'] == '1'
+    assert samples['proxycurl_request_duration_seconds_bucket' + ttfb % '0.25'] == '1'
+    assert samples['proxycurl_request_duration_seconds_bucket' + ttfb % '0.5'] == '2'
+    assert samples['proxycurl_request_duration_seconds_bucket' + ttfb % '+Inf'] == '2'
+    assert samples['proxycurl_request_duration_seconds_count{endpoint="/proxycurl/api/v2/linkedin",phase="ttfb"}'] == '2'
+
+
+def test_export(tmp_path):
+    collector = _collector()
+    path = tmp_path / 'proxycurl.prom'
+    write_textfile(collector, str(path))
+    assert path.read_text() == render(collector)
+    assert [item.name for item in tmp_path.iterdir()] == ['proxycurl.prom']
+
+    with MetricsServer(collector, port=0) as server:
+        with urllib.request.urlopen(f'http://127.0.0.1:{server.port}/metrics') as response:
+            assert response.headers['Content-Type'] == CONTENT_TYPE
+            assert response.read().decode() == render(collector)
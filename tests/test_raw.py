@@ -0,0 +1,16 @@
+import io
+
+from proxycurl.asyncio import Proxycurl
+from proxycurl.raw import RawResponse
+
+
+def test_raw_response():
+    response = RawResponse(b'{"full_name": "John"}', 200, 'https://nubela.co/proxycurl/api/v2/linkedin', {})
+    assert response.json() == {'full_name': 'John'}
+    file = io.BytesIO()
+    assert response.write_to(file) == len(response.body)
+    assert file.getvalue() == response.body
+
+    proxycurl = Proxycurl(api_key='', raw=True)
+    assert proxycurl.decoded(response) == {'full_name': 'John'}
+    assert proxycurl.decoded({'full_name': 'John'}) == {'full_name': 'John'}
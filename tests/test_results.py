@@ -0,0 +1,107 @@
+import asyncio
+import os
+
+import pytest
+
+from proxycurl.asyncio import Proxycurl, do_bulk
+from proxycurl.asyncio.base import ProxycurlException, Result
+from proxycurl.results import MAX_ERROR_MESSAGE, ResultError, ResultStore, SpillingResultStore
+
+
+def test_spilling_result_store(tmp_path):
+    path = str(tmp_path / 'results.sqlite')
+    store = SpillingResultStore(max_memory=200, path=path, batch_size=2)
+    store.allocate(6, Result)
+    for i in range(6):
+        store[i] = Result(True, {'full_name': 'x' * 20, 'position': i}, None)
+    assert 0 < store.spilled < 6
+    assert store.memory <= 200
+    assert [result.value['position'] for result in store] == list(range(6))
+    assert store[-1].value['position'] == 5
+    assert [result.value['position'] for result in store[1:3]] == [1, 2]
+
+    # a spilled result set again stays spilled
+    store[5] = Result(False, None, ValueError('failed'))
+    assert isinstance(store[5].error, ValueError)
+    store.close()
+    assert os.path.exists(path)
+
+
+def test_spilling_result_store_overwrite():
+    with SpillingResultStore(max_memory=1000) as store:
+        store.allocate(2, Result)
+        store[0] = Result(True, {'full_name': 'x' * 100}, None)
+        memory = store.memory
+        # a result set again in memory replaces the size of the previous one
+        for _ in range(20):
+            store[0] = Result(True, {'full_name': 'x' * 100}, None)
+        assert store.memory == memory and store.spilled == 0
+        store[0] = Result(True, {'full_name': 'x'}, None)
+        assert store.memory < memory
+
+
+def test_spilling_result_store_closed():
+    with SpillingResultStore(max_memory=100) as store:
+        store.allocate(3, Result)
+        for i in range(3):
+            store[i] = Result(True, {'full_name': 'x' * 50}, None)
+        assert 0 < store.spilled < 3
+    # results kept in memory are still read, the spilled ones were removed with the database
+    assert store[0].success
+    with pytest.raises(ValueError, match='store is closed'):
+        store[2]
+    with pytest.raises(ValueError, match='store is closed'):
+        list(store)
+
+
+def test_spilling_result_store_temporary():
+    with SpillingResultStore(max_memory=0) as store:
+        store.allocate(2, Result)
+        store[0] = Result(True, {}, None)
+        path = store.path
+        assert os.path.exists(path)
+    assert not os.path.exists(path)
+
+
+def test_do_bulk_store():
+    proxycurl = Proxycurl(api_key='')
+
+    async def request(method, url, result_class, params=dict(), data=dict(), **kwargs):
+        return {'full_name': params['linkedin_profile_url']}
+
+    proxycurl.request = request
+    ops = [(proxycurl.linkedin.person.get, {'linkedin_profile_url': str(i)}) for i in range(10)]
+    with SpillingResultStore(max_memory=100) as store:
+        results = asyncio.run(do_bulk(ops, max_workers=3, store=store))
+        assert results is store and store.spilled > 0
+        assert [result.value['full_name'] for result in results] == [str(i) for i in range(10)]
+
+    results = asyncio.run(do_bulk(ops, store=ResultStore()))
+    assert len(results) == 10 and all(result.success for result in results)
+
+
+def test_do_bulk_errors():
+    proxycurl = Proxycurl(api_key='')
+
+    async def request(method, url, result_class, params=dict(), data=dict(), **kwargs):
+        raise ProxycurlException('{"description": "Person not found"}' * 20, status_code=404, endpoint=url)
+
+    proxycurl.request = request
+    ops = [(proxycurl.linkedin.person.get, {'linkedin_profile_url': str(i)}) for i in range(3)]
+    results = asyncio.run(do_bulk(ops))
+    error = results[0].error
+    assert isinstance(error, ResultError)
+    assert (error.type, error.status_code, error.endpoint) == (ProxycurlException, 404, '/proxycurl/api/v2/linkedin')
+    assert len(error.message) == MAX_ERROR_MESSAGE
+    # the message is shared by the records
+    assert results[1].error.message is error.message
+    assert not hasattr(results[0], '__dict__')
+
+    # records survive being spilled
+    with SpillingResultStore(max_memory=0) as store:
+        asyncio.run(do_bulk(ops, store=store))
+        assert store[2].error.status_code == 404
+
+    results = asyncio.run(do_bulk(ops, keep_exceptions=True))
+    assert isinstance(results[0].error, ProxycurlException)
+    assert results[0].error.status_code == 404
@@ -0,0 +1,41 @@
+import json
+
+import pytest
+
+from proxycurl.streaming import PageStream
+
+EMPLOYEES = [
+    {'profile_url': 'https://www.linkedin.com/in/a', 'profile': {'full_name': 'A "quoted" ]} name\\', 'skills': []}},
+    {'profile_url': 'https://www.linkedin.com/in/b', 'profile': None},
+]
+PAGE = {'employees': EMPLOYEES, 'next_page': 'https://nubela.co/proxycurl/api/linkedin/company/employees?after=2'}
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 64, 1 << 16])
+def test_page_stream(chunk_size):
+    body = json.dumps({'meta': {'employees': [1]}, **PAGE}).encode()
+    stream = PageStream('employees')
+    items = []
+    for i in range(0, len(body), chunk_size):
+        items += stream.feed(body[i:i + chunk_size])
+    assert items == EMPLOYEES
+    assert stream.items == 2
+    assert stream.close() == {'meta': {'employees': [1]}, 'employees': [], 'next_page': PAGE['next_page']}
+
+
+def test_page_stream_without_items():
+    stream = PageStream('employees')
+    assert stream.feed(b'{"employees": null, "next_page": null}') == []
+    assert stream.close() == {'employees': None, 'next_page': None}
+
+    stream = PageStream('employees')
+    stream.feed(json.dumps(PAGE).encode()[:-20])
+    with pytest.raises(ValueError):
+        stream.close()
+
+
+def test_page_stream_set_page():
+    stream = PageStream('employees')
+    assert stream.set_page(PAGE) == EMPLOYEES
+    assert stream.page == {'employees': [], 'next_page': PAGE['next_page']}
+    assert stream.items == 2
@@ -0,0 +1,43 @@
+import asyncio
+import json
+
+import pytest
+
+structs = pytest.importorskip('proxycurl.structs')
+
+
+def test_decode_struct():
+    profile = {
+        'full_name': 'John Smith',
+        'follower_count': 10,
+        'experiences': [{'company': 'Acme', 'starts_at': {'day': 1, 'month': 2, 'year': 2020}}],
+        'skills': ['python'],
+    }
+    struct = structs.decoder('PersonEndpointResponse').decode(json.dumps(profile).encode())
+    assert struct.full_name == 'John Smith'
+    assert struct.experiences[0].starts_at.year == 2020
+    # fields missing from the response are None
+    assert struct.headline is None
+    builtins = structs.to_builtins(struct)
+    assert builtins['experiences'][0]['company'] == 'Acme'
+    assert builtins['skills'] == ['python']
+
+
+def test_struct_fallback(caplog):
+    from aiohttp import web
+
+    from proxycurl.asyncio import Proxycurl
+    from tests.test_metrics import _serve
+
+    async def run():
+        # `follower_count` is not an integer
+        runner, base_url = await _serve([web.json_response({'full_name': 'John Smith', 'follower_count': 'many'})])
+        proxycurl = Proxycurl(api_key='key', base_url=base_url, structs=True)
+        try:
+            return await proxycurl.linkedin.person.get(linkedin_profile_url='x')
+        finally:
+            await runner.cleanup()
+
+    profile = asyncio.run(run())
+    assert profile == {'full_name': 'John Smith', 'follower_count': 'many'}
+    assert 'returning a dictionary' in caplog.text
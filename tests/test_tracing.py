@@ -0,0 +1,86 @@
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+
+from proxycurl.asyncio import Proxycurl, do_bulk
+from proxycurl.metrics import AttemptEvent
+from proxycurl.tracing import InMemoryExporter, JsonLinesExporter, Tracer, TracingHook, current_span
+
+from tests.test_metrics import _serve
+
+
+def test_tracer(tmp_path):
+    path = tmp_path / 'spans.jsonl'
+    tracer = Tracer(JsonLinesExporter(str(path)))
+    with pytest.raises(ValueError):
+        with tracer.span('job', source='crm') as job:
+            assert current_span() is job
+            with tracer.span('step') as step:
+                assert step.parent_id == job.span_id and step.trace_id == job.trace_id
+            raise ValueError()
+    assert current_span() is None
+    tracer.close()
+
+    step, job = [json.loads(line) for line in path.read_text().splitlines()]
+    assert job['name'] == 'job' and 'parentSpanId' not in job
+    assert job['attributes'] == {'source': 'crm'}
+    assert job['status'] == {'code': 'ERROR', 'message': 'ValueError'}
+    assert step['parentSpanId'] == job['spanId'] and step['status'] == {'code': 'OK'}
+    assert job['startTimeUnixNano'] <= step['startTimeUnixNano'] <= step['endTimeUnixNano'] <= job['endTimeUnixNano']
+
+
+def test_tracing_hook():
+    exporter = InMemoryExporter()
+    hook = TracingHook(Tracer(exporter))
+    event = AttemptEvent('GET', '/proxycurl/api/v2/linkedin', 2)
+    event.key_acquired()
+    event.headers_received(200, ttfb=0.01)
+    event.body_received(100)
+    with hook.span('operation') as operation:
+        hook.on_attempt(event.finish())
+
+    wait, decode, attempt, _ = exporter.spans
+    assert (wait.name, decode.name, attempt.name) == ('proxycurl.wait', 'proxycurl.decode', 'proxycurl.attempt')
+    assert attempt.parent_id == operation.span_id
+    assert wait.parent_id == decode.parent_id == attempt.span_id
+    assert attempt.start == event.started and attempt.end == event.ended
+    assert attempt.attributes['http.status_code'] == 200 and attempt.attributes['proxycurl.attempt'] == 2
+
+
+def test_bulk_spans():
+    async def run():
+        runner, base_url = await _serve([
+            web.json_response({'description': 'Too many requests'}, status=429),
+            web.json_response({'full_name': 'John Doe'}),
+            web.json_response({'description': 'Person not found'}, status=404),
+        ])
+        exporter = InMemoryExporter()
+        proxycurl = Proxycurl(
+            api_key='key', base_url=base_url, max_backoff_seconds=0, metrics=TracingHook(Tracer(exporter))
+        )
+        try:
+            await do_bulk([
+                (proxycurl.linkedin.person.get, {'linkedin_profile_url': 'x'}),
+                (proxycurl.linkedin.person.get, {'linkedin_profile_url': 'y'}),
+            ], max_workers=1)
+        finally:
+            await runner.cleanup()
+        return exporter.spans
+
+    spans = asyncio.run(run())
+    by_name = {}
+    for span in spans:
+        by_name.setdefault(span.name, []).append(span)
+    bulk, = by_name['proxycurl.bulk']
+    first, second = by_name['proxycurl.operation']
+    assert bulk.attributes == {'operations': 2, 'max_workers': 1}
+    assert first.parent_id == second.parent_id == bulk.span_id
+    assert (first.attributes['index'], first.error, second.error) == (0, None, 'NotFound')
+
+    limited, served, not_found = by_name['proxycurl.attempt']
+    assert limited.parent_id == served.parent_id == first.span_id and not_found.parent_id == second.span_id
+    assert (limited.error, served.error, not_found.error) == ('RateLimited', None, 'NotFound')
+    assert len(by_name['proxycurl.wait']) == 3 and len(by_name['proxycurl.decode']) == 1
+    assert {span.trace_id for span in spans} == {bulk.trace_id}
@@ -0,0 +1,80 @@
+import json
+
+from treq.testing import StubTreq
+from twisted.web.resource import Resource
+from twisted.web.server import NOT_DONE_YET
+
+import proxycurl.twisted.base
+from proxycurl.twisted import Proxycurl
+
+
+class Linkedin(Resource):
+    """Answers with the status set for the API key of a request, and 200 otherwise"""
+    isLeaf = True
+
+    def __init__(self, statuses=None, hold=False):
+        super().__init__()
+        self.statuses = statuses or {}
+        self.hold = hold
+        self.held = []
+        self.keys = []
+
+    def render_GET(self, request):
+        key = request.getHeader('authorization')[len('Bearer '):]
+        self.keys.append(key)
+        status = self.statuses.get(key, 200)
+        request.setResponseCode(status)
+        request.setHeader('content-type', 'application/json')
+        body = json.dumps({'full_name': key} if status == 200 else {'description': 'failed'}).encode()
+        if self.hold:
+            self.held.append((request, body))
+            return NOT_DONE_YET
+        return body
+
+
+def _client(monkeypatch, resource):
+    stub = StubTreq(resource)
+    monkeypatch.setattr(proxycurl.twisted.base, 'treq', stub)
+    return stub, Proxycurl(api_key='k1,k2', base_url='http://proxycurl.test', rate_limit=0)
+
+
+def _result(deferred):
+    results = []
+    deferred.addBoth(results.append)
+    result, = results
+    return result
+
+
+def test_key_rotation(monkeypatch):
+    resource = Linkedin(hold=True)
+    stub, proxycurl = _client(monkeypatch, resource)
+    first = proxycurl.linkedin.person.get(linkedin_profile_url='x')
+    second = proxycurl.linkedin.person.get(linkedin_profile_url='y')
+    # a request in flight on a key sends the next one to the other key
+    assert resource.keys == ['k1', 'k2']
+    for request, body in resource.held:
+        request.write(body)
+        request.finish()
+    stub.flush()
+    assert _result(first) == {'full_name': 'k1'} and _result(second) == {'full_name': 'k2'}
+    assert [key.in_flight for key in proxycurl.key_pool.keys] == [0, 0]
+
+
+def test_rate_limited_key_backoff(monkeypatch):
+    resource = Linkedin({'k1': 429})
+    _, proxycurl = _client(monkeypatch, resource)
+    assert _result(proxycurl.linkedin.person.get(linkedin_profile_url='x')) == {'full_name': 'k2'}
+    # the rate limited key waits, so the request is retried with the other one
+    assert resource.keys == ['k1', 'k2']
+    assert proxycurl.key_pool.keys[0].backoff_until > proxycurl.key_pool.keys[1].backoff_until
+
+
+def test_key_out_of_credits(monkeypatch):
+    resource = Linkedin({'k1': 403})
+    _, proxycurl = _client(monkeypatch, resource)
+    assert _result(proxycurl.linkedin.person.get(linkedin_profile_url='x')) == {'full_name': 'k2'}
+    assert resource.keys == ['k1', 'k2']
+    assert proxycurl.key_pool.keys[0].balance == 0
+    # the next requests skip the key out of credits
+    assert _result(proxycurl.linkedin.person.get(linkedin_profile_url='y')) == {'full_name': 'k2'}
+    assert resource.keys[-1] == 'k2'
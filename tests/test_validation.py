@@ -0,0 +1,26 @@
+import pytest
+
+from proxycurl.models import PersonEndpointResponse
+from proxycurl.validation import ResponseValidationError, validate_response
+
+
+def test_validate_response():
+    profile = {
+        'full_name': 'John Doe',
+        'follower_count': None,
+        'experiences': [{'company': 'Nubela', 'starts_at': {'day': 1, 'month': 2, 'year': 2020}}],
+        'unknown_field': 1,
+    }
+    assert validate_response(PersonEndpointResponse, profile) is profile
+
+    with pytest.raises(ResponseValidationError) as error:
+        validate_response(PersonEndpointResponse, {
+            'full_name': 1,
+            'follower_count': True,
+            'experiences': [{'company': 'Nubela'}, {'starts_at': {'day': '1'}}],
+        })
+    assert error.value.errors == [
+        'full_name: expected str, got int',
+        'follower_count: expected an integer, got bool',
+        'experiences[1].starts_at.day: expected an integer, got str',
+    ]